@@ -1,4 +1,22 @@
-from openai import OpenAI
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from openai import AsyncOpenAI, OpenAI
+
+from summedia.compaction import CompactionResult, TextCompactor
+from summedia.hedging import HedgingPolicy
+from summedia.output import (
+    COMPLIANT,
+    RETRIED,
+    TRIMMED,
+    TRUNCATED,
+    Completion,
+    OutputBudget,
+    OutputStats,
+)
+from summedia.scheduler import RequestScheduler
 
 
 class APIRequester:
@@ -12,14 +30,37 @@ class APIRequester:
 
     Attributes:
     - api_key (str): The API key used for authenticating requests to the openai API.
+    - hedging (HedgingPolicy, optional): Enables hedged requests to cut tail latency.
+                                         Disabled by default.
+    - scheduler (RequestScheduler, optional): Admits requests by priority, deadline and
+                                              tenant. Requests are sent right away
+                                              by default.
+    - compactor (TextCompactor, optional): Compacts the texts of Text, SocialMedia and
+                                           ElasticAPIRequester methods before they are
+                                           sent. Texts are sent as they are by default.
+    - last_compaction (CompactionResult): The result of the latest compaction, with the
+                                          tokens it saved. None until a text has been
+                                          compacted.
+    - output_stats (OutputStats): Length compliance of the outputs of each operation.
 
     Usage:
     To use this class, instantiate it with a valid API key and then call its methods
     to interact with the API.
     """
 
-    def __init__(self, api_key):
+    def __init__(
+        self,
+        api_key,
+        hedging: HedgingPolicy = None,
+        scheduler: RequestScheduler = None,
+        compactor: TextCompactor = None,
+    ):
         self.api_key = api_key
+        self.hedging = hedging
+        self.scheduler = scheduler
+        self.compactor = compactor
+        self.last_compaction: Optional[CompactionResult] = None
+        self.output_stats = OutputStats()
 
     def request_api(
         self,
@@ -34,6 +75,10 @@ class APIRequester:
 
         This method constructs a message payload with roles 'system' and 'user', then
         sends a request to OpenAI's chat completion API using the provided model.
+        When a hedging policy is set, a duplicate request is sent if the first one is
+        slower than usual, and the response that arrives first is returned. When a
+        scheduler is set, the request waits until the scheduler admits it, see
+        summedia.scheduler.scheduling for setting its priority and deadline.
 
         Parameters:
         - content_system (str): Content of the system message to be sent to the API.
@@ -41,24 +86,273 @@ class APIRequester:
         - model_type (str, optional): The model type to be used for the API request.
                                       Defaults to 'gpt-3.5-turbo'.
         - *args: Variable length argument list.
-        - **kwargs: Arbitrary keyword arguments.
+        - **kwargs: Completion parameters passed to the API, e.g. max_tokens,
+                    temperature and stop.
 
         Returns:
-        - str: The content of the response message from the API.
+        - str: The content of the response message from the API, a Completion whose
+               finish_reason tells whether it was cut off by max_tokens.
+        """
+        if self.scheduler:
+            return self.scheduler.run(
+                self._send, content_system, content_user, model_type, **kwargs
+            )
+        return self._send(content_system, content_user, model_type, **kwargs)
+
+    def _compact(self, text: str) -> str:
+        if not self.compactor:
+            return text
+        self.last_compaction = self.compactor.compact(text)
+        return self.last_compaction.text
+
+    def _bounded_request(
+        self, content_system: str, content_user: str, model_type: str, budget: OutputBudget
+    ) -> str:
+        """
+        Sends a request with the limits of an output budget and enforces its length.
+
+        An output longer than the budget, or cut off by max_tokens, is trimmed to its
+        last whole sentence or bullet; if too little would be left, it is requested
+        once more with the length restated and then trimmed. Without a length to
+        restate, a truncated output is returned as it is.
         """
+
+        def send(content_user):
+            if model_type:
+                return self.request_api(
+                    content_system, content_user, model_type, **budget.parameters()
+                )
+            return self.request_api(content_system, content_user, **budget.parameters())
+
+        response = send(content_user)
+        if budget.complies(response):
+            self.output_stats.record(budget.operation, COMPLIANT)
+            return response
+
+        trimmed = budget.trim(response)
+        if trimmed is not None:
+            self.output_stats.record(budget.operation, TRIMMED)
+            return trimmed
+
+        if budget.max_words is None:
+            self.output_stats.record(budget.operation, TRUNCATED)
+            return response
+
+        self.output_stats.record(budget.operation, RETRIED)
+        response = send(budget.retry_prompt(content_user))
+        return response if budget.complies(response) else budget.trim(response, force=True)
+
+    def _send(self, content_system: str, content_user: str, model_type: str, **parameters) -> str:
+        if self.hedging:
+            return self._hedged_request(content_system, content_user, model_type, **parameters)
+
         client = OpenAI(api_key=self.api_key)
+        return self._complete(client, content_system, content_user, model_type, **parameters)
 
+    def _complete(
+        self,
+        client: OpenAI,
+        content_system: str,
+        content_user: str,
+        model_type: str,
+        **parameters,
+    ) -> str:
         response = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"{content_system}",
-                },
-                {
-                    "role": "user",
-                    "content": f"{content_user}",
-                },
-            ],
+            messages=_messages(content_system, content_user),
             model=model_type,
+            **parameters,
         )
-        return response.choices[0].message.content
+        return _completion(response)
+
+    def _hedged_request(
+        self, content_system: str, content_user: str, model_type: str, **parameters
+    ) -> str:
+        delay = self.hedging.hedge_delay(model_type)
+        executor = ThreadPoolExecutor(max_workers=2)
+        attempts = {}
+
+        def start(model):
+            client = OpenAI(api_key=self.api_key)
+            future = executor.submit(
+                self._complete, client, content_system, content_user, model, **parameters
+            )
+            attempts[future] = (client, model, time.monotonic())
+
+        try:
+            start(model_type)
+            if delay is not None:
+                done, _ = wait(list(attempts), timeout=delay)
+                if not done and self.hedging.acquire_hedge():
+                    start(self.hedging.alternate_model or model_type)
+
+            pending = set(attempts)
+            first_error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    first_error = first_error or future.exception()
+            raise first_error
+        finally:
+            # Every attempt is recorded: finished ones with their latency, abandoned ones
+            # with the time they ran so far, a lower bound that keeps slow requests that
+            # lost to a hedge in the percentiles.
+            now = time.monotonic()
+            for future, (client, model, started) in attempts.items():
+                stats = self.hedging.model_stats(model)
+                if future.done() and future.exception() is not None:
+                    stats.record_error(now - started)
+                    continue
+                stats.record(now - started)
+                if not future.done():
+                    # Closing the client of an unfinished attempt aborts its connection.
+                    future.cancel()
+                    client.close()
+            executor.shutdown(wait=False)
+
+
+class AsyncAPIRequester:
+    """
+    An asyncio counterpart of APIRequester.
+
+    All requests of an instance go through one AsyncOpenAI client, so they share its
+    connection pool, and at most `max_concurrency` of them are in flight at a time.
+    Pass the same client and semaphore to several instances to share the pool and
+    the limit between them. Requests are ordinary coroutines and can be cancelled,
+    e.g. with asyncio.wait_for or by cancelling the task awaiting them.
+
+    Attributes:
+    - api_key (str): The API key used for authenticating requests to the openai API.
+    - max_concurrency (int): Maximum number of requests in flight. Defaults to 100.
+    - compactor (TextCompactor, optional): Compacts texts before they are sent.
+    - last_compaction (CompactionResult): The result of the latest compaction, None
+                                          until a text has been compacted.
+
+    Usage:
+    Use it as an async context manager, or await `close` when done, to release the
+    connections of the client.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        max_concurrency: int = 100,
+        client: AsyncOpenAI = None,
+        semaphore: asyncio.Semaphore = None,
+        compactor: TextCompactor = None,
+    ):
+        self.api_key = api_key
+        self.max_concurrency = max_concurrency
+        self.compactor = compactor
+        self.last_compaction: Optional[CompactionResult] = None
+        self._client = client
+        self._semaphore = semaphore
+        self.output_stats = OutputStats()
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so that it belongs to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def request_api(
+        self,
+        content_system: str,
+        content_user: str,
+        model_type: str = "gpt-3.5-turbo",
+        *args,
+        **kwargs,
+    ) -> str:
+        """
+        Sends a request to the OpenAI API, see APIRequester.request_api.
+
+        Parameters:
+        - content_system (str): Content of the system message to be sent to the API.
+        - content_user (str): Content of the user message to be sent to the API.
+        - model_type (str, optional): The model type to be used for the API request.
+                                      Defaults to 'gpt-3.5-turbo'.
+        - **kwargs: Completion parameters passed to the API, e.g. max_tokens,
+                    temperature and stop.
+
+        Returns:
+        - str: The content of the response message from the API.
+        """
+        async with self.semaphore:
+            response = await self.client.chat.completions.create(
+                messages=_messages(content_system, content_user),
+                model=model_type,
+                **kwargs,
+            )
+        return _completion(response)
+
+    def _compact(self, text: str) -> str:
+        if not self.compactor:
+            return text
+        self.last_compaction = self.compactor.compact(text)
+        return self.last_compaction.text
+
+    async def _bounded_request(
+        self, content_system: str, content_user: str, model_type: str, budget: OutputBudget
+    ) -> str:
+        async def send(content_user):
+            if model_type:
+                return await self.request_api(
+                    content_system, content_user, model_type, **budget.parameters()
+                )
+            return await self.request_api(content_system, content_user, **budget.parameters())
+
+        response = await send(content_user)
+        if budget.complies(response):
+            self.output_stats.record(budget.operation, COMPLIANT)
+            return response
+
+        trimmed = budget.trim(response)
+        if trimmed is not None:
+            self.output_stats.record(budget.operation, TRIMMED)
+            return trimmed
+
+        if budget.max_words is None:
+            self.output_stats.record(budget.operation, TRUNCATED)
+            return response
+
+        self.output_stats.record(budget.operation, RETRIED)
+        response = await send(budget.retry_prompt(content_user))
+        return response if budget.complies(response) else budget.trim(response, force=True)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+def _completion(response) -> Optional[str]:
+    choice = response.choices[0]
+    if choice.message.content is None:
+        return None
+    return Completion(choice.message.content, choice.finish_reason)
+
+
+def _messages(content_system: str, content_user: str) -> List[Dict[str, str]]:
+    return [
+        {
+            "role": "system",
+            "content": f"{content_system}",
+        },
+        {
+            "role": "user",
+            "content": f"{content_user}",
+        },
+    ]
@@ -0,0 +1,187 @@
+import re
+import threading
+import unicodedata
+from typing import Iterable, List, NamedTuple
+
+from summedia.tokens import estimate_tokens
+
+# Whole lines that are page furniture rather than article content. Free text is only
+# allowed after an explicit UI phrase ("Share this article on", "Read more:"), and
+# without sentence-final punctuation unless the phrase is unambiguous, so that
+# sentences such as "Register for the vote by Friday." are kept.
+BOILERPLATE_PATTERNS = (
+    r"(share|tweet|email|print|save|copy link)( (this|the) (article|story|page))?"
+    r"( (on|via|to) [^.!?]*)?",
+    r"(follow|like|join) us (on|at) [^.!?]*",
+    r"(sign up|subscribe|register)( now| today| here)?"
+    r"( (to|for) (our|the) ([\w-]+ )?(newsletters?|mailing list)[^.!?]*)?",
+    r"(get|receive) (our|the) ([\w-]+ )*newsletters?[^.!?]*",
+    r"([\w-]+ )*newsletter (sign[- ]?up|subscription)[^.!?]*",
+    r"advertisement|sponsored( content)?|ad",
+    r"(read|see) (more|also)( here| about [^.!?]*)?(:.*)?",
+    r"related( articles| stories| content| coverage)?(:.*)?",
+    r"click here( to [^.!?]*)?",
+    r"(skip|jump) to (main )?content",
+    r"(copyright )?©.*|copyright (\(c\) )?\d{4}.*",
+    r"([^.!?]*\. )?all rights reserved\.?",
+    r"(we|this (site|website)) uses? cookies.*",
+    r"(accept|reject|manage)( all)? cookies|cookie (policy|settings|preferences|consent)",
+)
+
+# Photo captions and credits, removed with strip_captions.
+CAPTION_PATTERNS = (
+    r"(photo|photograph|image|picture|illustration|video|caption)( credit)?s?\s*[:|].*",
+    r".*[(\[](getty images|ap|reuters|afp|epa|shutterstock|alamy)[)\]]",
+    r".*\b(photograph|photo|image): .*/.*",
+)
+
+# A line that is one quotation, e.g. a pull-quote, removed with strip_quotes.
+QUOTE_PATTERN = r"[\"“«„].*[\"”»“]"
+
+# Lines of more words are article content, whatever they contain.
+MAX_BOILERPLATE_WORDS = 12
+# Repeated lines and sentences shorter than this are kept ("Yes.", list markers).
+MIN_REPEATED_LINE_WORDS = 2
+MIN_REPEATED_SENTENCE_WORDS = 4
+
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff\u00ad"))
+# Typographic ligatures are spelled out. Other compatibility characters (m², H₂O, ½,
+# ™) are kept, as folding them would change what the text says.
+_LIGATURES = {ord("ﬀ"): "ff", ord("ﬁ"): "fi", ord("ﬂ"): "fl", ord("ﬃ"): "ffi", ord("ﬄ"): "ffl"}
+_SPACES = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_SENTENCES = re.compile(r"(?<=[.!?…])\s+")
+
+
+class CompactionResult(NamedTuple):
+    """
+    A compacted text with its estimated token counts before and after compaction.
+    """
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class TextCompactor:
+    """
+    Removes what does not need to be sent to the model from article text.
+
+    The text is normalized (Unicode NFC, ligatures spelled out, invisible characters
+    dropped, runs of whitespace collapsed), then lines of known boilerplate, repeated lines and
+    repeated sentences are removed. Captions and standalone quotations are removed
+    on request. Compaction is deterministic: the same text always gives the same
+    result, so it does not get in the way of caching.
+
+    Parameters:
+    - boilerplate_patterns (Iterable[str], optional): Regular expressions matched
+                           case-insensitively against whole lines. Defaults to
+                           BOILERPLATE_PATTERNS.
+    - strip_captions (bool, optional): Remove photo captions and credits.
+                                       Defaults to False.
+    - strip_quotes (bool, optional): Remove lines that are a single quotation, such
+                                     as pull-quotes. Defaults to False.
+
+    Attributes:
+    - calls (int): Number of compacted texts.
+    - tokens_before (int): Estimated tokens of the texts before compaction.
+    - tokens_after (int): Estimated tokens of the texts after compaction.
+    """
+
+    def __init__(
+        self,
+        boilerplate_patterns: Iterable[str] = BOILERPLATE_PATTERNS,
+        strip_captions: bool = False,
+        strip_quotes: bool = False,
+    ):
+        patterns = list(boilerplate_patterns)
+        if strip_captions:
+            patterns.extend(CAPTION_PATTERNS)
+        self._boilerplate = _any_of(patterns)
+        self._quote = re.compile(QUOTE_PATTERN) if strip_quotes else None
+        self.calls = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self._lock = threading.Lock()
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def compact(self, text: str) -> CompactionResult:
+        """
+        Compacts a text.
+
+        Parameters:
+        - text (str): The text to be compacted.
+
+        Returns:
+        - CompactionResult: The compacted text and the tokens it saved.
+        """
+        compacted = _deduplicate_sentences(self._filter_lines(normalize(text)))
+        compacted = _BLANK_LINES.sub("\n\n", compacted).strip()
+
+        result = CompactionResult(compacted, estimate_tokens(text), estimate_tokens(compacted))
+        with self._lock:
+            self.calls += 1
+            self.tokens_before += result.tokens_before
+            self.tokens_after += result.tokens_after
+        return result
+
+    def _filter_lines(self, text: str) -> List[str]:
+        lines = []
+        seen = set()
+        for line in text.split("\n"):
+            if not line:
+                lines.append(line)
+                continue
+            words = len(line.split())
+            if words <= MAX_BOILERPLATE_WORDS and self._boilerplate.fullmatch(line):
+                continue
+            if self._quote is not None and self._quote.fullmatch(line):
+                continue
+            key = line.casefold()
+            if words >= MIN_REPEATED_LINE_WORDS and key in seen:
+                continue
+            seen.add(key)
+            lines.append(line)
+        return lines
+
+
+def normalize(text: str) -> str:
+    """
+    Applies Unicode NFC normalization, spells out ligatures, drops invisible
+    characters and collapses whitespace, non-breaking spaces included, within lines
+    and runs of blank lines.
+    """
+    text = unicodedata.normalize("NFC", text).translate(_INVISIBLE).translate(_LIGATURES)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_SPACES.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _deduplicate_sentences(lines: List[str]) -> str:
+    seen = set()
+    kept_lines = []
+    for line in lines:
+        if not line:
+            kept_lines.append(line)
+            continue
+        sentences = []
+        for sentence in _SENTENCES.split(line):
+            key = sentence.casefold()
+            if len(sentence.split()) >= MIN_REPEATED_SENTENCE_WORDS and key in seen:
+                continue
+            seen.add(key)
+            sentences.append(sentence)
+        if sentences:
+            kept_lines.append(" ".join(sentences))
+    return "\n".join(kept_lines)
+
+
+def _any_of(patterns: List[str]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
@@ -1,11 +1,253 @@
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import openai
+
 from summedia.api import APIRequester
+from summedia.compaction import TextCompactor
+from summedia.hedging import HedgingPolicy
+from summedia.scheduler import RequestScheduler
+from summedia.stats import ModelStats
+from summedia.tokens import estimate_tokens
+
+
+class ModelConfig(NamedTuple):
+    """
+    Describes a model the router may send requests to.
+
+    Attributes:
+    - name (str): Model name as accepted by the OpenAI API.
+    - context_window (int): Maximum number of tokens (prompt and completion) of the model.
+    - input_cost (float): Price in USD per 1K prompt tokens.
+    - output_cost (float): Price in USD per 1K completion tokens.
+    """
+
+    name: str
+    context_window: int
+    input_cost: float = 0.0
+    output_cost: float = 0.0
+
+
+class RoutingRequest(NamedTuple):
+    content_system: str
+    content_user: str
+    operation: Optional[str]
+    input_tokens: int
+
+
+DEFAULT_MODELS = [ModelConfig("gpt-3.5-turbo", 16385, 0.0005, 0.0015)]
+
+# A policy inspects the request and returns the name of a model, or None to abstain.
+RoutingPolicy = Callable[[RoutingRequest, "ElasticAPIRequester"], Optional[str]]
+
+
+class TokenCountPolicy:
+    """
+    Routes by input size: picks the first model whose token limit fits the request.
+
+    Parameters:
+    - thresholds (Iterable[Tuple[int, str]]): Pairs of (max input tokens, model name),
+                                              checked in ascending order of the limit.
+    """
+
+    def __init__(self, thresholds: Iterable[Tuple[int, str]]):
+        self.thresholds = sorted(thresholds)
+
+    def __call__(self, request: RoutingRequest, router: "ElasticAPIRequester") -> Optional[str]:
+        for max_tokens, model in self.thresholds:
+            if request.input_tokens <= max_tokens:
+                return model
+        return None
+
+
+class OperationPolicy:
+    """
+    Routes by operation type, e.g. {"summarize": "gpt-3.5-turbo", "categorize": "gpt-4"}.
+    """
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = dict(mapping)
+
+    def __call__(self, request: RoutingRequest, router: "ElasticAPIRequester") -> Optional[str]:
+        return self.mapping.get(request.operation)
+
+
+class LatencySLOPolicy:
+    """
+    Routes to the cheapest model whose observed latency percentile meets an SLO.
+
+    Models with fewer than `min_samples` recorded requests are treated as meeting
+    the SLO, so that new models get traffic and their latency becomes known. Failed
+    requests count with the time they took, and models failing more often than
+    `max_error_rate` are excluded.
+
+    Parameters:
+    - slo_seconds (float): Latency target in seconds.
+    - percentile (float, optional): Percentile (0-1) compared against the target.
+                                    Defaults to 0.95.
+    - min_samples (int, optional): Samples needed before a model can be excluded.
+                                   Defaults to 10.
+    - max_error_rate (float, optional): Share of failed requests above which a model
+                                        is excluded. Defaults to 0.5.
+    """
+
+    def __init__(
+        self,
+        slo_seconds: float,
+        percentile: float = 0.95,
+        min_samples: int = 10,
+        max_error_rate: float = 0.5,
+    ):
+        self.slo_seconds = slo_seconds
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+
+    def __call__(self, request: RoutingRequest, router: "ElasticAPIRequester") -> Optional[str]:
+        candidates = [
+            model
+            for model in router.fitting_models(request.input_tokens)
+            if self._meets_slo(router.stats[model.name])
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda model: model.input_cost + model.output_cost).name
+
+    def _meets_slo(self, stats: ModelStats) -> bool:
+        if stats.samples < self.min_samples:
+            return True
+        return (
+            stats.error_rate <= self.max_error_rate
+            and stats.percentile(self.percentile) <= self.slo_seconds
+        )
 
 
 class ElasticAPIRequester(APIRequester):
+    """
+    A subclass of APIRequester that sends custom prompts and routes them between models.
+
+    Each request is offered to the routing policies in order; the first policy that
+    names a configured model whose context window fits the request decides the model.
+    If no policy decides, the first configured model is used. When a request fails
+    with an API error or a context length overflow, the remaining models are tried in
+    order (only larger ones for an overflow). Latency, estimated tokens and estimated
+    cost of every request are recorded per model in `stats`, which latency based
+    policies use to adapt routing to the observed performance.
+
+    Attributes:
+    - models (List[ModelConfig]): Models available to the router. Defaults to
+                                  gpt-3.5-turbo only.
+    - policies (List[RoutingPolicy]): Routing policies, consulted in order.
+    - stats (Dict[str, ModelStats]): Observed statistics for each model.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        models: List[ModelConfig] = None,
+        policies: List[RoutingPolicy] = None,
+        hedging: HedgingPolicy = None,
+        scheduler: RequestScheduler = None,
+        compactor: TextCompactor = None,
+    ):
+        super().__init__(api_key, hedging, scheduler, compactor)
+        self.models = list(models) if models else list(DEFAULT_MODELS)
+        self.policies = list(policies) if policies else []
+        self.stats = {model.name: ModelStats() for model in self.models}
+
+    def fitting_models(self, input_tokens: int) -> List[ModelConfig]:
+        """
+        Returns the configured models whose context window can hold the given input.
+        """
+        return [model for model in self.models if model.context_window > input_tokens]
+
+    def route(self, request: RoutingRequest) -> List[ModelConfig]:
+        """
+        Returns the models to try for a request, the selected one first followed by
+        the fallbacks.
+        """
+        fitting = self.fitting_models(request.input_tokens)
+        if not fitting:
+            # Let the largest model try; the API is the final judge of the context size.
+            fitting = [max(self.models, key=lambda model: model.context_window)]
+
+        names = [model.name for model in fitting]
+        selected = fitting[0]
+        for policy in self.policies:
+            choice = policy(request, self)
+            if choice in names:
+                selected = fitting[names.index(choice)]
+                break
+
+        return [selected] + [model for model in fitting if model is not selected]
+
     def elastic_prompt(
-        self, content_system: str, content_user: str, model_type: str = None
+        self,
+        content_system: str,
+        content_user: str,
+        model_type: str = None,
+        operation: str = None,
     ) -> str:
+        """
+        Sends a custom prompt to the API, using either an explicit model or the router.
+
+        Parameters:
+        - content_system (str): Content of the system message to be sent to the API.
+        - content_user (str): Content of the user message to be sent to the API,
+                              compacted first when a compactor is set.
+        - model_type (str, optional): Model to use. When given, routing and fallback
+                                      are skipped.
+        - operation (str, optional): Name of the operation, used by OperationPolicy.
+
+        Returns:
+        - str: The content of the response message from the API.
+        """
+        content_user = self._compact(content_user)
+        input_tokens = estimate_tokens(content_system) + estimate_tokens(content_user)
+
         if model_type:
-            return super().request_api(content_system, content_user, model_type)
-        else:
-            return super().request_api(content_system, content_user)
+            model = self._model_config(model_type)
+            return self._request_model(model, content_system, content_user, input_tokens)
+
+        request = RoutingRequest(content_system, content_user, operation, input_tokens)
+        candidates = self.route(request)
+        last_error = None
+        while candidates:
+            model = candidates.pop(0)
+            try:
+                return self._request_model(model, content_system, content_user, input_tokens)
+            except openai.APIError as e:
+                last_error = e
+                if _is_context_overflow(e):
+                    candidates = [
+                        other for other in candidates if other.context_window > model.context_window
+                    ]
+        raise last_error
+
+    def _model_config(self, name: str) -> ModelConfig:
+        for model in self.models:
+            if model.name == name:
+                return model
+        model = ModelConfig(name, context_window=0)
+        self.stats.setdefault(name, ModelStats())
+        return model
+
+    def _request_model(
+        self, model: ModelConfig, content_system: str, content_user: str, input_tokens: int
+    ) -> str:
+        stats = self.stats[model.name]
+        start = time.monotonic()
+        try:
+            response = super().request_api(content_system, content_user, model.name)
+        except Exception:
+            stats.record_error(time.monotonic() - start)
+            raise
+
+        output_tokens = estimate_tokens(response)
+        cost = (input_tokens * model.input_cost + output_tokens * model.output_cost) / 1000
+        stats.record(time.monotonic() - start, input_tokens + output_tokens, cost)
+        return response
+
+
+def _is_context_overflow(error: Exception) -> bool:
+    return getattr(error, "code", None) == "context_length_exceeded"
@@ -1,28 +1,306 @@
-from typing import List, Union
+import codecs
+import logging
+import re
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Tuple, Union
 
 import requests
 from bs4 import BeautifulSoup
 from newspaper import Article
+from newspaper.article import ArticleDownloadState
 
+from summedia.metadata import HeadParser, extract_metadata
+from summedia.text_stats import reading_time
 
-def get_article(article_url: str) -> Article:
+logger = logging.getLogger(__name__)
+
+MAX_DOWNLOAD_BYTES = 5 * 1024 * 1024
+DOWNLOAD_DEADLINE = 30
+DOWNLOAD_TIMEOUT = 10
+CHUNK_SIZE = 16 * 1024
+HEAD_MAX_BYTES = 256 * 1024
+HEAD_CHUNK_SIZE = 4 * 1024
+HEAD_END_MARKERS = (b"</head>", b"<body")
+METADATA_FIELDS = ("title", "authors", "publish_date")
+# Plain text is accepted because many servers send HTML labelled as text/plain.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+CHARSET_PATTERN = re.compile(rb"""<meta[^>]+charset=["']?([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+class DownloadError(requests.RequestException):
+    """
+    Raised when a response is rejected or its download is aborted by a limit.
+    """
+
+
+def _abort(response: requests.Response) -> None:
+    """
+    Shuts down the connection of a streamed response, so that a read blocked on it
+    in another thread returns at once. Closing the response would not wake that read.
+
+    The socket is reached through the public `fileno` of the raw response and a
+    duplicate of its descriptor; shutting down the duplicate shuts down the
+    connection. When no descriptor is available the response is only closed and a
+    warning is logged, since the deadline then holds only between reads.
+    """
+    try:
+        connection = socket.fromfd(response.raw.fileno(), socket.AF_INET, socket.SOCK_STREAM)
+    except (AttributeError, OSError, ValueError) as e:
+        logger.warning("Cannot shut down the connection of %s: %s", response.url, e)
+        response.close()
+        return
+    with connection:
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _detect_encoding(content_type: str, first_chunk: bytes) -> str:
+    """
+    Picks the charset of a response from its Content-Type header, a byte order mark
+    or a <meta charset> declaration in the first chunk, falling back to UTF-8.
+    """
+    candidates = []
+    match = re.search(r"charset=[\"']?([^\s;\"']+)", content_type, re.IGNORECASE)
+    if match:
+        candidates.append(match.group(1))
+    candidates.extend(name for bom, name in BOMS if first_chunk.startswith(bom))
+    match = CHARSET_PATTERN.search(first_chunk)
+    if match:
+        candidates.append(match.group(1).decode("ascii"))
+
+    for candidate in candidates:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+def download_html(
+    article_url: str,
+    max_bytes: int = MAX_DOWNLOAD_BYTES,
+    deadline: float = DOWNLOAD_DEADLINE,
+    timeout: float = DOWNLOAD_TIMEOUT,
+    user_agent: str = None,
+    stop_markers: Tuple[bytes, ...] = (),
+    chunk_size: int = CHUNK_SIZE,
+) -> str:
+    """
+    Downloads the HTML of a page while keeping memory and time bounded.
+
+    The response is streamed: its Content-Type and Content-Length are checked
+    before the body is read, then the body is decompressed and decoded chunk by
+    chunk. The download is aborted as soon as it exceeds the byte budget or the
+    deadline, so a huge or endless response never ends up in memory. The deadline
+    is enforced by a timer, so it also cuts off a server that trickles bytes slowly
+    enough to never hit the read timeout.
+
+    Parameters:
+    - article_url (str): The URL of the page to be downloaded.
+    - max_bytes (int, optional): Maximum size of the decompressed body in bytes.
+                                 Defaults to 5 MB.
+    - deadline (float, optional): Maximum wall-clock time of the whole download in
+                                  seconds. Defaults to 30.
+    - timeout (float, optional): Timeout in seconds for connecting and for each read.
+                                 Defaults to 10.
+    - user_agent (str, optional): User-Agent header sent with the request.
+    - stop_markers (Tuple[bytes, ...], optional): Lowercase byte strings, e.g. b"</head>",
+                                                  after which reading stops early.
+    - chunk_size (int, optional): Number of bytes read at a time. Defaults to 16 KB.
+
+    Returns:
+    - str: The decoded HTML of the page.
+
+    Raises:
+    - DownloadError: If the response is not HTML, is too large or too slow.
+    - requests.RequestException: If the request fails or returns an error status.
+    """
+    started = time.monotonic()
+    headers = {"User-Agent": user_agent} if user_agent else {}
+
+    timeout = min(timeout, deadline)
+
+    with requests.get(article_url, headers=headers, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        mime_type = content_type.split(";")[0].strip().lower()
+        if mime_type and mime_type not in HTML_CONTENT_TYPES:
+            raise DownloadError(f"Unsupported content type {mime_type}")
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            raise DownloadError(f"Response of {content_length} bytes")
+
+        decoder = None
+        received = 0
+        parts = []
+        tail = b""
+        overlap = max((len(marker) for marker in stop_markers), default=1) - 1
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            _abort(response)
+
+        timer = threading.Timer(max(0.0, deadline - (time.monotonic() - started)), expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            # iter_content decompresses gzip/deflate incrementally, so the budget
+            # applies to the decompressed size.
+            for chunk in response.iter_content(chunk_size):
+                if expired.is_set():
+                    break
+                received += len(chunk)
+                if received > max_bytes:
+                    raise DownloadError(f"Response exceeded {max_bytes} bytes")
+
+                if decoder is None:
+                    encoding = _detect_encoding(content_type, chunk)
+                    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                parts.append(decoder.decode(chunk))
+
+                if stop_markers:
+                    # Keep the end of the previous chunk to find markers split between chunks.
+                    window = (tail + chunk).lower()
+                    if any(marker in window for marker in stop_markers):
+                        break
+                    tail = window[-overlap:] if overlap else b""
+        except requests.RequestException:
+            # A read interrupted by the timer fails or ends early; both are timeouts.
+            if not expired.is_set():
+                raise
+        finally:
+            timer.cancel()
+        if expired.is_set():
+            raise DownloadError(f"Download exceeded {deadline} s")
+
+        if decoder is not None:
+            parts.append(decoder.decode(b"", final=True))
+
+    return "".join(parts)
+
+
+def get_article(
+    article_url: str,
+    max_bytes: int = MAX_DOWNLOAD_BYTES,
+    deadline: float = DOWNLOAD_DEADLINE,
+) -> Article:
     """
     Retrieves the text content of a web article from the specified URL.
 
-    This function uses the Newspaper3k library to download and extract the main
-    body text of a news article or similar web page.
+    This function streams the page with `download_html`, so oversized, slow or
+    non-HTML responses are aborted early, and hands the HTML to the Newspaper3k
+    library to extract the main body text of a news article or similar web page.
+    As with `Article.download`, a failed download is recorded on the article and
+    reported when it is parsed.
 
     Parameters:
     - article_url (str): The URL of the web article to be retrieved.
+    - max_bytes (int, optional): Maximum size of the page in bytes. Defaults to 5 MB.
+    - deadline (float, optional): Maximum download time in seconds. Defaults to 30.
 
     Returns:
     - Article: The main content of the web article.
     """
     article = Article(article_url)
-    article.download()
+    try:
+        html = download_html(
+            article_url,
+            max_bytes=max_bytes,
+            deadline=deadline,
+            user_agent=article.config.browser_user_agent,
+        )
+    except requests.RequestException as e:
+        article.download_state = ArticleDownloadState.FAILED_RESPONSE
+        article.download_exception_msg = str(e)
+        return article
+
+    article.download(input_html=html)
     return article
 
 
+def get_head(article_url: str, max_bytes: int = HEAD_MAX_BYTES) -> HeadParser:
+    """
+    Downloads and parses only the <head> of a page.
+
+    Reading stops at `</head>` (or `<body>`), so usually only the first few kilobytes
+    of the page are transferred.
+
+    Parameters:
+    - article_url (str): The URL of the page.
+    - max_bytes (int, optional): Maximum number of bytes read. Defaults to 256 KB.
+
+    Returns:
+    - HeadParser: The title, meta tags and JSON-LD data of the page.
+
+    Raises:
+    - requests.RequestException: If the head cannot be downloaded.
+    """
+    html = download_html(
+        article_url,
+        max_bytes=max_bytes,
+        stop_markers=HEAD_END_MARKERS,
+        chunk_size=HEAD_CHUNK_SIZE,
+    )
+    head = HeadParser()
+    head.feed(html)
+    return head
+
+
+def get_metadata(
+    article_url: str, fallback: bool = True, fields: Tuple[str, ...] = METADATA_FIELDS
+) -> Dict[str, Any]:
+    """
+    Retrieves the title, authors, publishing date, description and keywords of an
+    article from the head of its page.
+
+    The values come from JSON-LD NewsArticle data, OpenGraph and meta tags, with
+    dates normalized to datetime objects. Only if one of `fields` cannot be found
+    there, and `fallback` is True, the whole article is downloaded and parsed with
+    Newspaper3k to fill in the title, authors and publishing date.
+
+    Parameters:
+    - article_url (str): The URL of the article.
+    - fallback (bool, optional): Whether to parse the whole article when fields are
+                                 missing. Defaults to True.
+    - fields (Tuple[str, ...], optional): Fields whose absence triggers the fallback.
+                                          Defaults to the title, authors and
+                                          publishing date.
+
+    Returns:
+    - Dict[str, Any]: The keys "title", "authors", "publish_date", "description" and
+                      "keywords"; missing values are None (an empty list for authors).
+    """
+    try:
+        metadata = extract_metadata(get_head(article_url))
+    except requests.RequestException as e:
+        print(f"Error fetching the URL: {e}")
+        metadata = extract_metadata(HeadParser())
+
+    if fallback and not all(metadata[field] for field in fields):
+        article = get_article(article_url)
+        if article.html:
+            article.parse()
+            metadata["title"] = metadata["title"] or article.title or None
+            metadata["authors"] = metadata["authors"] or list(article.authors)
+            metadata["publish_date"] = metadata["publish_date"] or article.publish_date
+            metadata["description"] = metadata["description"] or article.meta_description or None
+
+    return metadata
+
+
 def get_text(article_url: str) -> str:
     """
     Extracts the main text content from an article given its URL.
@@ -41,23 +319,23 @@ def get_text(article_url: str) -> str:
     return article.text
 
 
-def get_time_read(article_url: str, words_per_minute: int = 238) -> int:
+def get_time_read(article_url: str, words_per_minute: int = 238, article_text: str = None) -> int:
     """
     Source: https://scholarwithin.com/average-reading-speed
 
     Parameters:
-    - article_text(str): Text from which we count reading time
+    - article_url(str): URL of the article, downloaded only if no text is given
     - words_per_minute(int): Number of words read per minute
+    - article_text(str): Already fetched text from which we count reading time
 
     Returns:
     - int: Reading time returned in minutes
     """
 
-    article_text = get_text(article_url)
-    num_chars = len(article_text.split())
-    estimated_minutes = num_chars / words_per_minute
+    if article_text is None:
+        article_text = get_text(article_url)
 
-    return round(estimated_minutes)
+    return reading_time(article_text, words_per_minute)
 
 
 def get_images(article_url: str) -> List[str]:
@@ -93,56 +371,49 @@ def get_publishing_date(article_url: str):
     """
     Retrieves the publishing date of an article from the given URL.
 
-    This function fetches an article using the specified URL, parses it,
-    and extracts the publishing date of the article.
+    The date is read from the head of the page, see `get_metadata`; the whole
+    article is downloaded and parsed only if the head does not contain it.
 
     Parameters:
     - article_url (str): The URL of the article from which to extract the publishing date.
 
     Returns:
-    - The publishing date of the article. The return type depends on how the publish_date
-      is structured in the article object. It could be a string, a datetime object, etc.
+    - The publishing date of the article as a datetime object, or None if it is not found.
     """
-    article = get_article(article_url)
-    article.parse()
-    return article.publish_date
+    return get_metadata(article_url, fields=("publish_date",))["publish_date"]
 
 
 def get_authors(article_url: str):
     """
     Retrieves the list of authors of an article from the given URL.
 
-    This function fetches an article using the specified URL, parses it,
-    and extracts the list of authors associated with the article.
+    The authors are read from the head of the page, see `get_metadata`; the whole
+    article is downloaded and parsed only if the head does not name them.
 
     Args:
     - article_url (str): The URL of the article from which to extract the authors.
 
     Returns:
     - A list of authors of the article. If no authors are found, the function
-      may return an empty list, depending on the implementation of the article object.
+      returns an empty list.
     """
-    article = get_article(article_url)
-    article.parse()
-    return article.authors
+    return get_metadata(article_url, fields=("authors",))["authors"]
 
 
 def get_title(article_url: str) -> str:
     """
     Retrieves the title of an article from the given URL.
 
-    This function fetches an article using the specified URL, parses it,
-    and extracts the title of the article.
+    The title is read from the head of the page, see `get_metadata`; the whole
+    article is downloaded and parsed only if the head does not contain it.
 
     Parameters:
     - article_url (str): The URL of the article from which to extract the title.
 
     Returns:
-    - The title of the article as a string.
+    - The title of the article as a string, or None if it is not found.
     """
-    article = get_article(article_url)
-    article.parse()
-    return article.title
+    return get_metadata(article_url, fields=("title",))["title"]
 
 
 def get_movies(article_url: str) -> str:
@@ -173,6 +444,8 @@ def get_meta_description(article_url: str) -> Union[str, None, list]:
     """
     Extracts the meta description from a given article URL.
 
+    Only the head of the page is downloaded and parsed, see `get_head`.
+
     Parameters:
     - article_url (str): The URL of the article from which to extract the meta description.
 
@@ -184,15 +457,7 @@ def get_meta_description(article_url: str) -> Union[str, None, list]:
     - requests.RequestException: If there is an error fetching the article URL.
     """
     try:
-        html_code = get_article(article_url).html
-        soup = BeautifulSoup(html_code, "html.parser")
-
-        meta_description = soup.find("meta", attrs={"name": "description"})
-
-        if meta_description:
-            return meta_description.get("content", None)
-
-        return None
+        return get_head(article_url).meta.get("description")
     except requests.RequestException as e:
         print(f"Error fetching the URL: {e}")
         return []
@@ -202,6 +467,8 @@ def get_meta_keywords(article_url: str) -> Union[str, None, list]:
     """
     Extracts the meta keywords from a given article URL.
 
+    Only the head of the page is downloaded and parsed, see `get_head`.
+
     Parameters:
     - article_url (str): The URL of the article from which to extract the meta keywords.
 
@@ -214,15 +481,7 @@ def get_meta_keywords(article_url: str) -> Union[str, None, list]:
     """
 
     try:
-        html_code = get_article(article_url).html
-        soup = BeautifulSoup(html_code, "html.parser")
-
-        meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-
-        if meta_keywords:
-            return meta_keywords.get("content", None)
-
-        return None
+        return get_head(article_url).meta.get("keywords")
     except requests.RequestException as e:
         print(f"Error fetching the URL: {e}")
         return []
@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, Optional
+
+from summedia.stats import ModelStats
+
+
+class HedgingPolicy:
+    """
+    Decides when APIRequester sends a duplicate (hedged) request.
+
+    Latency of every request is tracked online per model. When a request has not
+    finished within the chosen latency percentile of its model, a second request is
+    sent, optionally to an alternate model, and the first one to finish wins. The
+    number of hedged requests is capped at a fraction of all requests.
+
+    Attributes:
+    - percentile (float): Latency percentile (0-1) after which a request is hedged.
+    - alternate_model (str): Model used for the duplicate request. Defaults to the
+                             model of the original request.
+    - max_extra_load (float): Maximum ratio of hedged requests to all requests.
+    - min_samples (int): Requests a model needs to finish before its latency
+                         percentile is trusted. No hedging happens before that.
+    - stats (Dict[str, ModelStats]): Observed latency statistics for each model.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        alternate_model: str = None,
+        max_extra_load: float = 0.05,
+        min_samples: int = 20,
+    ):
+        self.percentile = percentile
+        self.alternate_model = alternate_model
+        self.max_extra_load = max_extra_load
+        self.min_samples = min_samples
+        self.stats: Dict[str, ModelStats] = {}
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def model_stats(self, model: str) -> ModelStats:
+        with self._lock:
+            return self.stats.setdefault(model, ModelStats())
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """
+        Counts a new request and returns the seconds to wait for it before hedging,
+        or None when there is not enough latency data for the model yet.
+        """
+        with self._lock:
+            self.requests += 1
+        stats = self.model_stats(model)
+        if stats.samples < self.min_samples:
+            return None
+        return stats.percentile(self.percentile)
+
+    def acquire_hedge(self) -> bool:
+        """
+        Reserves a hedged request if it stays within the extra load budget.
+        """
+        with self._lock:
+            if self.hedges + 1 > self.max_extra_load * self.requests:
+                return False
+            self.hedges += 1
+            return True
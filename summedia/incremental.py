@@ -0,0 +1,124 @@
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Dict, List, NamedTuple, Optional
+
+
+class ArticleSnapshot(NamedTuple):
+    """
+    State kept between two summaries of the same article.
+
+    Attributes:
+    - paragraphs (List[str]): Paragraphs of the summarized text.
+    - summary (str): Summary produced for that text.
+    - drift (float, optional): Share of the article changed by incremental updates
+                               since its last summary from scratch. Defaults to 0.0.
+    """
+
+    paragraphs: List[str]
+    summary: str
+    drift: float = 0.0
+
+
+class ArticleDiff(NamedTuple):
+    """
+    Paragraph level difference between a stored snapshot and the current text.
+
+    Attributes:
+    - changed (List[str]): Paragraphs that were added or modified, in article order.
+    - removed (List[str]): Paragraphs that are no longer in the article, in the order
+                           of the snapshot.
+    - change_ratio (float): Share of the article (in characters) that changed.
+    """
+
+    changed: List[str]
+    removed: List[str]
+    change_ratio: float
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """
+    Splits article text into non-empty paragraphs separated by blank lines.
+    """
+    paragraphs = (" ".join(block.split()) for block in text.split("\n\n"))
+    return [paragraph for paragraph in paragraphs if paragraph]
+
+
+def diff_paragraphs(snapshot: ArticleSnapshot, paragraphs: List[str]) -> ArticleDiff:
+    """
+    Compares the paragraphs of the current text with a stored snapshot.
+
+    Parameters:
+    - snapshot (ArticleSnapshot): State stored after the previous summary.
+    - paragraphs (List[str]): Paragraphs of the current article text.
+
+    Returns:
+    - ArticleDiff: Changed and removed paragraphs and the change ratio.
+    """
+    previous = set(snapshot.paragraphs)
+    current = set(paragraphs)
+
+    changed = [paragraph for paragraph in paragraphs if paragraph not in previous]
+    removed = [paragraph for paragraph in snapshot.paragraphs if paragraph not in current]
+
+    changed_chars = sum(len(paragraph) for paragraph in changed + removed)
+    total_chars = max(
+        sum(len(paragraph) for paragraph in paragraphs),
+        sum(len(paragraph) for paragraph in snapshot.paragraphs),
+        1,
+    )
+    return ArticleDiff(changed, removed, min(1.0, changed_chars / total_chars))
+
+
+class SummaryStore:
+    """
+    Keeps the last summary and paragraphs of each article, keyed by URL.
+
+    Snapshots live in memory; when a path is given they are kept in a SQLite
+    database instead, one row per article, so incremental summaries survive
+    restarts and storing a snapshot writes only that article.
+
+    Parameters:
+    - path (str, optional): SQLite database file used to persist the snapshots,
+                            created if it does not exist.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self._snapshots: Dict[str, ArticleSnapshot] = {}
+        self._lock = threading.Lock()
+        if path:
+            with self._connect() as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS snapshots ("
+                    "key TEXT PRIMARY KEY, paragraphs TEXT NOT NULL, summary TEXT NOT NULL, "
+                    "drift REAL NOT NULL)"
+                )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    def get(self, key: str) -> Optional[ArticleSnapshot]:
+        if not self.path:
+            return self._snapshots.get(key)
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT paragraphs, summary, drift FROM snapshots WHERE key = ?", [key]
+            ).fetchone()
+        if row is None:
+            return None
+        paragraphs, summary, drift = row
+        return ArticleSnapshot(json.loads(paragraphs), summary, drift)
+
+    def put(self, key: str, snapshot: ArticleSnapshot) -> None:
+        if not self.path:
+            with self._lock:
+                self._snapshots[key] = snapshot
+            return
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO snapshots (key, paragraphs, summary, drift) "
+                "VALUES (?, ?, ?, ?)",
+                [key, json.dumps(snapshot.paragraphs), snapshot.summary, snapshot.drift],
+            )
@@ -0,0 +1,478 @@
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Languages told apart by their character trigrams, grouped by script.
+SAMPLES: Dict[str, Dict[str, str]] = {
+    "latin": {
+        "en": (
+            "All human beings are born free and equal in dignity and rights. They are "
+            "endowed with reason and conscience and should act towards one another in a "
+            "spirit of brotherhood. Everyone has the right to life, liberty and security of "
+            "person. The government said on Monday that the new law would come into force "
+            "next year, after the parliament approved it with a large majority. Prices of "
+            "food and energy have risen again this month, and many families are worried "
+            "about what will happen in the winter."
+        ),
+        "es": (
+            "Todos los seres humanos nacen libres e iguales en dignidad y derechos y, "
+            "dotados como están de razón y conciencia, deben comportarse fraternalmente los "
+            "unos con los otros. Todo individuo tiene derecho a la vida, a la libertad y a "
+            "la seguridad de su persona. El gobierno anunció el lunes que la nueva ley "
+            "entrará en vigor el próximo año, después de que el parlamento la aprobara con "
+            "una amplia mayoría. Los precios de los alimentos y de la energía han vuelto a "
+            "subir este mes, y muchas familias están preocupadas por lo que pasará en invierno."
+        ),
+        "fr": (
+            "Tous les êtres humains naissent libres et égaux en dignité et en droits. Ils "
+            "sont doués de raison et de conscience et doivent agir les uns envers les autres "
+            "dans un esprit de fraternité. Tout individu a droit à la vie, à la liberté et à "
+            "la sûreté de sa personne. Le gouvernement a annoncé lundi que la nouvelle loi "
+            "entrera en vigueur l'année prochaine, après son adoption par le parlement à une "
+            "large majorité. Les prix de l'alimentation et de l'énergie ont encore augmenté "
+            "ce mois-ci, et de nombreuses familles s'inquiètent de ce qui se passera cet hiver."
+        ),
+        "de": (
+            "Alle Menschen sind frei und gleich an Würde und Rechten geboren. Sie sind mit "
+            "Vernunft und Gewissen begabt und sollen einander im Geist der Brüderlichkeit "
+            "begegnen. Jeder hat das Recht auf Leben, Freiheit und Sicherheit der Person. "
+            "Die Regierung teilte am Montag mit, dass das neue Gesetz im nächsten Jahr in "
+            "Kraft treten werde, nachdem das Parlament es mit großer Mehrheit verabschiedet "
+            "hatte. Die Preise für Lebensmittel und Energie sind in diesem Monat erneut "
+            "gestiegen, und viele Familien machen sich Sorgen darüber, was im Winter "
+            "passieren wird."
+        ),
+        "it": (
+            "Tutti gli esseri umani nascono liberi ed eguali in dignità e diritti. Essi sono "
+            "dotati di ragione e di coscienza e devono agire gli uni verso gli altri in "
+            "spirito di fratellanza. Ogni individuo ha diritto alla vita, alla libertà ed "
+            "alla sicurezza della propria persona. Il governo ha annunciato lunedì che la "
+            "nuova legge entrerà in vigore il prossimo anno, dopo che il parlamento l'ha "
+            "approvata con un'ampia maggioranza. I prezzi del cibo e dell'energia sono "
+            "aumentati di nuovo questo mese e molte famiglie sono preoccupate per quello che "
+            "succederà durante l'inverno."
+        ),
+        "pt": (
+            "Todos os seres humanos nascem livres e iguais em dignidade e em direitos. "
+            "Dotados de razão e de consciência, devem agir uns para com os outros em "
+            "espírito de fraternidade. Todo o indivíduo tem direito à vida, à liberdade e à "
+            "segurança pessoal. O governo anunciou na segunda-feira que a nova lei entrará "
+            "em vigor no próximo ano, depois de o parlamento a ter aprovado com uma ampla "
+            "maioria. Os preços dos alimentos e da energia voltaram a subir este mês, e "
+            "muitas famílias estão preocupadas com o que vai acontecer no inverno."
+        ),
+        "nl": (
+            "Alle mensen worden vrij en gelijk in waardigheid en rechten geboren. Zij zijn "
+            "begiftigd met verstand en geweten, en behoren zich jegens elkander in een geest "
+            "van broederschap te gedragen. Een ieder heeft recht op leven, vrijheid en "
+            "onschendbaarheid van zijn persoon. De regering maakte maandag bekend dat de "
+            "nieuwe wet volgend jaar in werking treedt, nadat het parlement die met een grote "
+            "meerderheid had goedgekeurd. De prijzen van voedsel en energie zijn deze maand "
+            "opnieuw gestegen, en veel gezinnen maken zich zorgen over wat er in de winter "
+            "gaat gebeuren."
+        ),
+        "pl": (
+            "Wszyscy ludzie rodzą się wolni i równi pod względem swej godności i swych praw. "
+            "Są oni obdarzeni rozumem i sumieniem i powinni postępować wobec innych w duchu "
+            "braterstwa. Każdy człowiek ma prawo do życia, wolności i bezpieczeństwa swej "
+            "osoby. Rząd poinformował w poniedziałek, że nowa ustawa wejdzie w życie w "
+            "przyszłym roku, po tym jak parlament przyjął ją znaczną większością głosów. "
+            "Ceny żywności i energii w tym miesiącu znowu wzrosły, a wiele rodzin martwi się "
+            "o to, co stanie się zimą."
+        ),
+        "sv": (
+            "Alla människor är födda fria och lika i värde och rättigheter. De har "
+            "utrustats med förnuft och samvete och bör handla gentemot varandra i en anda av "
+            "broderskap. Var och en har rätt till liv, frihet och personlig säkerhet. "
+            "Regeringen meddelade på måndagen att den nya lagen träder i kraft nästa år, "
+            "sedan riksdagen antagit den med stor majoritet. Priserna på mat och energi har "
+            "stigit igen den här månaden, och många familjer är oroliga för vad som ska "
+            "hända i vinter."
+        ),
+        "da": (
+            "Alle mennesker er født frie og lige i værdighed og rettigheder. De er udstyret "
+            "med fornuft og samvittighed, og de bør handle mod hverandre i en broderskabets "
+            "ånd. Enhver har ret til liv, frihed og personlig sikkerhed. Regeringen meddelte "
+            "mandag, at den nye lov træder i kraft næste år, efter at Folketinget har "
+            "vedtaget den med et stort flertal. Priserne på fødevarer og energi er steget "
+            "igen i denne måned, og mange familier er bekymrede for, hvad der vil ske i vinter."
+        ),
+        "fi": (
+            "Kaikki ihmiset syntyvät vapaina ja tasavertaisina arvoltaan ja oikeuksiltaan. "
+            "Heille on annettu järki ja omatunto, ja heidän on toimittava toisiaan kohtaan "
+            "veljeyden hengessä. Jokaisella on oikeus elämään, vapauteen ja "
+            "henkilökohtaiseen turvallisuuteen. Hallitus kertoi maanantaina, että uusi laki "
+            "tulee voimaan ensi vuonna, kun eduskunta hyväksyi sen suurella enemmistöllä. "
+            "Ruoan ja energian hinnat ovat nousseet tässä kuussa jälleen, ja monet perheet "
+            "ovat huolissaan siitä, mitä talvella tapahtuu."
+        ),
+        "cs": (
+            "Všichni lidé rodí se svobodní a sobě rovní co do důstojnosti a práv. Jsou "
+            "nadáni rozumem a svědomím a mají spolu jednat v duchu bratrství. Každý má "
+            "právo na život, svobodu a osobní bezpečnost. Vláda v pondělí oznámila, že nový "
+            "zákon vstoupí v platnost příští rok poté, co jej parlament schválil velkou "
+            "většinou. Ceny potravin a energií tento měsíc opět vzrostly a mnoho rodin se "
+            "obává, co se stane v zimě."
+        ),
+        "ro": (
+            "Toate ființele umane se nasc libere și egale în demnitate și în drepturi. Ele "
+            "sunt înzestrate cu rațiune și conștiință și trebuie să se comporte unele față "
+            "de altele în spiritul fraternității. Orice ființă umană are dreptul la viață, "
+            "la libertate și la securitatea persoanei sale. Guvernul a anunțat luni că noua "
+            "lege va intra în vigoare anul viitor, după ce parlamentul a adoptat-o cu o "
+            "majoritate largă. Prețurile alimentelor și ale energiei au crescut din nou luna "
+            "aceasta, iar multe familii sunt îngrijorate de ce se va întâmpla la iarnă."
+        ),
+        "tr": (
+            "Bütün insanlar hür, haysiyet ve haklar bakımından eşit doğarlar. Akıl ve "
+            "vicdana sahiptirler ve birbirlerine karşı kardeşlik zihniyeti ile hareket "
+            "etmelidirler. Yaşamak, hürriyet ve kişi emniyeti her ferdin hakkıdır. Hükümet "
+            "pazartesi günü yaptığı açıklamada, yeni yasanın meclis tarafından büyük bir "
+            "çoğunlukla kabul edilmesinin ardından gelecek yıl yürürlüğe gireceğini "
+            "bildirdi. Gıda ve enerji fiyatları bu ay yeniden yükseldi ve birçok aile kışın "
+            "ne olacağından endişe ediyor."
+        ),
+        "hu": (
+            "Minden emberi lény szabadon születik és egyenlő méltósága és joga van. Az "
+            "emberek, ésszel és lelkiismerettel bírván, egymással szemben testvéri szellemben "
+            "kell hogy viseltessenek. Minden személynek joga van az élethez, a szabadsághoz "
+            "és a személyi biztonsághoz. A kormány hétfőn bejelentette, hogy az új törvény "
+            "jövőre lép hatályba, miután a parlament nagy többséggel elfogadta. Az "
+            "élelmiszerek és az energia ára ebben a hónapban ismét emelkedett, és sok család "
+            "aggódik amiatt, hogy mi történik majd télen."
+        ),
+        "id": (
+            "Semua orang dilahirkan merdeka dan mempunyai martabat dan hak-hak yang sama. "
+            "Mereka dikaruniai akal dan hati nurani dan hendaknya bergaul satu sama lain "
+            "dalam semangat persaudaraan. Setiap orang berhak atas kehidupan, kebebasan dan "
+            "keselamatan sebagai individu. Pemerintah mengumumkan pada hari Senin bahwa "
+            "undang-undang baru itu akan mulai berlaku tahun depan, setelah parlemen "
+            "menyetujuinya dengan suara mayoritas yang besar. Harga makanan dan energi "
+            "kembali naik bulan ini, dan banyak keluarga khawatir tentang apa yang akan "
+            "terjadi pada musim dingin."
+        ),
+        "sk": (
+            "Všetci ľudia sa rodia slobodní a sebe rovní, čo sa týka ich dôstojnosti a práv. "
+            "Sú obdarení rozumom a svedomím a majú spolu jednať v bratskom duchu. Každý má "
+            "právo na život, slobodu a osobnú bezpečnosť. Vláda v pondelok oznámila, že nový "
+            "zákon nadobudne účinnosť budúci rok, potom ako ho parlament schválil veľkou "
+            "väčšinou. Ceny potravín a energií tento mesiac opäť vzrástli a mnohé rodiny sa "
+            "obávajú, čo sa stane v zime."
+        ),
+        "hr": (
+            "Sva ljudska bića rađaju se slobodna i jednaka u dostojanstvu i pravima. Ona su "
+            "obdarena razumom i sviješću pa jedna prema drugima trebaju postupati u duhu "
+            "bratstva. Svatko ima pravo na život, slobodu i osobnu sigurnost. Vlada je u "
+            "ponedjeljak objavila da će novi zakon stupiti na snagu sljedeće godine, nakon što "
+            "ga je sabor izglasao velikom većinom. Cijene hrane i energije ovog su mjeseca "
+            "ponovno porasle, a mnoge obitelji zabrinute su zbog onoga što će se dogoditi zimi."
+        ),
+        "sl": (
+            "Vsi ljudje se rodijo svobodni in imajo enako dostojanstvo in enake pravice. "
+            "Obdarjeni so z razumom in vestjo in bi morali ravnati drug z drugim kakor bratje. "
+            "Vsakdo ima pravico do življenja, prostosti in osebne varnosti. Vlada je v "
+            "ponedeljek sporočila, da bo novi zakon o davkih začel veljati prihodnje leto, "
+            "potem ko ga je državni zbor sprejel z veliko večino. Podjetja bodo plačevala "
+            "višje davke. Cene hrane in energije so ta mesec znova zrasle, in mnoge družine "
+            "skrbi, kaj se bo zgodilo pozimi."
+        ),
+        "ca": (
+            "Tots els éssers humans neixen lliures i iguals en dignitat i en drets. Són dotats "
+            "de raó i de consciència, i han de comportar-se fraternalment els uns amb els "
+            "altres. Tota persona té dret a la vida, a la llibertat i a la seguretat de la seva "
+            "persona. El govern va anunciar dilluns que la nova llei entrarà en vigor l'any "
+            "vinent, després que el parlament l'aprovés amb una àmplia majoria. Els preus dels "
+            "aliments i de l'energia han tornat a pujar aquest mes, i moltes famílies estan "
+            "preocupades pel que passarà a l'hivern."
+        ),
+        "gl": (
+            "Tódolos seres humanos nacen libres e iguais en dignidade e dereitos e, dotados "
+            "como están de razón e conciencia, débense comportar fraternalmente uns cos outros. "
+            "Todo individuo ten dereito á vida, á liberdade e á seguridade da súa persoa. O "
+            "goberno anunciou o luns que a nova lei entrará en vigor o próximo ano, despois de "
+            "que o parlamento a aprobase cunha ampla maioría. Os prezos dos alimentos e da "
+            "enerxía volveron subir este mes, e moitas familias están preocupadas polo que "
+            "pasará no inverno."
+        ),
+        "no": (
+            "Alle mennesker er født frie og med samme menneskeverd og menneskerettigheter. De "
+            "er utstyrt med fornuft og samvittighet og bør handle mot hverandre i brorskapets "
+            "ånd. Enhver har rett til liv, frihet og personlig sikkerhet. Regjeringen kunngjorde "
+            "mandag at den nye loven trer i kraft neste år, etter at Stortinget vedtok den med "
+            "stort flertall. Prisene på mat og energi har steget igjen denne måneden, og mange "
+            "familier er bekymret for hva som vil skje i vinter."
+        ),
+    },
+    "cyrillic": {
+        "ru": (
+            "Все люди рождаются свободными и равными в своем достоинстве и правах. Они "
+            "наделены разумом и совестью и должны поступать в отношении друг друга в духе "
+            "братства. Каждый человек имеет право на жизнь, на свободу и на личную "
+            "неприкосновенность. Правительство в понедельник объявило, что новый закон "
+            "вступит в силу в следующем году, после того как парламент одобрил его "
+            "большинством голосов. Цены на продукты питания и энергию в этом месяце снова "
+            "выросли, и многие семьи беспокоятся о том, что будет зимой."
+        ),
+        "uk": (
+            "Всі люди народжуються вільними і рівними у своїй гідності та правах. Вони "
+            "наділені розумом і совістю і повинні діяти у відношенні один до одного в дусі "
+            "братерства. Кожна людина має право на життя, на свободу і на особисту "
+            "недоторканність. Уряд у понеділок оголосив, що новий закон набере чинності "
+            "наступного року, після того як парламент ухвалив його більшістю голосів. Ціни "
+            "на продукти харчування та енергію цього місяця знову зросли, і багато родин "
+            "хвилюються про те, що буде взимку."
+        ),
+        "bg": (
+            "Всички хора се раждат свободни и равни по достойнство и права. Те са надарени "
+            "с разум и съвест и следва да се отнасят помежду си в дух на братство. Всеки "
+            "човек има право на живот, свобода и лична сигурност. Правителството обяви в "
+            "понеделник, че новият закон ще влезе в сила догодина, след като парламентът го "
+            "прие с голямо мнозинство. Цените на храните и енергията отново се покачиха "
+            "този месец и много семейства се тревожат какво ще се случи през зимата."
+        ),
+        "sr": (
+            "Сва људска бића рађају се слободна и једнака у достојанству и правима. Она су "
+            "обдарена разумом и свешћу и треба једни према другима да поступају у духу "
+            "братства. Свако има право на живот, слободу и безбедност личности. Влада је у "
+            "понедељак саопштила да ће нови закон ступити на снагу следеће године, пошто га је "
+            "скупштина усвојила великом већином. Цене хране и енергије овог месеца су поново "
+            "порасле, а многе породице су забринуте због онога што ће се десити током зиме."
+        ),
+        "be": (
+            "Усе людзі нараджаюцца свабоднымі і роўнымі ў сваёй годнасці і правах. Яны "
+            "надзелены розумам і сумленнем і павінны ставіцца адзін да аднаго ў духу брацтва. "
+            "Кожны чалавек мае права на жыццё, на свабоду і на асабістую недатыкальнасць. Урад "
+            "у панядзелак абвясціў, што новы закон уступіць у сілу ў наступным годзе, пасля "
+            "таго як парламент ухваліў яго большасцю галасоў. Цэны на прадукты харчавання і "
+            "энергію ў гэтым месяцы зноў выраслі, і многія сем'і непакояцца пра тое, што будзе "
+            "зімой."
+        ),
+        "mk": (
+            "Сите човечки суштества се раѓаат слободни и еднакви по достоинство и права. Тие "
+            "се обдарени со разум и совест и треба да се однесуваат еден кон друг во духот на "
+            "братството. Секој човек има право на живот, слобода и лична безбедност. Владата во "
+            "понеделникот соопшти дека новиот закон ќе стапи во сила следната година, откако "
+            "парламентот го изгласа со големо мнозинство. Цените на храната и енергијата овој "
+            "месец повторно пораснаа, и многу семејства се загрижени што ќе се случи во текот "
+            "на зимата."
+        ),
+    },
+}
+
+# Scripts written by one language, by the Unicode character name prefix. Scripts
+# shared by several languages (Hebrew and Yiddish, Devanagari for Hindi, Marathi
+# and Nepali, Bengali and Assamese, Ethiopic for Amharic and Tigrinya) are left out,
+# so their texts are not classified.
+SCRIPT_LANGUAGES = {
+    "greek": "el",
+    "thai": "th",
+    "hangul": "ko",
+    "hiragana": "ja",
+    "katakana": "ja",
+    "armenian": "hy",
+    "georgian": "ka",
+    "tamil": "ta",
+    "telugu": "te",
+    "gujarati": "gu",
+    "gurmukhi": "pa",
+    "kannada": "kn",
+    "malayalam": "ml",
+    "khmer": "km",
+    "lao": "lo",
+    "myanmar": "my",
+    "sinhala": "si",
+}
+
+# Letters that only Persian and Urdu add to the Arabic alphabet.
+_PERSIAN_LETTERS = set("پچژگ")
+_URDU_LETTERS = set("ٹڈڑںے")
+# Letters of Arabic that Persian and Urdu write differently (ي, ك) or rarely use.
+_ARABIC_LETTERS = set("ةيكىأإ")
+# Letters of other languages written in the Arabic script: Kurdish, Pashto, Sindhi
+# and Uyghur.
+_OTHER_ARABIC_LETTERS = set("ێۆڵڕەټډړږښځڅۍېڪڄٻڀٺٽڊڏڍڙڦڳڱڻڇۇۈ")
+
+# Common simplified Chinese characters, and traditional ones that Japanese does not
+# use. Han text without them nor kana may be Japanese written in kanji only.
+_CHINESE_CHARACTERS = set(
+    "们們这這说說个吗嗎么麼还给让讓过对對时为经济发东长门问间关开车书见现产业动从进战报实"
+    "应总统议选举该劲务员级亿钱银话语认识计设证调谈请读论际阳队陆题师归岁汉乐兴农军网边达"
+    "运远连适爱难马鱼鸟龙飞风页领头买卖贵费资赛负财货质购贸乡亚伤传价众优"
+)
+
+
+class Thresholds(NamedTuple):
+    """
+    Conditions a best match has to meet to be returned.
+
+    Attributes:
+    - min_margin (float): Required lead in average log-probability per trigram over
+                          the second best language.
+    - min_coverage (float): Share of the trigrams of the text that occur in the
+                            sample of the best language.
+    - min_log_probability (float): Average log-probability per trigram under the best
+                                   language, counting trigrams its sample lacks at
+                                   their smoothed probability.
+    """
+
+    min_margin: float
+    min_coverage: float
+    min_log_probability: float
+
+
+# Texts with fewer known trigrams are not classified.
+MIN_TRIGRAMS = 8
+# A text in a language without a profile still gets a best match, usually a related
+# language, so the coverage and log-probability of that match are checked too.
+DEFAULT_THRESHOLDS = Thresholds(min_margin=0.1, min_coverage=0.3, min_log_probability=-8.1)
+# Far more languages are written in the Latin script than it has profiles, so its
+# matches need a clearer lead and a closer fit.
+THRESHOLDS = {
+    "latin": Thresholds(min_margin=0.15, min_coverage=0.3, min_log_probability=-8.05),
+}
+# Count added to every trigram of every profile.
+SMOOTHING = 0.1
+
+_WORDS = re.compile(r"[^\W\d_]+")
+
+
+class _Model:
+    def __init__(self, samples: Dict[str, str], thresholds: Thresholds = DEFAULT_THRESHOLDS):
+        self.languages = list(samples)
+        self.thresholds = thresholds
+        counts = {language: Counter(_trigrams(text)) for language, text in samples.items()}
+        vocabulary = sorted(set().union(*counts.values()))
+        self.index = {trigram: position for position, trigram in enumerate(vocabulary)}
+
+        frequencies = np.full((len(self.languages), len(vocabulary)), SMOOTHING)
+        for row, language in enumerate(self.languages):
+            for trigram, count in counts[language].items():
+                frequencies[row, self.index[trigram]] += count
+        self.seen = frequencies > SMOOTHING
+        self.log_probabilities = np.log(frequencies / frequencies.sum(axis=1, keepdims=True))
+        self.unseen_log_probabilities = self.log_probabilities.min(axis=1)
+
+    def classify(self, texts: List[str]) -> List[Optional[str]]:
+        counts = np.zeros((len(texts), len(self.index)))
+        totals = np.zeros(len(texts))
+        for row, text in enumerate(texts):
+            trigrams = _trigrams(text)
+            totals[row] = len(trigrams)
+            for trigram in trigrams:
+                position = self.index.get(trigram)
+                if position is not None:
+                    counts[row, position] += 1
+
+        known = counts.sum(axis=1)
+        log_likelihoods = counts @ self.log_probabilities.T
+        scores = log_likelihoods / np.maximum(known, 1)[:, None]
+        ranked = np.sort(scores, axis=1)
+        margins = ranked[:, -1] - ranked[:, -2] if len(self.languages) > 1 else known
+        best = scores.argmax(axis=1)
+
+        rows = np.arange(len(texts))
+        totals = np.maximum(totals, 1)
+        coverage = (counts @ self.seen.T)[rows, best] / totals
+        log_probabilities = (
+            log_likelihoods[rows, best] + (totals - known) * self.unseen_log_probabilities[best]
+        ) / totals
+        accepted = (
+            (known >= MIN_TRIGRAMS)
+            & (margins >= self.thresholds.min_margin)
+            & (coverage >= self.thresholds.min_coverage)
+            & (log_probabilities >= self.thresholds.min_log_probability)
+        )
+        return [self.languages[best[row]] if accepted[row] else None for row in rows]
+
+
+@lru_cache(maxsize=None)
+def _model(script: str) -> _Model:
+    # Built on first use, so that importing the module stays cheap.
+    return _Model(SAMPLES[script], THRESHOLDS.get(script, DEFAULT_THRESHOLDS))
+
+
+def _trigrams(text: str) -> List[str]:
+    padded = f" {' '.join(_WORDS.findall(text.lower()))} "
+    return ["".join(characters) for characters in zip(padded, padded[1:], padded[2:])]
+
+
+def script(text: str) -> Optional[str]:
+    """
+    Returns the lowercase name of the script of most letters of a text, e.g. "latin".
+    """
+    counts = Counter(
+        unicodedata.name(character, "").split(" ")[0].lower()
+        for character in text
+        if character.isalpha()
+    )
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def detect_languages(texts: List[str]) -> List[Optional[str]]:
+    """
+    Identifies the language of many texts at once.
+
+    The script of a text decides the language when only one language is written in
+    it (Greek, Thai, Hangul, ...), or when letters specific to one language are
+    present (kana for Japanese, Urdu or Persian letters in the Arabic script).
+    Otherwise the character trigrams of Latin and Cyrillic texts are scored against
+    the profiles of the languages of that script, all texts of a script in one
+    matrix product; texts of other shared scripts are not classified.
+
+    Parameters:
+    - texts (List[str]): The texts to identify.
+
+    Returns:
+    - List[Optional[str]]: ISO 639-1 code of each text, or None when the text is too
+                           short, its language is not certain or it does not
+                           resemble any language of the profiles closely enough.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    by_script: Dict[str, List[Tuple[int, str]]] = {}
+    for position, text in enumerate(texts):
+        name = script(text)
+        if name in SAMPLES:
+            by_script.setdefault(name, []).append((position, text))
+        elif name == "arabic":
+            results[position] = _arabic_script_language(set(text))
+        elif name == "cjk":
+            results[position] = _han_language(text)
+        else:
+            results[position] = SCRIPT_LANGUAGES.get(name)
+
+    for name, items in by_script.items():
+        positions, group = zip(*items)
+        for position, language in zip(positions, _model(name).classify(list(group))):
+            results[position] = language
+    return results
+
+
+def _arabic_script_language(letters: set) -> Optional[str]:
+    if letters & _OTHER_ARABIC_LETTERS:
+        return None
+    if letters & _URDU_LETTERS:
+        return "ur"
+    if letters & _PERSIAN_LETTERS:
+        return "fa"
+    if letters & _ARABIC_LETTERS:
+        return "ar"
+    return None
+
+
+def _han_language(text: str) -> Optional[str]:
+    if any(script(character) in ("hiragana", "katakana") for character in text):
+        return "ja"
+    if any(character in _CHINESE_CHARACTERS for character in text):
+        return "zh"
+    return None
+
+
+def detect_language(text: str) -> Optional[str]:
+    """
+    Returns the ISO 639-1 code of the language of a text, or None if it is not certain.
+    """
+    return detect_languages([text])[0]
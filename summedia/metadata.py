@@ -0,0 +1,168 @@
+import json
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+from dateutil import parser as date_parser
+
+NEWS_ARTICLE_TYPES = {"NewsArticle", "Article", "ReportageNewsArticle", "BlogPosting"}
+
+
+class HeadParser(HTMLParser):
+    """
+    A lightweight parser that collects <title>, <meta> tags and JSON-LD scripts of
+    an HTML document and stops at the end of its head.
+
+    Attributes:
+    - title (str): Content of the <title> tag.
+    - meta (Dict[str, str]): Content of the meta tags by lowercased name, property,
+                             itemprop or http-equiv; the first occurrence wins.
+    - json_ld (List[Any]): Parsed JSON-LD objects.
+    - finished (bool): Whether the end of the head was reached.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.meta: Dict[str, str] = {}
+        self.json_ld: List[Any] = []
+        self.finished = False
+        self._in_title = False
+        self._script = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.finished:
+            return
+        attributes = {name.lower(): value for name, value in attrs if value is not None}
+        if tag == "title":
+            self._in_title = True
+            self.title = ""
+        elif tag == "meta" and "content" in attributes:
+            for key in ("name", "property", "itemprop", "http-equiv"):
+                if key in attributes:
+                    self.meta.setdefault(attributes[key].lower(), attributes["content"].strip())
+        elif tag == "script" and attributes.get("type", "").lower() == "application/ld+json":
+            self._script = []
+        elif tag == "body":
+            self.finished = True
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "script" and self._script is not None:
+            try:
+                self.json_ld.append(json.loads("".join(self._script)))
+            except ValueError:
+                pass
+            self._script = None
+        elif tag == "head":
+            self.finished = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif self._script is not None:
+            self._script.append(data)
+
+
+def _news_articles(json_ld: List[Any]) -> List[Dict[str, Any]]:
+    found = []
+    pending = list(json_ld)
+    while pending:
+        item = pending.pop(0)
+        if isinstance(item, list):
+            pending.extend(item)
+        elif isinstance(item, dict):
+            pending.extend(item.get("@graph", []))
+            types = item.get("@type", [])
+            types = types if isinstance(types, list) else [types]
+            if NEWS_ARTICLE_TYPES.intersection(types):
+                found.append(item)
+    return found
+
+
+def _names(value: Any) -> List[str]:
+    values = value if isinstance(value, list) else [value]
+    names = []
+    for item in values:
+        name = item.get("name") if isinstance(item, dict) else item
+        if isinstance(name, str) and name.strip() and name.strip() not in names:
+            names.append(name.strip())
+    return names
+
+
+def _text(value: Any) -> Optional[str]:
+    """
+    Returns the text of a JSON-LD value, which may also be a {"@value": ...} object
+    or a list of values, or None when it holds no text.
+    """
+    if isinstance(value, dict):
+        return _text(value.get("@value"))
+    if isinstance(value, list):
+        return next(filter(None, map(_text, value)), None)
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Normalizes a date string in any common format to a datetime, or returns None.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return date_parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+def extract_metadata(head: HeadParser) -> Dict[str, Any]:
+    """
+    Builds article metadata from a parsed head, preferring JSON-LD NewsArticle data
+    over OpenGraph and plain meta tags.
+
+    Returns:
+    - Dict[str, Any]: The keys "title", "authors", "publish_date", "description"
+                      and "keywords"; values that were not found are None (an
+                      empty list for authors).
+    """
+    meta = head.meta
+    article = next(iter(_news_articles(head.json_ld)), {})
+
+    keywords = article.get("keywords") or meta.get("keywords") or meta.get("news_keywords")
+    if isinstance(keywords, list):
+        keywords = ", ".join(str(keyword) for keyword in keywords)
+    elif not isinstance(keywords, str):
+        keywords = None
+
+    authors = _names(article.get("author", []))
+    if not authors:
+        authors = _names([meta.get("author"), meta.get("dc.creator")])
+
+    published = (
+        _text(article.get("datePublished"))
+        or meta.get("article:published_time")
+        or meta.get("datepublished")
+        or meta.get("pubdate")
+        or meta.get("publishdate")
+        or meta.get("dc.date")
+        or meta.get("date")
+    )
+
+    return {
+        "title": (
+            _text(article.get("headline"))
+            or meta.get("og:title")
+            or meta.get("twitter:title")
+            or (head.title.strip() if head.title else None)
+        ),
+        "authors": authors,
+        "publish_date": parse_date(published),
+        "description": (
+            _text(article.get("description"))
+            or meta.get("description")
+            or meta.get("og:description")
+        ),
+        "keywords": keywords,
+    }
@@ -0,0 +1,200 @@
+import re
+import threading
+from collections import Counter
+from math import ceil
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# English prose averages about 1.3 tokens per word; the extra covers punctuation.
+TOKENS_PER_WORD = 1.4
+# Room above the requested length, so that the model can finish its last sentence.
+HEADROOM = 1.5
+MIN_TOKENS = 16
+
+SENTENCE = "sentence"
+BULLET = "bullet"
+
+# Outputs of up to this share over the requested length are accepted as they are.
+TOLERANCE = 0.1
+# A trimmed output must keep at least this share of the requested length,
+# otherwise the request is sent again.
+MIN_KEPT = 0.5
+
+COMPLIANT = "compliant"
+TRIMMED = "trimmed"
+RETRIED = "retried"
+TRUNCATED = "truncated"
+
+# Finish reason of a completion cut off by max_tokens.
+LENGTH = "length"
+
+_SENTENCE_END = re.compile(r"[.!?…][\"')\]]*(?=\s|$)")
+_BULLET_START = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s", re.MULTILINE)
+
+
+class Completion(str):
+    """
+    The text of a completion with the reason the model stopped generating it, e.g.
+    "stop", or "length" when it was cut off by max_tokens.
+    """
+
+    def __new__(cls, text: str, finish_reason: Optional[str] = None):
+        completion = super().__new__(cls, text)
+        completion.finish_reason = finish_reason
+        return completion
+
+
+def is_truncated(text: str) -> bool:
+    return getattr(text, "finish_reason", None) == LENGTH
+
+
+class OutputBudget(NamedTuple):
+    """
+    Limits of the completion of one operation.
+
+    Attributes:
+    - operation (str): Name of the operation, used to group compliance counts.
+    - max_words (int, optional): Requested length of the output in words. Longer
+                                 outputs are trimmed or requested again. Without
+                                 it, only outputs cut off by max_tokens are trimmed.
+    - max_tokens (int, optional): Cap on generated tokens sent with the request.
+    - temperature (float, optional): Sampling temperature; the API default if None.
+    - stop (Tuple[str, ...], optional): Sequences at which generation stops.
+    - boundary (str): Unit kept whole when trimming, SENTENCE or BULLET.
+    """
+
+    operation: str
+    max_words: Optional[int] = None
+    max_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+    stop: Optional[Tuple[str, ...]] = None
+    boundary: str = SENTENCE
+
+    def parameters(self) -> Dict[str, Any]:
+        """
+        Returns the completion parameters that are set, for `request_api`.
+        """
+        parameters = {
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "stop": list(self.stop) if self.stop else None,
+        }
+        return {name: value for name, value in parameters.items() if value is not None}
+
+    def complies(self, text: Optional[str]) -> bool:
+        """
+        Tells whether an output is within the budget. A missing or empty output, e.g.
+        one withheld by the content filter, has nothing to trim and complies.
+        """
+        if not text:
+            return True
+        if is_truncated(text):
+            return False
+        return self.max_words is None or count_words(text) <= self.max_words * (1 + TOLERANCE)
+
+    def trim(self, text: Optional[str], force: bool = False) -> Optional[str]:
+        """
+        Cuts the text to the last whole sentence or bullet within `max_words`, or,
+        without `max_words`, drops the unfinished last sentence or bullet of a
+        truncated text.
+
+        Returns None when that would keep less than MIN_KEPT of the requested length
+        (or nothing at all), unless `force` is set, in which case the text is cut at a
+        word instead. A missing or empty text is returned as it is.
+        """
+        if not text:
+            return text
+        if self.max_words is None:
+            ends = self._ends(text)
+            if ends:
+                return text[: ends[-1]].rstrip()
+            return text if force else None
+
+        limit = self.max_words
+        kept = [end for end in self._ends(text) if count_words(text[:end]) <= limit]
+        if kept and count_words(text[: kept[-1]]) >= limit * MIN_KEPT:
+            return text[: kept[-1]].rstrip()
+        if force:
+            return " ".join(text.split()[:limit])
+        return None
+
+    def _ends(self, text: str) -> List[int]:
+        """
+        Positions at which the text can be cut after a whole sentence or bullet. The
+        end of a truncated text is not one of them, as its last unit is unfinished.
+        """
+        if self.boundary == BULLET:
+            ends = [match.start() for match in _BULLET_START.finditer(text)]
+            if not is_truncated(text):
+                ends.append(len(text))
+        else:
+            ends = [match.end() for match in _SENTENCE_END.finditer(text)]
+        return [end for end in ends if end > 0]
+
+    def retry_prompt(self, content_user: str) -> str:
+        return f"{content_user}\n\nAnswer in at most {self.max_words} words."
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def token_cap(max_words: int) -> int:
+    """
+    Returns a max_tokens value for an output of about `max_words` words.
+    """
+    return max(MIN_TOKENS, ceil(max_words * TOKENS_PER_WORD * HEADROOM))
+
+
+def output_budget(operation: str, max_words: int = None) -> OutputBudget:
+    """
+    Returns the output budget of a Text or SocialMedia operation.
+
+    Parameters:
+    - operation (str): One of the keys of OUTPUT_POLICIES.
+    - max_words (int, optional): Requested length in words, from which the token cap
+                                 is derived.
+
+    Returns:
+    - OutputBudget: The limits of the completion.
+    """
+    budget = OUTPUT_POLICIES[operation]
+    if max_words is not None:
+        budget = budget._replace(max_words=max_words, max_tokens=token_cap(max_words))
+    return budget
+
+
+OUTPUT_POLICIES = {
+    "summarize": OutputBudget("summarize", temperature=0.3),
+    "analyze_sentiment": OutputBudget("analyze_sentiment", temperature=0.3),
+    "bullet_list": OutputBudget("bullet_list", max_tokens=400, temperature=0.3, boundary=BULLET),
+    # Tags and categories come as numbered lists, cut between items.
+    "tag_and_categorize": OutputBudget(
+        "tag_and_categorize", max_tokens=300, temperature=0, boundary=BULLET
+    ),
+    # A tweet is a single paragraph.
+    "tweet": OutputBudget("tweet", stop=("\n\n",)),
+    "facebook_post": OutputBudget("facebook_post"),
+}
+
+
+class OutputStats:
+    """
+    Counts how often the outputs of each operation complied with their budget, had
+    to be trimmed, were requested again or were returned truncated.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, outcome: str) -> None:
+        with self._lock:
+            self.counts[(operation, outcome)] += 1
+
+    def compliance_rate(self, operation: str) -> float:
+        with self._lock:
+            total = sum(
+                self.counts[(operation, outcome)]
+                for outcome in (COMPLIANT, TRIMMED, RETRIED, TRUNCATED)
+            )
+            return self.counts[(operation, COMPLIANT)] / total if total else 1.0
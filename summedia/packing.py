@@ -0,0 +1,170 @@
+import asyncio
+import json
+import re
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from summedia.tokens import estimate_tokens
+
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def pack_items(texts: Sequence[str], indices: Sequence[int], token_budget: int) -> List[List[int]]:
+    """
+    Groups items into batches whose estimated input size stays within a token budget.
+
+    Items are kept in their original order; an item larger than the budget is put
+    into a batch of its own.
+
+    Parameters:
+    - texts (Sequence[str]): All texts of the request.
+    - indices (Sequence[int]): Indices of the texts to be packed.
+    - token_budget (int): Maximum number of estimated tokens of the items in one batch.
+
+    Returns:
+    - List[List[int]]: Batches of text indices.
+    """
+    batches = []
+    batch: List[int] = []
+    used = 0
+    for index in indices:
+        # The id and delimiters of an item take a few tokens on top of its text.
+        size = estimate_tokens(texts[index]) + 4
+        if batch and used + size > token_budget:
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(index)
+        used += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def format_items(texts: Sequence[str]) -> str:
+    """
+    Formats texts as numbered items, e.g. "[1] first text".
+    """
+    return "\n".join(f"[{number}] {' '.join(text.split())}" for number, text in enumerate(texts, 1))
+
+
+def parse_packed_response(response: Optional[str], count: int) -> Dict[int, str]:
+    """
+    Extracts the results of numbered items from a JSON object in the response.
+
+    Parameters:
+    - response (str): Response of the model, expected to contain an object mapping
+                      item numbers to results, e.g. {"1": "...", "2": "..."}.
+    - count (int): Number of items that were sent.
+
+    Returns:
+    - Dict[int, str]: Results by zero-based item position. Missing, empty or
+                      malformed items are left out.
+    """
+    match = JSON_OBJECT_PATTERN.search(response or "")
+    if not match:
+        return {}
+    try:
+        parsed = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    results = {}
+    for key, value in parsed.items():
+        if not str(key).isdigit() or not 1 <= int(key) <= count:
+            continue
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+        if isinstance(value, str) and value.strip():
+            results[int(key) - 1] = value.strip()
+    return results
+
+
+def run_packed(
+    texts: Sequence[str],
+    send: Callable[[List[str]], str],
+    token_budget: int = 2000,
+    max_retries: int = 1,
+    fallback: Callable[[str], str] = None,
+) -> List[Optional[str]]:
+    """
+    Processes many short texts with as few requests as possible.
+
+    Texts are packed into batches within the token budget and each batch is sent
+    as one request. Items that are missing or malformed in the response, or whose
+    request failed, are packed again and retried up to `max_retries` times; items
+    still missing after that are processed one by one with `fallback`.
+
+    Parameters:
+    - texts (Sequence[str]): Texts to be processed.
+    - send (Callable[[List[str]], str]): Sends one batch of texts, returns the response.
+    - token_budget (int, optional): Maximum estimated tokens of the texts of one
+                                    request. Defaults to 2000.
+    - max_retries (int, optional): Number of packed retries of missing items.
+                                   Defaults to 1.
+    - fallback (Callable[[str], str], optional): Processes a single text.
+
+    Returns:
+    - List[Optional[str]]: Result of each text, None where no result was obtained.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    pending = list(range(len(texts)))
+
+    for _ in range(max_retries + 1):
+        if not pending:
+            break
+        for batch in pack_items(texts, pending, token_budget):
+            try:
+                response = send([texts[index] for index in batch])
+            except Exception as e:
+                print(f"Error: {e}")
+                continue
+            _store_results(results, batch, response)
+        pending = [index for index in pending if results[index] is None]
+
+    if fallback is not None:
+        for index in pending:
+            results[index] = fallback(texts[index])
+    return results
+
+
+async def run_packed_async(
+    texts: Sequence[str],
+    send: Callable[[List[str]], Awaitable[str]],
+    token_budget: int = 2000,
+    max_retries: int = 1,
+    fallback: Callable[[str], Awaitable[str]] = None,
+) -> List[Optional[str]]:
+    """
+    An asyncio counterpart of `run_packed`, taking coroutine functions as `send` and
+    `fallback`. The batches of each round, and the fallback requests, are sent
+    concurrently.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    pending = list(range(len(texts)))
+
+    for _ in range(max_retries + 1):
+        if not pending:
+            break
+        batches = pack_items(texts, pending, token_budget)
+        responses = await asyncio.gather(
+            *(send([texts[index] for index in batch]) for batch in batches),
+            return_exceptions=True,
+        )
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                print(f"Error: {response}")
+                continue
+            _store_results(results, batch, response)
+        pending = [index for index in pending if results[index] is None]
+
+    if fallback is not None:
+        fallbacks = await asyncio.gather(*(fallback(texts[index]) for index in pending))
+        for index, result in zip(pending, fallbacks):
+            results[index] = result
+    return results
+
+
+def _store_results(results: List[Optional[str]], batch: List[int], response: str) -> None:
+    for position, result in parse_packed_response(response, len(batch)).items():
+        results[batch[position]] = result
@@ -0,0 +1,212 @@
+from typing import List, Tuple
+
+from summedia.level import SimplificationLevel
+from summedia.packing import format_items
+
+# Each function returns the system and user message of one Text or SocialMedia
+# operation, so that the synchronous and asynchronous classes send the same prompts.
+
+
+def summarize(text: str, max_number_words: int) -> Tuple[str, str]:
+    """Prompts for summarizing a text within a number of words."""
+    content_system = (
+        f"You are a helpful assistant that summarizes "
+        f"long texts into a text with a maximum of {max_number_words} words. "
+        f"All summaries must be in English."
+    )
+
+    content_user = (
+        f"Summarize the following text into a concise version, "
+        f"using a maximum of {max_number_words} words. "
+        f"Ensure the summary is in English. The text to summarize is: {text}"
+    )
+    return content_system, content_user
+
+
+def update_summary(
+    summary: str,
+    changed: List[str],
+    removed: List[str],
+    max_number_words: int,
+) -> Tuple[str, str]:
+    """Prompts for updating a summary with the changed paragraphs of an article."""
+    content_system = (
+        f"You are a helpful assistant that keeps summaries of developing news "
+        f"articles up to date. Summaries have a maximum of {max_number_words} words. "
+        f"All summaries must be in English."
+    )
+
+    updates = "\n\n".join(changed) if changed else "(none)"
+    removals = "\n\n".join(removed) if removed else "(none)"
+    content_user = (
+        f"The article was updated since the summary below was written. "
+        f"{len(changed)} paragraphs were added or changed and {len(removed)} were removed. "
+        f"Update the summary with the new information, dropping statements that only "
+        f"the removed paragraphs supported or that the new paragraphs contradict, "
+        f"using a maximum of {max_number_words} words. "
+        f"Ensure the summary is in English. Return only the updated summary.\n\n"
+        f"Previous summary: {summary}\n\n"
+        f"New or changed paragraphs: {updates}\n\n"
+        f"Removed paragraphs: {removals}"
+    )
+    return content_system, content_user
+
+
+def analyze_sentiment(text: str, max_number_words: int) -> Tuple[str, str]:
+    """Prompts for analyzing the sentiment of a text."""
+    content_system = (
+        f"You are a helpful assistant that analyzes sentiment in given texts. "
+        f"All analyses must be provided in English, and you can analyze"
+        f" text with up to {max_number_words} words."
+    )
+
+    content_user = (
+        f"Analyze the sentiment of the following text, "
+        f"ensuring your analysis is in English. "
+        f"The analysis should not exceed {max_number_words} words. "
+        f"The text for sentiment analysis is: {text}"
+    )
+    return content_system, content_user
+
+
+def bullet_list(text: str) -> Tuple[str, str]:
+    """Prompts for converting a text into a bullet-point summary."""
+    content_system = (
+        "You are a helpful assistant that analyzes"
+        " the given text and provides responses in English."
+    )
+
+    content_user = (
+        f"Provide a bullet-point list summarizing the most important"
+        f" information from the given text, ensuring the summary"
+        f" is in English. The text to be summarized is: {text}"
+    )
+    return content_system, content_user
+
+
+def translate(text: str, lang: str) -> Tuple[str, str]:
+    """Prompts for translating a text into the language with the given name."""
+    content_system = "You are a helpful assistant that translate given" " text to other language."
+
+    content_user = f"Translate given text {text} to {lang} language"
+    return content_system, content_user
+
+
+def adjust_complexity(text: str, level: SimplificationLevel) -> Tuple[str, str]:
+    """Prompts for simplifying a text to a complexity level."""
+    content_system = (
+        "You are an AI trained to simplify text to different levels of complexity,"
+        " providing responses in English. "
+        "Based on the specified level, simplify the text while preserving "
+        "its main meaning. "
+        "The levels are: 'child', 'teen', 'student', 'expert'. Each level represents "
+        "a higher degree of complexity and vocabulary."
+    )
+
+    content_user = (
+        f"Simplify the following text to the '{level.value}' level, "
+        f"ensuring the simplified text is in English. "
+        f"The text should be suitable for the understanding level of a '{level.value}', "
+        f"using appropriate vocabulary and sentence structure for that level: {text}."
+    )
+    return content_system, content_user
+
+
+def tag_and_categorize(text: str) -> Tuple[str, str]:
+    """Prompts for tagging and categorizing a text."""
+    content_system = (
+        "You are an intelligent assistant trained to analyze text and "
+        "identify key themes, concepts, and categories. "
+        "Your task is to categorize the text and suggest relevant tags based"
+        " on its content."
+    )
+
+    content_user = (
+        f"Analyze the following text and categorize it into two lists: {text}. "
+        f"List one should contain relevant tags representing the main themes "
+        f"and subjects of the text. "
+        f"List two should contain categories that the text belongs to. "
+        f"Return the results as two separate numbered lists: tags and categories."
+    )
+    return content_system, content_user
+
+
+def tweet(text: str, word_length: int) -> Tuple[str, str]:
+    """Prompts for condensing a text into a tweet."""
+    content_system = (
+        "You are a helpful assistant that condenses long texts into tweets."
+        " All responses must be in English."
+    )
+
+    content_user = (
+        f"Condense the following text into a tweet, ensuring the output is in English. "
+        f"Tailor the content to fit within {word_length} words, while "
+        f"focusing on retaining key messages and readability: {text}"
+    )
+    return content_system, content_user
+
+
+def facebook_post(text: str, word_length: int) -> Tuple[str, str]:
+    """Prompts for turning a text into a Facebook post."""
+    content_system = (
+        "You are an expert assistant skilled in preparing and "
+        "optimizing texts for Facebook posts. All responses must be in English."
+    )
+
+    content_user = (
+        f"Please format and optimize the following text for a "
+        f"Facebook post, ensuring it is engaging, concise, and in English. "
+        f"Tailor the content to fit within {word_length} words, "
+        f"focusing on retaining key messages and readability: {text}"
+    )
+    return content_system, content_user
+
+
+def packed(task: str, texts: List[str]) -> Tuple[str, str]:
+    """Prompts for applying one task to many numbered texts in a single request."""
+    content_system = (
+        "You are a helpful assistant that processes numbered items independently of "
+        "each other. Respond only with a JSON object that maps the number of every "
+        "item to its result."
+    )
+
+    content_user = (
+        f"{task} Process each of the following {len(texts)} items on its own and return "
+        f'a JSON object like {{"1": "result of item 1", "2": "result of item 2"}}.\n\n'
+        f"{format_items(texts)}"
+    )
+    return content_system, content_user
+
+
+def packed_translate(texts: List[str], lang: str) -> Tuple[str, str]:
+    """Prompts for translating many short texts into the language with the given name."""
+    return packed(f"Translate the text of each item to {lang} language.", texts)
+
+
+def packed_analyze_sentiment(texts: List[str], max_number_words: int) -> Tuple[str, str]:
+    """Prompts for analyzing the sentiment of many short texts."""
+    return packed(
+        f"Analyze the sentiment of the text of each item, ensuring your analysis is in "
+        f"English and does not exceed {max_number_words} words per item.",
+        texts,
+    )
+
+
+def packed_tag_and_categorize(texts: List[str]) -> Tuple[str, str]:
+    """Prompts for tagging and categorizing many short texts."""
+    return packed(
+        'Analyze the text of each item and return an object with two lists: "tags" '
+        "with relevant tags representing its main themes and subjects, and "
+        '"categories" with the categories it belongs to.',
+        texts,
+    )
+
+
+def packed_sentiment_labels(texts: List[str]) -> Tuple[str, str]:
+    """Prompts for classifying the sentiment of many short texts as structured results."""
+    return packed(
+        'Classify the sentiment of the text of each item and return an object with "label" '
+        '(one of "positive", "negative" or "neutral"), "score" (a number from -1, most '
+        'negative, to 1, most positive) and "confidence" (a number from 0 to 1).',
+        texts,
+    )
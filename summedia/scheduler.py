@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, unique
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from summedia.stats import ModelStats
+
+
+@unique
+class Priority(Enum):
+    INTERACTIVE: int = 0
+    BATCH: int = 1
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised when a request is dropped because it can no longer finish before its deadline.
+    """
+
+
+class RequestContext(NamedTuple):
+    priority: Priority = Priority.INTERACTIVE
+    tenant: str = "default"
+    deadline: Optional[float] = None
+    degrade: Optional[Callable[[], Any]] = None
+
+
+_context: ContextVar[RequestContext] = ContextVar("summedia_request_context")
+
+
+@contextmanager
+def scheduling(
+    priority: Priority = Priority.INTERACTIVE,
+    tenant: str = "default",
+    timeout: float = None,
+    degrade: Callable[[], Any] = None,
+):
+    """
+    Sets how requests made inside the block are scheduled.
+
+    Parameters:
+    - priority (Priority, optional): Priority class of the requests. Defaults to
+                                     INTERACTIVE.
+    - tenant (str, optional): Queue the requests are fairly shared within their
+                              priority class. Defaults to "default".
+    - timeout (float, optional): Seconds from now by which the requests must finish.
+                                 Requests that cannot make it are not sent.
+    - degrade (Callable, optional): Called to produce the result of a request that
+                                    missed its deadline, instead of raising
+                                    DeadlineExceeded.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    token = _context.set(RequestContext(priority, tenant, deadline, degrade))
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class _Ticket:
+    def __init__(self, context: RequestContext):
+        self.context = context
+        self.enqueued = time.monotonic()
+        self.event = threading.Event()
+        self.granted = False
+        self.expired = False
+
+
+class RequestScheduler:
+    """
+    Admits API requests by priority, deadline and tenant share.
+
+    At most `max_concurrency` requests run at a time; the others wait in queues.
+    When a slot frees up, it goes to the highest priority class with waiting
+    requests, and within that class to the tenant with the smallest weighted
+    share of the admitted requests (stride scheduling). Requests whose deadline
+    will pass before a typical request finishes are dropped instead of being sent.
+    Priority, tenant and deadline are taken from the `scheduling` context of the
+    calling code.
+
+    Attributes:
+    - max_concurrency (int): Maximum number of requests running at a time.
+    - tenant_weights (Dict[str, float]): Relative share of each tenant, 1 by default.
+    - wait_times (Dict[Priority, ModelStats]): Queueing time statistics per class.
+    - service_times (ModelStats): Duration statistics of the admitted requests.
+    """
+
+    def __init__(self, max_concurrency: int = 8, tenant_weights: Dict[str, float] = None):
+        self.max_concurrency = max_concurrency
+        self.tenant_weights = dict(tenant_weights or {})
+        self.wait_times = {priority: ModelStats() for priority in Priority}
+        self.service_times = ModelStats()
+        self.completed = 0
+        self.dropped = 0
+        self.degraded = 0
+        self._queues = {priority: {} for priority in Priority}
+        self._passes: Dict[str, float] = {}
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def run(self, function: Callable, *args, **kwargs):
+        """
+        Calls the function once the scheduler admits it and returns its result.
+
+        Raises:
+        - DeadlineExceeded: If the request missed its deadline and the context has
+                            no degrade function.
+        """
+        ticket = _Ticket(_context.get(RequestContext()))
+        with self._lock:
+            self._enqueue(ticket)
+            self._dispatch()
+
+        deadline = ticket.context.deadline
+        ticket.event.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+        with self._lock:
+            if not ticket.granted:
+                if not ticket.expired:
+                    self._remove(ticket)
+                    ticket.expired = True
+                self.dropped += 1
+
+        if ticket.expired:
+            if ticket.context.degrade is not None:
+                self.degraded += 1
+                return ticket.context.degrade()
+            raise DeadlineExceeded("Request could not be completed before its deadline")
+
+        started = time.monotonic()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.service_times.record(time.monotonic() - started)
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+                self._dispatch()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns queue depths, wait times and counters of the scheduler.
+        """
+        with self._lock:
+            depths = {
+                priority.name.lower(): {
+                    tenant: len(queue) for tenant, queue in tenants.items() if queue
+                }
+                for priority, tenants in self._queues.items()
+            }
+            running = self._running
+        return {
+            "running": running,
+            "queue_depth": depths,
+            "wait_time_p50": {
+                priority.name.lower(): stats.percentile(0.5)
+                for priority, stats in self.wait_times.items()
+            },
+            "wait_time_p99": {
+                priority.name.lower(): stats.percentile(0.99)
+                for priority, stats in self.wait_times.items()
+            },
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "degraded": self.degraded,
+        }
+
+    def _enqueue(self, ticket: _Ticket) -> None:
+        tenants = self._queues[ticket.context.priority]
+        tenant = ticket.context.tenant
+        if not tenants.get(tenant):
+            # A tenant returning from idle starts at the current virtual time
+            # instead of spending credit it saved while it had nothing queued.
+            active = [self._passes[name] for name, queue in tenants.items() if queue]
+            floor = min(active) if active else 0.0
+            self._passes[tenant] = max(self._passes.get(tenant, 0.0), floor)
+        tenants.setdefault(tenant, deque()).append(ticket)
+
+    def _remove(self, ticket: _Ticket) -> None:
+        queue = self._queues[ticket.context.priority].get(ticket.context.tenant)
+        if queue and ticket in queue:
+            queue.remove(ticket)
+
+    def _next_ticket(self) -> Optional[_Ticket]:
+        for priority in Priority:
+            tenants = self._queues[priority]
+            waiting = [tenant for tenant, queue in tenants.items() if queue]
+            if waiting:
+                tenant = min(waiting, key=lambda name: self._passes[name])
+                self._passes[tenant] += 1.0 / self.tenant_weights.get(tenant, 1.0)
+                return tenants[tenant].popleft()
+        return None
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_concurrency:
+            ticket = self._next_ticket()
+            if ticket is None:
+                return
+
+            now = time.monotonic()
+            deadline = ticket.context.deadline
+            if deadline is not None and now + self.service_times.mean_latency > deadline:
+                ticket.expired = True
+                ticket.event.set()
+                continue
+
+            self._running += 1
+            ticket.granted = True
+            self.wait_times[ticket.context.priority].record(now - ticket.enqueued)
+            ticket.event.set()
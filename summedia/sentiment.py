@@ -0,0 +1,340 @@
+import json
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Valence of common sentiment words, from -4 (most negative) to 4 (most positive).
+LEXICON: Dict[str, float] = {
+    "abandon": -1.9,
+    "abuse": -3.2,
+    "accident": -2.1,
+    "admire": 2.4,
+    "afraid": -2.2,
+    "agree": 1.5,
+    "alarming": -2.2,
+    "amazing": 2.8,
+    "angry": -2.3,
+    "annoying": -1.8,
+    "anxious": -1.6,
+    "appreciate": 2.1,
+    "attack": -2.1,
+    "awesome": 3.1,
+    "awful": -2.9,
+    "bad": -2.5,
+    "beautiful": 2.9,
+    "benefit": 1.9,
+    "best": 3.2,
+    "better": 1.9,
+    "boring": -1.3,
+    "brilliant": 2.8,
+    "broken": -1.9,
+    "calm": 1.3,
+    "catastrophe": -3.4,
+    "celebrate": 2.7,
+    "cheap": -0.5,
+    "clean": 1.7,
+    "collapse": -2.2,
+    "comfortable": 1.9,
+    "concern": -1.2,
+    "confident": 2.2,
+    "confused": -1.3,
+    "corrupt": -3.0,
+    "crash": -1.7,
+    "crisis": -3.1,
+    "critical": -1.3,
+    "cruel": -2.8,
+    "damage": -2.2,
+    "danger": -2.4,
+    "dead": -3.3,
+    "death": -2.9,
+    "decline": -1.1,
+    "delight": 2.9,
+    "delighted": 3.1,
+    "delicious": 2.7,
+    "destroy": -2.7,
+    "disappointed": -1.9,
+    "disappointing": -2.2,
+    "disaster": -3.1,
+    "disgusting": -2.9,
+    "dislike": -1.6,
+    "effective": 2.1,
+    "enjoy": 2.2,
+    "enjoyed": 2.3,
+    "excellent": 2.7,
+    "excited": 2.1,
+    "exciting": 2.2,
+    "fail": -2.5,
+    "failed": -2.3,
+    "failure": -2.3,
+    "fair": 1.3,
+    "fake": -2.1,
+    "fantastic": 2.6,
+    "fear": -2.2,
+    "fine": 0.8,
+    "fraud": -2.8,
+    "free": 1.8,
+    "fun": 2.3,
+    "funny": 1.9,
+    "glad": 2.0,
+    "good": 1.9,
+    "gorgeous": 3.0,
+    "great": 3.1,
+    "happy": 2.7,
+    "harm": -2.5,
+    "hate": -2.7,
+    "hated": -3.2,
+    "healthy": 1.7,
+    "helpful": 1.8,
+    "hope": 1.9,
+    "hopeful": 2.3,
+    "horrible": -2.5,
+    "hurt": -2.4,
+    "ideal": 2.4,
+    "illegal": -2.6,
+    "impressive": 2.5,
+    "improve": 1.9,
+    "improved": 2.1,
+    "incredible": 2.6,
+    "injured": -2.2,
+    "innovative": 1.9,
+    "interesting": 1.7,
+    "kill": -3.7,
+    "killed": -3.5,
+    "lose": -1.6,
+    "loss": -1.3,
+    "love": 3.2,
+    "loved": 2.9,
+    "lovely": 2.8,
+    "luck": 2.0,
+    "mess": -1.5,
+    "miss": -0.6,
+    "nice": 1.8,
+    "outrage": -2.3,
+    "pain": -2.3,
+    "perfect": 2.7,
+    "pleasant": 2.3,
+    "poor": -2.1,
+    "positive": 2.6,
+    "problem": -1.7,
+    "progress": 1.8,
+    "proud": 2.1,
+    "recommend": 1.5,
+    "recovery": 1.4,
+    "reliable": 1.9,
+    "ridiculous": -1.5,
+    "risk": -1.1,
+    "sad": -2.1,
+    "safe": 1.9,
+    "scandal": -1.9,
+    "scared": -1.9,
+    "shock": -1.6,
+    "slow": -0.9,
+    "strong": 2.3,
+    "stupid": -2.4,
+    "success": 2.7,
+    "successful": 2.8,
+    "suffer": -2.5,
+    "super": 2.9,
+    "support": 1.7,
+    "terrible": -2.1,
+    "terrific": 2.1,
+    "thank": 1.5,
+    "thanks": 1.9,
+    "threat": -2.4,
+    "tragedy": -3.4,
+    "tragic": -3.1,
+    "trust": 2.3,
+    "ugly": -2.3,
+    "unfair": -2.1,
+    "unhappy": -1.8,
+    "useful": 1.9,
+    "useless": -1.8,
+    "victory": 2.8,
+    "violence": -3.1,
+    "war": -2.9,
+    "weak": -1.9,
+    "win": 2.8,
+    "wonderful": 2.7,
+    "worse": -2.1,
+    "worst": -3.1,
+    "worthless": -1.9,
+    "wrong": -2.1,
+}
+
+NEGATIONS = {
+    "not",
+    "no",
+    "never",
+    "none",
+    "nobody",
+    "nothing",
+    "neither",
+    "nor",
+    "without",
+    "cannot",
+    "isn't",
+    "aren't",
+    "wasn't",
+    "weren't",
+    "don't",
+    "doesn't",
+    "didn't",
+    "won't",
+    "wouldn't",
+    "can't",
+    "couldn't",
+    "shouldn't",
+    "hardly",
+}
+
+INTENSIFIERS: Dict[str, float] = {
+    "absolutely": 1.3,
+    "completely": 1.3,
+    "deeply": 1.3,
+    "especially": 1.3,
+    "extremely": 1.4,
+    "highly": 1.3,
+    "incredibly": 1.4,
+    "really": 1.2,
+    "so": 1.2,
+    "totally": 1.3,
+    "truly": 1.3,
+    "very": 1.3,
+    "barely": 0.6,
+    "kinda": 0.7,
+    "slightly": 0.6,
+    "somewhat": 0.7,
+    "partly": 0.7,
+    "little": 0.7,
+}
+
+# Negated words flip and lose part of their weight ("not good" is milder than "bad").
+NEGATION_FACTOR = -0.74
+NEGATION_WINDOW = 3
+# Words after "but" dominate the sentiment of a sentence.
+CONTRAST_BEFORE = 0.5
+CONTRAST_AFTER = 1.5
+NORMALIZATION_ALPHA = 15.0
+NEUTRAL_BAND = 0.05
+
+LABELS = ("positive", "negative", "neutral")
+
+TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?|!")
+# Typographic apostrophes, common in scraped news, so that "don’t" stays one token.
+APOSTROPHES = dict.fromkeys(map(ord, "‘’ʼ"), "'")
+
+
+class SentimentResult(NamedTuple):
+    """
+    Sentiment of one text.
+
+    Attributes:
+    - label (str): "positive", "negative" or "neutral".
+    - score (float): Polarity from -1 (most negative) to 1 (most positive).
+    - confidence (float): Confidence of the label from 0 to 1.
+    - source (str): "local" for the lexicon classifier, "api" for the model.
+    """
+
+    label: str
+    score: float
+    confidence: float
+    source: str
+
+
+def sentiment_label(score: float) -> str:
+    if score >= NEUTRAL_BAND:
+        return "positive"
+    if score <= -NEUTRAL_BAND:
+        return "negative"
+    return "neutral"
+
+
+def score_sentiments(texts: Sequence[str]) -> List[SentimentResult]:
+    """
+    Scores the sentiment of a batch of texts with a lexicon and rules.
+
+    Words are looked up in the lexicon once; negations (within three words before
+    a sentiment word), intensifiers, "but" contrasts and exclamation marks are then
+    applied to all words of the batch at once with array operations.
+
+    The confidence is high when the text contains sentiment words that agree with
+    each other and low when it has none or mixes positive and negative ones.
+
+    Parameters:
+    - texts (Sequence[str]): Texts to be scored.
+
+    Returns:
+    - List[SentimentResult]: Sentiment of each text, in the order of the input.
+    """
+    count = len(texts)
+    tokens_per_text = [TOKEN_PATTERN.findall(text.lower().translate(APOSTROPHES)) for text in texts]
+    tokens = [token for text_tokens in tokens_per_text for token in text_tokens]
+    document = np.repeat(np.arange(count), [len(text_tokens) for text_tokens in tokens_per_text])
+
+    valence = np.fromiter((LEXICON.get(token, 0.0) for token in tokens), float, len(tokens))
+    boost = np.fromiter((INTENSIFIERS.get(token, 1.0) for token in tokens), float, len(tokens))
+    negation = np.fromiter((token in NEGATIONS for token in tokens), bool, len(tokens))
+    contrast = np.fromiter((token == "but" for token in tokens), bool, len(tokens))
+    exclamation = np.fromiter((token == "!" for token in tokens), bool, len(tokens))
+
+    position = np.arange(len(tokens))
+    first_token = np.searchsorted(document, document)
+
+    # An intensifier scales the word right after it within the same text.
+    previous_boost = np.concatenate(([1.0], boost[:-1]))
+    previous_boost[position == first_token] = 1.0
+
+    # A word is negated when a negation occurs in the preceding window of its text.
+    negations_seen = np.concatenate(([0], np.cumsum(negation)))
+    window_start = np.maximum(position - NEGATION_WINDOW, first_token)
+    negated = negations_seen[position] - negations_seen[window_start] > 0
+
+    # Words before the last "but" of a text count less, words after it count more.
+    contrast_seen = np.concatenate(([0], np.cumsum(contrast)))
+    contrast_total = np.bincount(document, weights=contrast, minlength=count)
+    contrasts_before = contrast_seen[position] - contrast_seen[first_token]
+    before_last_contrast = contrasts_before < contrast_total[document]
+    weight = np.where(before_last_contrast, CONTRAST_BEFORE, 1.0)
+    weight[(contrast_total[document] > 0) & ~before_last_contrast] = CONTRAST_AFTER
+
+    contribution = valence * previous_boost * np.where(negated, NEGATION_FACTOR, 1.0) * weight
+    positive = np.bincount(document, weights=np.maximum(contribution, 0), minlength=count)
+    negative = np.bincount(document, weights=np.minimum(contribution, 0), minlength=count)
+    hits = np.bincount(document, weights=valence != 0, minlength=count)
+    exclamations = np.minimum(np.bincount(document, weights=exclamation, minlength=count), 4)
+
+    total = positive + negative
+    total = total + np.sign(total) * exclamations * 0.292
+    score = total / np.sqrt(total * total + NORMALIZATION_ALPHA)
+
+    magnitude = positive - negative
+    agreement = np.divide(np.abs(total), magnitude, out=np.zeros(count), where=magnitude > 0)
+    confidence = np.where(hits > 0, np.minimum(1.0, agreement) * np.abs(score), 0.0)
+
+    return [
+        SentimentResult(
+            sentiment_label(value), round(float(value), 4), round(float(conf), 4), "local"
+        )
+        for value, conf in zip(score, confidence)
+    ]
+
+
+def parse_sentiment_result(response: Optional[str]) -> Optional[SentimentResult]:
+    """
+    Reads a model result like {"label": "positive", "score": 0.8, "confidence": 0.9}.
+
+    Returns:
+    - Optional[SentimentResult]: The result with source "api", or None when the
+                                 response is missing or malformed.
+    """
+    try:
+        parsed = json.loads(response)
+        label = str(parsed["label"]).lower()
+        score = min(1.0, max(-1.0, float(parsed["score"])))
+        confidence = min(1.0, max(0.0, float(parsed.get("confidence", 1.0))))
+    except (TypeError, ValueError, KeyError, AttributeError):
+        return None
+    if label not in LABELS:
+        return None
+    return SentimentResult(label, score, confidence, "api")
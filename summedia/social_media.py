@@ -1,4 +1,6 @@
-from summedia.api import APIRequester
+from summedia import prompts
+from summedia.api import APIRequester, AsyncAPIRequester
+from summedia.output import output_budget
 
 
 class SocialMedia(APIRequester):
@@ -36,22 +38,13 @@ class SocialMedia(APIRequester):
         - str: The condensed text suitable for a tweet.
         """
 
-        content_system = (
-            "You are a helpful assistant that condenses long texts into tweets."
-            " All responses must be in English."
-        )
+        text = self._compact(text)
 
-        content_user = (
-            f"Condense the following text into a tweet, ensuring the output is in English. "
-            f"Tailor the content to fit within {word_length} words, while "
-            f"focusing on retaining key messages and readability: {text}"
-        )
+        content_system, content_user = prompts.tweet(text, word_length)
 
         # Retrieve the condensed text from the API
-        condensed_text = (
-            super().request_api(content_system, content_user, model_type)
-            if model_type
-            else super().request_api(content_system, content_user)
+        condensed_text = self._bounded_request(
+            content_system, content_user, model_type, output_budget("tweet", word_length)
         )
 
         return condensed_text
@@ -79,19 +72,44 @@ class SocialMedia(APIRequester):
         - The response from the API call to post the text to Facebook.
         """
 
-        content_system = (
-            "You are an expert assistant skilled in preparing and "
-            "optimizing texts for Facebook posts. All responses must be in English."
+        text = self._compact(text)
+
+        content_system, content_user = prompts.facebook_post(text, word_length)
+
+        return self._bounded_request(
+            content_system, content_user, model_type, output_budget("facebook_post", word_length)
         )
 
-        content_user = (
-            f"Please format and optimize the following text for a "
-            f"Facebook post, ensuring it is engaging, concise, and in English. "
-            f"Tailor the content to fit within {word_length} words, "
-            f"focusing on retaining key messages and readability: {text}"
+
+class AsyncSocialMedia(AsyncAPIRequester):
+    """
+    An asyncio counterpart of SocialMedia.
+
+    Every method takes the same arguments, sends the same prompts and returns the
+    same results as the SocialMedia method of the same name, but has to be awaited.
+    """
+
+    async def condense_text_to_tweet(
+        self, text: str, model_type: str = None, word_length: int = 50
+    ) -> str:
+        text = self._compact(text)
+
+        content_system, content_user = prompts.tweet(text, word_length)
+
+        return await self._bounded_request(
+            content_system, content_user, model_type, output_budget("tweet", word_length)
         )
 
-        if model_type:
-            return super().request_api(content_system, content_user, model_type)
-        else:
-            return super().request_api(content_system, content_user)
+    async def post_to_facebook(
+        self,
+        text: str,
+        model_type: str = None,
+        word_length: int = 50,
+    ):
+        text = self._compact(text)
+
+        content_system, content_user = prompts.facebook_post(text, word_length)
+
+        return await self._bounded_request(
+            content_system, content_user, model_type, output_budget("facebook_post", word_length)
+        )
@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+
+
+class ModelStats:
+    """
+    Collects rolling latency, error and cost statistics for a single model.
+
+    Latencies are kept in a bounded window so percentiles follow recent behaviour
+    of the model rather than its whole history.
+
+    Attributes:
+    - calls (int): Number of successful requests recorded.
+    - errors (int): Number of failed requests recorded.
+    - total_tokens (int): Sum of (estimated) tokens used by successful requests.
+    - total_cost (float): Sum of (estimated) cost of successful requests in USD.
+    """
+
+    def __init__(self, window: int = 200):
+        self.calls = 0
+        self.errors = 0
+        self.total_tokens = 0
+        self.total_cost = 0.0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, tokens: int = 0, cost: float = 0.0) -> None:
+        with self._lock:
+            self.calls += 1
+            self.total_tokens += tokens
+            self.total_cost += cost
+            self._latencies.append(latency)
+
+    def record_error(self, latency: float = None) -> None:
+        """
+        Records a failed request. The time it took before failing, when given, is
+        kept with the latencies, so that timeouts count towards the percentiles.
+        """
+        with self._lock:
+            self.errors += 1
+            if latency is not None:
+                self._latencies.append(latency)
+
+    @property
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def mean_latency(self) -> float:
+        with self._lock:
+            if not self._latencies:
+                return 0.0
+            return sum(self._latencies) / len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        total = self.calls + self.errors
+        return self.errors / total if total else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Returns the latency below which a fraction q (0-1) of recent requests finished.
+
+        Returns 0.0 when no latency has been recorded yet.
+        """
+        with self._lock:
+            ordered = sorted(self._latencies)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+        return ordered[index]
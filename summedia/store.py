@@ -0,0 +1,299 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+from newspaper import Article
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+INDEX_DIRECTORY = "_index"
+# Rows per Parquet row group; a point lookup reads one row group.
+ROW_GROUP_SIZE = 1024
+# Rows per row group of the index files, which are sorted by URL hash.
+INDEX_ROW_GROUP_SIZE = 4096
+
+if pa is not None:
+    ARTICLE_SCHEMA = pa.schema(
+        [
+            ("url", pa.string()),
+            ("url_hash", pa.uint64()),
+            ("title", pa.string()),
+            ("authors", pa.list_(pa.string())),
+            ("publish_date", pa.timestamp("us", tz="UTC")),
+            ("text", pa.string()),
+            ("images", pa.list_(pa.string())),
+            ("meta_description", pa.string()),
+            ("meta_keywords", pa.string()),
+            ("analysis", pa.map_(pa.string(), pa.string())),
+            ("fetched_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    INDEX_SCHEMA = pa.schema(
+        [
+            ("url_hash", pa.uint64()),
+            ("path", pa.string()),
+            ("row_group", pa.int32()),
+            ("row", pa.int64()),
+        ]
+    )
+
+
+def url_hash(url: str) -> int:
+    """
+    Returns a stable 64-bit hash of a URL, used as the key of the store index.
+    """
+    return int.from_bytes(hashlib.sha1(url.encode("utf-8")).digest()[:8], "big")
+
+
+def record_from_article(article: Article, analysis: Dict[str, str] = None) -> Dict[str, Any]:
+    """
+    Builds a store record from a downloaded and parsed newspaper Article.
+
+    Parameters:
+    - article (Article): Article after `download()` and `parse()`.
+    - analysis (Dict[str, str], optional): Results of Text methods to keep with the
+                                           article, e.g. {"summary": ...}.
+
+    Returns:
+    - Dict[str, Any]: Record accepted by ArticleStore.append.
+    """
+    soup = BeautifulSoup(article.html or "", "html.parser")
+    images = []
+    for img in soup.find_all("img"):
+        src = img.get("src", "")
+        if src.startswith("http") and src not in images:
+            images.append(src)
+
+    keywords = article.meta_keywords
+    return {
+        "url": article.url,
+        "title": article.title,
+        "authors": list(article.authors),
+        "publish_date": article.publish_date,
+        "text": article.text,
+        "images": images,
+        "meta_description": article.meta_description or None,
+        "meta_keywords": ", ".join(keywords) if isinstance(keywords, list) else keywords,
+        "analysis": analysis,
+    }
+
+
+class ArticleStore:
+    """
+    A compressed columnar store of fetched and analyzed articles.
+
+    Records are appended to an in-memory buffer and written as zstd compressed
+    Parquet files partitioned by date and domain
+    (`<root>/date=YYYY-MM-DD/domain=example.com/part-*.parquet`). An index from
+    URL hash to file, row group and row, kept in `<root>/_index` as Parquet files
+    sorted by hash, serves point lookups: the hash ranges of the index row groups
+    are read once per index file, so a lookup reads one index row group per file
+    whose range holds the hash and a single row group of a single data file. Index
+    files written by other writers are picked up by the next lookup. Scans
+    read only the requested columns from memory-mapped files, so reading one field
+    of millions of articles touches a fraction of the data.
+
+    Requires the optional `pyarrow` dependency (`pip install summedia[store]`).
+
+    Attributes:
+    - root (str): Directory of the store.
+    - batch_size (int): Number of buffered records that triggers a write.
+    """
+
+    def __init__(self, root: str, batch_size: int = 10000):
+        if pa is None:
+            raise ImportError("ArticleStore requires pyarrow: pip install summedia[store]")
+        self.root = root
+        self.batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        # Hash range of every row group of each index file, keyed by file name.
+        self._index_ranges: Dict[str, List[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(root, INDEX_DIRECTORY), exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Adds a record to the store; it is written once the buffer is full or on flush.
+
+        A record needs a `url`; the other fields of ARTICLE_SCHEMA are optional.
+        Appending a URL again makes lookups return the newer record.
+        """
+        row = _normalize(record, datetime.now(timezone.utc))
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to their partitions and updates the index.
+        """
+        with self._lock:
+            records, self._buffer = self._buffer, []
+            if not records:
+                return
+
+            partitions: Dict[tuple, List[Dict[str, Any]]] = {}
+            sequences: Dict[tuple, List[int]] = {}
+            for sequence, record in enumerate(records):
+                row = dict(record)
+                if row["analysis"] is not None:
+                    row["analysis"] = list(row["analysis"].items())
+                key = (_partition_date(row), urlparse(row["url"]).netloc or "unknown")
+                partitions.setdefault(key, []).append(row)
+                sequences.setdefault(key, []).append(sequence)
+
+            index_rows = [None] * len(records)
+            for (date, domain), rows in partitions.items():
+                directory = os.path.join(self.root, f"date={date}", f"domain={domain}")
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, f"part-{uuid.uuid4().hex}.parquet")
+                table = pa.Table.from_pylist(rows, schema=ARTICLE_SCHEMA)
+                pq.write_table(table, path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+
+                relative_path = os.path.relpath(path, self.root)
+                for position, (sequence, row) in enumerate(zip(sequences[(date, domain)], rows)):
+                    index_rows[sequence] = {
+                        "url_hash": row["url_hash"],
+                        "path": relative_path,
+                        "row_group": position // ROW_GROUP_SIZE,
+                        "row": position % ROW_GROUP_SIZE,
+                    }
+
+            # Index files sort by write time, so newer records of a URL win on lookup.
+            index_name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex}.parquet"
+            index_path = os.path.join(self.root, INDEX_DIRECTORY, index_name)
+            # Index rows are in append order and the sort is stable, so the last
+            # record of a URL appended before this flush stays last.
+            index = pa.Table.from_pylist(index_rows, schema=INDEX_SCHEMA).sort_by("url_hash")
+            pq.write_table(index, index_path, row_group_size=INDEX_ROW_GROUP_SIZE)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the latest record stored for a URL, or None if there is none.
+        """
+        key = url_hash(url)
+        with self._lock:
+            for record in reversed(self._buffer):
+                if record["url"] == url:
+                    return dict(record)
+        location = self._locate(key)
+        if location is None:
+            return None
+        path, row_group, row = location
+        parquet_file = pq.ParquetFile(os.path.join(self.root, path), memory_map=True)
+        record = parquet_file.read_row_group(row_group).slice(row, 1).to_pylist()[0]
+        if record["url"] != url:
+            return None
+        if record["analysis"] is not None:
+            record["analysis"] = dict(record["analysis"])
+        return record
+
+    def scan(self, columns: List[str] = None, filter=None) -> Iterator["pa.RecordBatch"]:
+        """
+        Streams record batches of the written records.
+
+        Parameters:
+        - columns (List[str], optional): Columns to read; all columns by default.
+                                         The partition columns `date` and `domain`
+                                         can be selected too.
+        - filter (pyarrow.compute.Expression, optional): Row filter, e.g.
+                 `pyarrow.dataset.field("domain") == "example.com"`. Filters on the
+                 partition columns skip whole directories.
+
+        Returns:
+        - Iterator[pyarrow.RecordBatch]: Batches of the matching records.
+        """
+        yield from self.dataset().to_batches(columns=columns, filter=filter)
+
+    def read(self, columns: List[str] = None, filter=None) -> "pa.Table":
+        """
+        Reads the matching records into one table, see `scan`.
+        """
+        return self.dataset().to_table(columns=columns, filter=filter)
+
+    def dataset(self) -> "ds.Dataset":
+        return ds.dataset(
+            self.root,
+            format="parquet",
+            partitioning="hive",
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+        )
+
+    def _locate(self, key: int) -> Optional[Tuple[str, int, int]]:
+        """
+        Finds the file, row group and row of the latest record with a URL hash.
+        """
+        directory = os.path.join(self.root, INDEX_DIRECTORY)
+        for name in sorted(os.listdir(directory), reverse=True):
+            path = os.path.join(directory, name)
+            ranges = self._index_ranges.get(name)
+            if ranges is None:
+                ranges = _hash_ranges(pq.ParquetFile(path).metadata)
+                self._index_ranges[name] = ranges
+
+            candidates = [group for group, (low, high) in enumerate(ranges) if low <= key <= high]
+            if not candidates:
+                continue
+            index = pq.ParquetFile(path, memory_map=True).read_row_groups(candidates)
+            matches = index.filter(pc.equal(index["url_hash"], pa.scalar(key, pa.uint64())))
+            if matches.num_rows:
+                location = matches.slice(matches.num_rows - 1).to_pylist()[0]
+                return location["path"], location["row_group"], location["row"]
+        return None
+
+
+def _hash_ranges(metadata: "pq.FileMetaData") -> List[Tuple[int, int]]:
+    """
+    Returns the smallest and largest URL hash of each row group of an index file.
+    """
+    column = INDEX_SCHEMA.get_field_index("url_hash")
+    ranges = []
+    for group in range(metadata.num_row_groups):
+        statistics = metadata.row_group(group).column(column).statistics
+        ranges.append((statistics.min, statistics.max))
+    return ranges
+
+
+def _normalize(record: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """
+    Returns a record with every field of ARTICLE_SCHEMA, its URL hash, fetch time and
+    timezone-aware dates, as it is read back from the store.
+    """
+    row = {name: record.get(name) for name in ARTICLE_SCHEMA.names}
+    row["url_hash"] = url_hash(row["url"])
+    row["fetched_at"] = row["fetched_at"] or now
+    for name in ("publish_date", "fetched_at"):
+        value = row[name]
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value is not None:
+            value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+            row[name] = value.astimezone(timezone.utc)
+    if row["analysis"] is not None:
+        row["analysis"] = dict(row["analysis"])
+    return row
+
+
+def _partition_date(row: Dict[str, Any]) -> str:
+    return (row["publish_date"] or row["fetched_at"]).strftime("%Y-%m-%d")
@@ -1,8 +1,26 @@
+import asyncio
+from typing import List, Tuple
+
 from newspaper.article import ArticleException
 
-from summedia.api import APIRequester
+from summedia import prompts
+from summedia.api import APIRequester, AsyncAPIRequester
+from summedia.compaction import TextCompactor
 from summedia.fetching_data import get_text
+from summedia.hedging import HedgingPolicy
+from summedia.incremental import (
+    ArticleSnapshot,
+    SummaryStore,
+    diff_paragraphs,
+    split_paragraphs,
+)
+from summedia.language_detection import detect_language, detect_languages
 from summedia.level import SimplificationLevel
+from summedia.output import output_budget
+from summedia.packing import run_packed, run_packed_async
+from summedia.scheduler import RequestScheduler
+from summedia.sentiment import SentimentResult, parse_sentiment_result, score_sentiments
+from summedia.text_stats import simplification_level
 from summedia.translator import Language
 
 
@@ -19,16 +37,35 @@ class Text(APIRequester):
     Methods:
     - summarize_text: Summarizes a given text.
     - summary_article: Summarizes the content of an article from a URL or text.
+    - update_summary: Updates a stored summary with the changes of an article.
     - analyze_sentiment: Analyzes the sentiment of a given text.
     - to_bullet_list: Converts text into a bullet-point summary.
     - translate_text: Translates text to a specified language.
     - adjust_text_complexity: Simplifies text to a specified complexity level.
     - tag_and_categorize_text: Analyzes text for key themes and categories.
+    - translate_texts, analyze_sentiments, tag_and_categorize_texts: Process many
+      short texts packed into few requests.
+    - analyze_sentiment_cascade: Classifies sentiment locally, asking the model only
+      about uncertain texts.
 
     The class is designed to be used where text analysis and manipulation
     functionalities are required, leveraging the capabilities of an AI model.
+
+    Attributes:
+    - summary_store (SummaryStore): Previous summaries used by incremental summarization.
     """
 
+    def __init__(
+        self,
+        api_key,
+        hedging: HedgingPolicy = None,
+        scheduler: RequestScheduler = None,
+        compactor: TextCompactor = None,
+        summary_store: SummaryStore = None,
+    ):
+        super().__init__(api_key, hedging, scheduler, compactor)
+        self.summary_store = summary_store if summary_store is not None else SummaryStore()
+
     def summarize_text(
         self, text: str, max_number_words: int = 150, model_type: str = None
     ) -> str:
@@ -45,25 +82,21 @@ class Text(APIRequester):
         - str: The summarized text suitable for a max_number_words.
         """
 
-        content_system = (
-            f"You are a helpful assistant that summarizes "
-            f"long texts into a text with a maximum of {max_number_words} words. "
-            f"All summaries must be in English."
-        )
+        text = self._compact(text)
 
-        content_user = (
-            f"Summarize the following text into a concise version, "
-            f"using a maximum of {max_number_words} words. "
-            f"Ensure the summary is in English. The text to summarize is: {text}"
-        )
+        content_system, content_user = prompts.summarize(text, max_number_words)
 
-        if model_type:
-            return super().request_api(content_system, content_user, model_type)
-        else:
-            return super().request_api(content_system, content_user)
+        return self._bounded_request(
+            content_system, content_user, model_type, output_budget("summarize", max_number_words)
+        )
 
     def summary_article(
-        self, article_url: str, article_text: str = None, max_number_words: int = 150
+        self,
+        article_url: str,
+        article_text: str = None,
+        max_number_words: int = 150,
+        incremental: bool = False,
+        change_threshold: float = 0.5,
     ) -> str:
         """
         Summarizes the content of an article provided either through a URL or as a text string.
@@ -82,6 +115,13 @@ class Text(APIRequester):
                                           fetched from the URL.
             max_number_words (int, optional): The maximum number of words for the summary.
                                             Defaults to 150.
+            incremental (bool, optional): If True, an article fetched from `article_url`
+                                          that was summarized before only has its changed
+                                          paragraphs sent to the model, see `update_summary`.
+                                          Defaults to False.
+            change_threshold (float, optional): Share of changed text above which the
+                                                article is summarized from scratch in
+                                                incremental mode. Defaults to 0.5.
 
         Returns:
             str: The summarized version of the article content.
@@ -99,6 +139,10 @@ class Text(APIRequester):
         try:
             if article_url:
                 text = get_text(article_url)
+                if incremental:
+                    return self.update_summary(
+                        article_url, text, max_number_words, change_threshold
+                    )
                 summarized_text = self.summarize_text(text, max_number_words)
                 return summarized_text
             elif article_text:
@@ -108,6 +152,76 @@ class Text(APIRequester):
         except ArticleException as e:
             return f"Error summarizing the article: {str(e)}"
 
+    def update_summary(
+        self,
+        key: str,
+        text: str,
+        max_number_words: int = 150,
+        change_threshold: float = 0.5,
+        model_type: str = None,
+    ) -> str:
+        """
+        Summarizes a text that may be a newer version of a previously summarized one.
+
+        The paragraphs and the summary of every text are kept in `summary_store`
+        under the given key. On the next call only the added, changed and removed
+        paragraphs are sent to the model together with the previous summary, so the
+        input size follows the size of the change instead of the size of the article.
+        When nothing changed the stored summary is returned without calling the API,
+        and when more than `change_threshold` of the text changed since it was last
+        summarized from scratch, counting earlier incremental updates, it is
+        summarized again from scratch.
+
+        Parameters:
+        - key (str): Identifier of the article, usually its URL.
+        - text (str): Current text of the article.
+        - max_number_words (int): The max number words of summarized text.
+        - change_threshold (float): Share (0-1) of text changed since the last summary
+                                    from scratch above which the whole text is
+                                    summarized again.
+        - model_type (str, optional): The type model what you want to use.
+
+        Returns:
+        - str: The summary of the current text.
+        """
+        paragraphs = split_paragraphs(text)
+        snapshot = self.summary_store.get(key)
+
+        drift = 0.0
+        if snapshot is None:
+            summary = self.summarize_text(text, max_number_words, model_type)
+        else:
+            diff = diff_paragraphs(snapshot, paragraphs)
+            if not diff.changed and not diff.removed:
+                return snapshot.summary
+            drift = snapshot.drift + diff.change_ratio
+            if drift > change_threshold:
+                drift = 0.0
+                summary = self.summarize_text(text, max_number_words, model_type)
+            else:
+                summary = self._apply_changes_to_summary(
+                    snapshot.summary, diff.changed, diff.removed, max_number_words, model_type
+                )
+
+        self.summary_store.put(key, ArticleSnapshot(paragraphs, summary, drift))
+        return summary
+
+    def _apply_changes_to_summary(
+        self,
+        summary: str,
+        changed: list,
+        removed: list,
+        max_number_words: int,
+        model_type: str = None,
+    ) -> str:
+        content_system, content_user = prompts.update_summary(
+            summary, changed, removed, max_number_words
+        )
+
+        return self._bounded_request(
+            content_system, content_user, model_type, output_budget("summarize", max_number_words)
+        )
+
     def analyze_sentiment(
         self, text: str, max_number_words: int = 150, model_type: str = None
     ) -> str:
@@ -123,23 +237,12 @@ class Text(APIRequester):
         """
 
         try:
-            content_system = (
-                f"You are a helpful assistant that analyzes sentiment in given texts. "
-                f"All analyses must be provided in English, and you can analyze"
-                f" text with up to {max_number_words} words."
-            )
+            text = self._compact(text)
 
-            content_user = (
-                f"Analyze the sentiment of the following text, "
-                f"ensuring your analysis is in English. "
-                f"The analysis should not exceed {max_number_words} words. "
-                f"The text for sentiment analysis is: {text}"
-            )
+            content_system, content_user = prompts.analyze_sentiment(text, max_number_words)
 
-            if model_type:
-                return super().request_api(content_system, content_user, model_type)
-            else:
-                return super().request_api(content_system, content_user)
+            budget = output_budget("analyze_sentiment", max_number_words)
+            return self._bounded_request(content_system, content_user, model_type, budget)
 
         except Exception as e:
             print(f"Error: {e}")
@@ -167,21 +270,13 @@ class Text(APIRequester):
         a generic error message.
         """
         try:
-            content_system = (
-                "You are a helpful assistant that analyzes"
-                " the given text and provides responses in English."
-            )
+            text = self._compact(text)
 
-            content_user = (
-                f"Provide a bullet-point list summarizing the most important"
-                f" information from the given text, ensuring the summary"
-                f" is in English. The text to be summarized is: {text}"
-            )
+            content_system, content_user = prompts.bullet_list(text)
 
-            if model_type:
-                return super().request_api(content_system, content_user, model_type)
-            else:
-                return super().request_api(content_system, content_user)
+            return self._bounded_request(
+                content_system, content_user, model_type, output_budget("bullet_list")
+            )
 
         except Exception as e:
             print(e)
@@ -197,8 +292,9 @@ class Text(APIRequester):
         Translates the provided text to a specified language using an AI model.
 
         This method first validates and retrieves the full name of the target language
-        using the `Language` class. It then sends a request to an AI model to translate
-        the text into the desired language.
+        using the `Language` class. A text that is detected to be in the target language
+        already is returned unchanged; otherwise a request is sent to an AI model to
+        translate the text into the desired language.
 
         Parameters:
         - text (str): The text to be translated.
@@ -221,12 +317,12 @@ class Text(APIRequester):
 
             lang = Language.get_language_name(language_to_translate)
 
-            content_system = (
-                "You are a helpful assistant that translate given"
-                " text to other language."
-            )
+            if detect_language(text) == language_to_translate.lower():
+                return text
+
+            text = self._compact(text)
 
-            content_user = f"Translate given text {text} to {lang} language"
+            content_system, content_user = prompts.translate(text, lang)
 
             if model_type:
                 return super().request_api(content_system, content_user, model_type)
@@ -242,6 +338,7 @@ class Text(APIRequester):
         text: str,
         level: SimplificationLevel = SimplificationLevel.STUDENT,
         model_type: str = None,
+        skip_at_level: bool = False,
     ):
         """
         Simplifies the provided text to a specified complexity level using an AI model.
@@ -257,6 +354,9 @@ class Text(APIRequester):
                                        be simplified. Defaults to STUDENT level.
         - model_type (str, optional): The model type to use for the simplification.
                                       If not provided, a default model is used.
+        - skip_at_level (bool, optional): If True, the text is returned unchanged without
+                                          calling the API when its readability score
+                                          already matches the level. Defaults to False.
 
         Returns:
         - str: The simplified text suitable for the specified complexity level.
@@ -266,22 +366,13 @@ class Text(APIRequester):
           a generic error message.
         """
 
+        if skip_at_level and simplification_level(text) == level:
+            return text
+
         try:
-            content_system = (
-                "You are an AI trained to simplify text to different levels of complexity,"
-                " providing responses in English. "
-                "Based on the specified level, simplify the text while preserving "
-                "its main meaning. "
-                "The levels are: 'child', 'teen', 'student', 'expert'. Each level represents "
-                "a higher degree of complexity and vocabulary."
-            )
+            text = self._compact(text)
 
-            content_user = (
-                f"Simplify the following text to the '{level.value}' level, "
-                f"ensuring the simplified text is in English. "
-                f"The text should be suitable for the understanding level of a '{level.value}', "
-                f"using appropriate vocabulary and sentence structure for that level: {text}."
-            )
+            content_system, content_user = prompts.adjust_complexity(text, level)
 
             if model_type:
                 response = super().request_api(content_system, content_user, model_type)
@@ -318,28 +409,483 @@ class Text(APIRequester):
         """
 
         try:
-            content_system = (
-                "You are an intelligent assistant trained to analyze text and "
-                "identify key themes, concepts, and categories. "
-                "Your task is to categorize the text and suggest relevant tags based"
-                " on its content."
+            text = self._compact(text)
+
+            content_system, content_user = prompts.tag_and_categorize(text)
+
+            response = self._bounded_request(
+                content_system, content_user, model_type, output_budget("tag_and_categorize")
             )
 
-            content_user = (
-                f"Analyze the following text and categorize it into two lists: {text}. "
-                f"List one should contain relevant tags representing the main themes "
-                f"and subjects of the text. "
-                f"List two should contain categories that the text belongs to. "
-                f"Return the results as two separate numbered lists: tags and categories."
+            return response
+
+        except Exception as e:
+            print(e)
+            return "Error in processing the request."
+
+    def translate_texts(
+        self,
+        texts: List[str],
+        model_type: str = None,
+        language_to_translate: str = "en",
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        """
+        Translates many short texts (e.g. headlines) with as few requests as possible.
+
+        The texts are packed as numbered items into requests of up to `token_budget`
+        estimated tokens, so the prompt and request overhead is paid once per request
+        instead of once per text. Texts detected to be in the target language already
+        are not sent. Items missing or malformed in a response are retried in a new
+        packed request, then one by one with `translate_text`.
+
+        Parameters:
+        - texts (List[str]): The texts to be translated.
+        - model_type (str, optional): The model type to use for the translation.
+        - language_to_translate (str, optional): The language code to which the texts
+                                                 should be translated. Defaults to English.
+        - token_budget (int, optional): Maximum estimated tokens of the texts of one
+                                        request. Defaults to 2000.
+        - max_retries (int, optional): Packed retries of missing items. Defaults to 1.
+
+        Returns:
+        - List[str]: The translated texts, in the order of the input.
+        """
+        try:
+            Language.validate_language(language_to_translate)
+
+            lang = Language.get_language_name(language_to_translate)
+
+        except Exception as e:
+            print(e)
+            return ["Error in processing the request."] * len(texts)
+
+        results = list(texts)
+        pending = [
+            index
+            for index, language in enumerate(detect_languages(texts))
+            if language != language_to_translate.lower()
+        ]
+        translations = run_packed(
+            [texts[index] for index in pending],
+            lambda batch: self._request_packed(prompts.packed_translate(batch, lang), model_type),
+            token_budget,
+            max_retries,
+            lambda text: self.translate_text(text, model_type, language_to_translate),
+        )
+        for index, translation in zip(pending, translations):
+            results[index] = translation
+        return results
+
+    def analyze_sentiments(
+        self,
+        texts: List[str],
+        max_number_words: int = 30,
+        model_type: str = None,
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        """
+        Analyzes the sentiment of many short texts with as few requests as possible.
+
+        Works like `translate_texts`, falling back to `analyze_sentiment`.
+
+        Parameters:
+        - texts (List[str]): The texts to be analyzed.
+        - max_number_words (int, optional): Maximum words of each analysis. Defaults to 30.
+        - model_type (str, optional): The model to use for the analysis.
+        - token_budget (int, optional): Maximum estimated tokens of the texts of one
+                                        request. Defaults to 2000.
+        - max_retries (int, optional): Packed retries of missing items. Defaults to 1.
+
+        Returns:
+        - List[str]: The sentiment analysis of each text, in the order of the input.
+        """
+        return run_packed(
+            texts,
+            lambda batch: self._request_packed(
+                prompts.packed_analyze_sentiment(batch, max_number_words), model_type
+            ),
+            token_budget,
+            max_retries,
+            lambda text: self.analyze_sentiment(text, max_number_words, model_type),
+        )
+
+    def tag_and_categorize_texts(
+        self,
+        texts: List[str],
+        model_type: str = None,
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        """
+        Tags and categorizes many short texts with as few requests as possible.
+
+        Works like `translate_texts`, falling back to `tag_and_categorize_text`.
+
+        Parameters:
+        - texts (List[str]): The texts to be analyzed.
+        - model_type (str, optional): The model type to use for the analysis.
+        - token_budget (int, optional): Maximum estimated tokens of the texts of one
+                                        request. Defaults to 2000.
+        - max_retries (int, optional): Packed retries of missing items. Defaults to 1.
+
+        Returns:
+        - List[str]: For each text, a JSON object with the lists "tags" and
+                     "categories" (or the response of `tag_and_categorize_text`
+                     for texts processed one by one).
+        """
+        return run_packed(
+            texts,
+            lambda batch: self._request_packed(
+                prompts.packed_tag_and_categorize(batch), model_type
+            ),
+            token_budget,
+            max_retries,
+            lambda text: self.tag_and_categorize_text(text, model_type),
+        )
+
+    def analyze_sentiment_cascade(
+        self,
+        texts: List[str],
+        confidence_threshold: float = 0.5,
+        model_type: str = None,
+        token_budget: int = 2000,
+    ) -> List[SentimentResult]:
+        """
+        Classifies the sentiment of many texts, using the model only for the hard ones.
+
+        All texts are first scored by the local lexicon classifier
+        (`summedia.sentiment.score_sentiments`). Only texts scored with a confidence
+        below `confidence_threshold` are sent to the model, packed into as few
+        requests as possible. If the model gives no usable result for a text, its
+        local result is kept.
+
+        Parameters:
+        - texts (List[str]): The texts to be classified.
+        - confidence_threshold (float, optional): Local confidence (0-1) below which
+                                                  a text is sent to the model.
+                                                  Defaults to 0.5.
+        - model_type (str, optional): The model to use for the uncertain texts.
+        - token_budget (int, optional): Maximum estimated tokens of the texts of one
+                                        request. Defaults to 2000.
+
+        Returns:
+        - List[SentimentResult]: Label, score, confidence and source ("local" or "api")
+                                 of each text, in the order of the input.
+        """
+        results = score_sentiments(texts)
+        uncertain = [
+            index
+            for index, result in enumerate(results)
+            if result.confidence < confidence_threshold
+        ]
+        if not uncertain:
+            return results
+
+        responses = run_packed(
+            [texts[index] for index in uncertain],
+            lambda batch: self._request_packed(prompts.packed_sentiment_labels(batch), model_type),
+            token_budget,
+        )
+        for index, response in zip(uncertain, responses):
+            results[index] = parse_sentiment_result(response) or results[index]
+        return results
+
+    def _request_packed(self, messages: Tuple[str, str], model_type: str = None) -> str:
+        content_system, content_user = messages
+
+        if model_type:
+            return super().request_api(content_system, content_user, model_type)
+        else:
+            return super().request_api(content_system, content_user)
+
+
+class AsyncText(AsyncAPIRequester):
+    """
+    An asyncio counterpart of Text.
+
+    Every method takes the same arguments, sends the same prompts and returns the
+    same results as the Text method of the same name, but has to be awaited.
+    Requests are limited and pooled as described in AsyncAPIRequester.
+
+    Attributes:
+    - summary_store (SummaryStore): Previous summaries used by incremental summarization.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        max_concurrency: int = 100,
+        client=None,
+        semaphore: asyncio.Semaphore = None,
+        compactor: TextCompactor = None,
+        summary_store: SummaryStore = None,
+    ):
+        super().__init__(api_key, max_concurrency, client, semaphore, compactor)
+        self.summary_store = summary_store if summary_store is not None else SummaryStore()
+
+    async def summarize_text(
+        self, text: str, max_number_words: int = 150, model_type: str = None
+    ) -> str:
+        text = self._compact(text)
+
+        content_system, content_user = prompts.summarize(text, max_number_words)
+
+        return await self._bounded_request(
+            content_system, content_user, model_type, output_budget("summarize", max_number_words)
+        )
+
+    async def summary_article(
+        self,
+        article_url: str,
+        article_text: str = None,
+        max_number_words: int = 150,
+        incremental: bool = False,
+        change_threshold: float = 0.5,
+    ) -> str:
+        try:
+            if article_url:
+                # Downloading is blocking, keep it off the event loop.
+                text = await asyncio.to_thread(get_text, article_url)
+                if incremental:
+                    return await self.update_summary(
+                        article_url, text, max_number_words, change_threshold
+                    )
+                return await self.summarize_text(text, max_number_words)
+            elif article_text:
+                return await self.summarize_text(article_text, max_number_words)
+
+        except ArticleException as e:
+            return f"Error summarizing the article: {str(e)}"
+
+    async def update_summary(
+        self,
+        key: str,
+        text: str,
+        max_number_words: int = 150,
+        change_threshold: float = 0.5,
+        model_type: str = None,
+    ) -> str:
+        paragraphs = split_paragraphs(text)
+        snapshot = self.summary_store.get(key)
+
+        drift = 0.0
+        if snapshot is None:
+            summary = await self.summarize_text(text, max_number_words, model_type)
+        else:
+            diff = diff_paragraphs(snapshot, paragraphs)
+            if not diff.changed and not diff.removed:
+                return snapshot.summary
+            drift = snapshot.drift + diff.change_ratio
+            if drift > change_threshold:
+                drift = 0.0
+                summary = await self.summarize_text(text, max_number_words, model_type)
+            else:
+                content_system, content_user = prompts.update_summary(
+                    snapshot.summary, diff.changed, diff.removed, max_number_words
+                )
+                budget = output_budget("summarize", max_number_words)
+                summary = await self._bounded_request(
+                    content_system, content_user, model_type, budget
+                )
+
+        self.summary_store.put(key, ArticleSnapshot(paragraphs, summary, drift))
+        return summary
+
+    async def analyze_sentiment(
+        self, text: str, max_number_words: int = 150, model_type: str = None
+    ) -> str:
+        try:
+            text = self._compact(text)
+
+            content_system, content_user = prompts.analyze_sentiment(text, max_number_words)
+
+            budget = output_budget("analyze_sentiment", max_number_words)
+            return await self._bounded_request(content_system, content_user, model_type, budget)
+
+        except Exception as e:
+            print(f"Error: {e}")
+            return "Error in processing the request."
+
+    async def to_bullet_list(self, text: str, model_type: str = None) -> str:
+        try:
+            text = self._compact(text)
+
+            content_system, content_user = prompts.bullet_list(text)
+
+            return await self._bounded_request(
+                content_system, content_user, model_type, output_budget("bullet_list")
             )
 
+        except Exception as e:
+            print(e)
+            return "Error in processing the request."
+
+    async def translate_text(
+        self,
+        text: str,
+        model_type: str = None,
+        language_to_translate: str = "en",
+    ) -> str:
+        try:
+            Language.validate_language(language_to_translate)
+
+            lang = Language.get_language_name(language_to_translate)
+
+            if detect_language(text) == language_to_translate.lower():
+                return text
+
+            text = self._compact(text)
+
+            content_system, content_user = prompts.translate(text, lang)
+
             if model_type:
-                response = super().request_api(content_system, content_user, model_type)
+                return await self.request_api(content_system, content_user, model_type)
             else:
-                response = super().request_api(content_system, content_user)
+                return await self.request_api(content_system, content_user)
 
-            return response
+        except Exception as e:
+            print(e)
+            return "Error in processing the request."
+
+    async def adjust_text_complexity(
+        self,
+        text: str,
+        level: SimplificationLevel = SimplificationLevel.STUDENT,
+        model_type: str = None,
+        skip_at_level: bool = False,
+    ):
+        if skip_at_level and simplification_level(text) == level:
+            return text
+
+        try:
+            text = self._compact(text)
+
+            content_system, content_user = prompts.adjust_complexity(text, level)
+
+            if model_type:
+                return await self.request_api(content_system, content_user, model_type)
+            else:
+                return await self.request_api(content_system, content_user)
 
         except Exception as e:
             print(e)
             return "Error in processing the request."
+
+    async def tag_and_categorize_text(self, text: str, model_type: str = None):
+        try:
+            text = self._compact(text)
+
+            content_system, content_user = prompts.tag_and_categorize(text)
+
+            return await self._bounded_request(
+                content_system, content_user, model_type, output_budget("tag_and_categorize")
+            )
+
+        except Exception as e:
+            print(e)
+            return "Error in processing the request."
+
+    async def translate_texts(
+        self,
+        texts: List[str],
+        model_type: str = None,
+        language_to_translate: str = "en",
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        try:
+            Language.validate_language(language_to_translate)
+
+            lang = Language.get_language_name(language_to_translate)
+
+        except Exception as e:
+            print(e)
+            return ["Error in processing the request."] * len(texts)
+
+        results = list(texts)
+        pending = [
+            index
+            for index, language in enumerate(detect_languages(texts))
+            if language != language_to_translate.lower()
+        ]
+        translations = await run_packed_async(
+            [texts[index] for index in pending],
+            lambda batch: self._request_packed(prompts.packed_translate(batch, lang), model_type),
+            token_budget,
+            max_retries,
+            lambda text: self.translate_text(text, model_type, language_to_translate),
+        )
+        for index, translation in zip(pending, translations):
+            results[index] = translation
+        return results
+
+    async def analyze_sentiments(
+        self,
+        texts: List[str],
+        max_number_words: int = 30,
+        model_type: str = None,
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        return await run_packed_async(
+            texts,
+            lambda batch: self._request_packed(
+                prompts.packed_analyze_sentiment(batch, max_number_words), model_type
+            ),
+            token_budget,
+            max_retries,
+            lambda text: self.analyze_sentiment(text, max_number_words, model_type),
+        )
+
+    async def tag_and_categorize_texts(
+        self,
+        texts: List[str],
+        model_type: str = None,
+        token_budget: int = 2000,
+        max_retries: int = 1,
+    ) -> List[str]:
+        return await run_packed_async(
+            texts,
+            lambda batch: self._request_packed(
+                prompts.packed_tag_and_categorize(batch), model_type
+            ),
+            token_budget,
+            max_retries,
+            lambda text: self.tag_and_categorize_text(text, model_type),
+        )
+
+    async def analyze_sentiment_cascade(
+        self,
+        texts: List[str],
+        confidence_threshold: float = 0.5,
+        model_type: str = None,
+        token_budget: int = 2000,
+    ) -> List[SentimentResult]:
+        results = score_sentiments(texts)
+        uncertain = [
+            index
+            for index, result in enumerate(results)
+            if result.confidence < confidence_threshold
+        ]
+        if not uncertain:
+            return results
+
+        responses = await run_packed_async(
+            [texts[index] for index in uncertain],
+            lambda batch: self._request_packed(prompts.packed_sentiment_labels(batch), model_type),
+            token_budget,
+        )
+        for index, response in zip(uncertain, responses):
+            results[index] = parse_sentiment_result(response) or results[index]
+        return results
+
+    async def _request_packed(self, messages: Tuple[str, str], model_type: str = None) -> str:
+        content_system, content_user = messages
+
+        if model_type:
+            return await self.request_api(content_system, content_user, model_type)
+        else:
+            return await self.request_api(content_system, content_user)
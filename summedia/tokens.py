@@ -0,0 +1,19 @@
+import math
+
+# Rough average for English text with OpenAI's BPE tokenizers.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates the number of tokens a text will use without calling a tokenizer.
+
+    Parameters:
+    - text (str): The text to be measured.
+
+    Returns:
+    - int: Approximate token count of the text.
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
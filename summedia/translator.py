@@ -1,12 +1,17 @@
-import pycountry
+from summedia.languages import language_name
 
 
 class Language:
     @classmethod
     def validate_language(cls, lang_code):
-        if not pycountry.languages.get(alpha_2=lang_code):
+        if not isinstance(lang_code, str):
+            raise LookupError(f"Language code must be a string, not {type(lang_code).__name__}")
+        if not language_name(lang_code):
             raise ValueError("Unsupported language")
 
     @classmethod
     def get_language_name(cls, lang_code):
-        return pycountry.languages.get(alpha_2=lang_code).name
+        name = language_name(lang_code)
+        if name is None:
+            raise AttributeError(f"Unknown language code: {lang_code}")
+        return name
@@ -0,0 +1,432 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from newspaper import Article
+
+from summedia.fetching_data import download_html
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease TEXT,
+    leased_by TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT
+)
+"""
+
+
+class Task(NamedTuple):
+    """
+    A unit of work leased from a queue.
+
+    Attributes:
+    - task_id (str): Identifier of the task, `<stage>:<key>`.
+    - stage (str): Name of the stage that processes the task.
+    - key (str): Identifier of the work item, e.g. an article URL, shared by all
+                 stages of a pipeline.
+    - payload (Dict[str, Any]): JSON serializable input of the stage.
+    - attempts (int): Number of times the task has been leased, this lease included.
+    - lease (str): Token of the current lease; acks and heartbeats of an expired
+                   lease are rejected.
+    """
+
+    task_id: str
+    stage: str
+    key: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    lease: Optional[str] = None
+
+
+def task_id(stage: str, key: str) -> str:
+    return f"{stage}:{key}"
+
+
+class WorkQueue(ABC):
+    """
+    Interface of a durable queue shared by the workers of a pipeline.
+
+    Tasks are identified by stage and key, so putting the same work twice is a
+    no-op and a result is stored at most once per task. A leased task is invisible
+    to other workers until its visibility timeout expires; a worker that dies
+    stops heartbeating and its task is leased again. Failed tasks are retried
+    until `max_attempts` and then moved to the dead letters.
+
+    Implement this class to run pipelines on another broker.
+    """
+
+    @abstractmethod
+    def put(self, stage: str, key: str, payload: Dict[str, Any]) -> bool:
+        """
+        Adds a task; returns False when a task with the same stage and key exists.
+        """
+
+    @abstractmethod
+    def lease(
+        self, stages: Iterable[str], worker_id: str, visibility_timeout: float
+    ) -> Optional[Task]:
+        """
+        Leases the oldest available task of the given stages, or returns None.
+        """
+
+    @abstractmethod
+    def heartbeat(self, task: Task, visibility_timeout: float) -> bool:
+        """
+        Extends the lease of a task; returns False when the lease was lost.
+        """
+
+    @abstractmethod
+    def ack(
+        self,
+        task: Task,
+        result: Any = None,
+        next_tasks: Iterable[Tuple[str, str, Dict[str, Any]]] = (),
+    ) -> bool:
+        """
+        Completes a task with its result and atomically adds follow-up tasks given as
+        (stage, key, payload). Returns False when the lease was lost, in which case
+        nothing is stored.
+        """
+
+    @abstractmethod
+    def nack(self, task: Task, error: str) -> bool:
+        """
+        Reports a failed attempt; the task is retried later or dead-lettered.
+        Returns False when the lease was lost.
+        """
+
+    @abstractmethod
+    def result(self, task_id: str) -> Any:
+        """
+        Returns the stored result of a completed task, or None.
+        """
+
+    @abstractmethod
+    def dead_letters(self, stage: str = None) -> List[Tuple[Task, str]]:
+        """
+        Returns the dead-lettered tasks with their last error.
+        """
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """
+        Returns the number of tasks in each state.
+        """
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """
+    A WorkQueue kept in a SQLite database file.
+
+    Every operation runs in its own immediate transaction, so processes on one
+    machine, or on several machines sharing the file on a filesystem with working
+    locks, can lease from the same queue without handing a task to two workers.
+
+    Parameters:
+    - path (str): Database file, created if it does not exist.
+    - max_attempts (int, optional): Attempts before a task is dead-lettered.
+                                    Defaults to 5.
+    - retry_delay (float, optional): Seconds before the first retry of a failed task,
+                                     doubled with each further attempt. Defaults to 5.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 5, retry_delay: float = 5.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        with self._transaction() as connection:
+            connection.execute(_SCHEMA)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_available "
+                "ON tasks (stage, status, available_at)"
+            )
+
+    @contextmanager
+    def _transaction(self):
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def put(self, stage: str, key: str, payload: Dict[str, Any]) -> bool:
+        with self._transaction() as connection:
+            return _insert(connection, stage, key, payload)
+
+    def lease(
+        self, stages: Iterable[str], worker_id: str, visibility_timeout: float
+    ) -> Optional[Task]:
+        stages = list(stages)
+        placeholders = ", ".join("?" for _ in stages)
+        now = time.time()
+        with self._transaction() as connection:
+            # Leases that expired on their last attempt belong to workers that died.
+            connection.execute(
+                f"UPDATE tasks SET status = ?, lease = NULL, error = 'lease expired' "
+                f"WHERE status = ? AND lease_expires <= ? AND attempts >= ? "
+                f"AND stage IN ({placeholders})",
+                [DEAD, LEASED, now, self.max_attempts, *stages],
+            )
+            row = connection.execute(
+                f"SELECT task_id, stage, key, payload, attempts FROM tasks "
+                f"WHERE stage IN ({placeholders}) AND ("
+                f"(status = ? AND available_at <= ?) OR (status = ? AND lease_expires <= ?)"
+                f") ORDER BY available_at LIMIT 1",
+                [*stages, PENDING, now, LEASED, now],
+            ).fetchone()
+            if row is None:
+                return None
+
+            identifier, stage, key, payload, attempts = row
+            lease = uuid.uuid4().hex
+            connection.execute(
+                "UPDATE tasks SET status = ?, attempts = ?, lease = ?, leased_by = ?, "
+                "lease_expires = ? WHERE task_id = ?",
+                [LEASED, attempts + 1, lease, worker_id, now + visibility_timeout, identifier],
+            )
+        return Task(identifier, stage, key, json.loads(payload), attempts + 1, lease)
+
+    def heartbeat(self, task: Task, visibility_timeout: float) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE task_id = ? AND lease = ? "
+                "AND status = ?",
+                [time.time() + visibility_timeout, task.task_id, task.lease, LEASED],
+            )
+            return cursor.rowcount == 1
+
+    def ack(
+        self,
+        task: Task,
+        result: Any = None,
+        next_tasks: Iterable[Tuple[str, str, Dict[str, Any]]] = (),
+    ) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE tasks SET status = ?, lease = NULL, result = ?, error = NULL "
+                "WHERE task_id = ? AND lease = ? AND status = ?",
+                [DONE, json.dumps(result), task.task_id, task.lease, LEASED],
+            )
+            if cursor.rowcount != 1:
+                return False
+            for stage, key, payload in next_tasks:
+                _insert(connection, stage, key, payload)
+            return True
+
+    def nack(self, task: Task, error: str) -> bool:
+        with self._transaction() as connection:
+            if task.attempts >= self.max_attempts:
+                status, available_at = DEAD, time.time()
+            else:
+                status = PENDING
+                available_at = time.time() + self.retry_delay * 2 ** (task.attempts - 1)
+            cursor = connection.execute(
+                "UPDATE tasks SET status = ?, lease = NULL, available_at = ?, error = ? "
+                "WHERE task_id = ? AND lease = ? AND status = ?",
+                [status, available_at, error, task.task_id, task.lease, LEASED],
+            )
+            return cursor.rowcount == 1
+
+    def result(self, task_id: str) -> Any:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT result FROM tasks WHERE task_id = ? AND status = ?", [task_id, DONE]
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def dead_letters(self, stage: str = None) -> List[Tuple[Task, str]]:
+        query = "SELECT task_id, stage, key, payload, attempts, error FROM tasks WHERE status = ?"
+        parameters = [DEAD]
+        if stage is not None:
+            query += " AND stage = ?"
+            parameters.append(stage)
+        with self._transaction() as connection:
+            rows = connection.execute(query + " ORDER BY available_at", parameters).fetchall()
+        return [
+            (Task(identifier, stage, key, json.loads(payload), attempts), error)
+            for identifier, stage, key, payload, attempts, error in rows
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+            ).fetchall()
+        return {status: 0 for status in (PENDING, LEASED, DONE, DEAD)} | dict(rows)
+
+
+def _insert(connection: sqlite3.Connection, stage: str, key: str, payload: Dict[str, Any]):
+    cursor = connection.execute(
+        "INSERT OR IGNORE INTO tasks (task_id, stage, key, payload, status, available_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [task_id(stage, key), stage, key, json.dumps(payload), PENDING, time.time()],
+    )
+    return cursor.rowcount == 1
+
+
+class Stage(NamedTuple):
+    """
+    A step of a pipeline, run by workers as a consumer of the queue.
+
+    Attributes:
+    - name (str): Name of the stage, used as the task stage.
+    - handler (Callable[[Dict[str, Any]], Any]): Processes the payload of a task and
+                                                  returns its JSON serializable result.
+    - next_stage (str, optional): Stage that receives the result as its payload,
+                                  under the same key.
+    """
+
+    name: str
+    handler: Callable[[Dict[str, Any]], Any]
+    next_stage: Optional[str] = None
+
+
+class Worker:
+    """
+    Leases tasks of its stages from a queue and runs their handlers.
+
+    While a handler runs, the lease is renewed every third of the visibility
+    timeout. A handler that raises, or returns a result that is not JSON
+    serializable, has its task retried; a result is stored, and
+    the next stage enqueued, only if the lease is still held, so a task that was
+    taken over by another worker is not completed twice.
+
+    Parameters:
+    - queue (WorkQueue): Queue shared with the other workers.
+    - stages (List[Stage]): Stages this worker consumes.
+    - worker_id (str, optional): Name of the worker. Defaults to host and process id.
+    - visibility_timeout (float, optional): Seconds a task stays leased without a
+                                            heartbeat. Defaults to 60.
+    - poll_interval (float, optional): Seconds to wait when no task is available.
+                                       Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        stages: List[Stage],
+        worker_id: str = None,
+        visibility_timeout: float = 60.0,
+        poll_interval: float = 1.0,
+    ):
+        self.queue = queue
+        self.stages = {stage.name: stage for stage in stages}
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+
+    def run_once(self) -> bool:
+        """
+        Processes one task. Returns False when no task was available.
+        """
+        task = self.queue.lease(self.stages, self.worker_id, self.visibility_timeout)
+        if task is None:
+            return False
+
+        stage = self.stages[task.stage]
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(task, done), daemon=True)
+        heartbeat.start()
+        try:
+            result = stage.handler(task.payload)
+            # Checked before acking: a result the queue cannot store would otherwise
+            # fail inside the ack and leave the task leased.
+            json.dumps(result)
+        except Exception as e:
+            done.set()
+            heartbeat.join()
+            self.queue.nack(task, f"{type(e).__name__}: {e}")
+            return True
+
+        done.set()
+        heartbeat.join()
+        next_tasks = [(stage.next_stage, task.key, result)] if stage.next_stage else []
+        self.queue.ack(task, result, next_tasks)
+        return True
+
+    def run(self, stop: threading.Event = None, max_tasks: int = None) -> int:
+        """
+        Processes tasks until `stop` is set or `max_tasks` were processed.
+
+        Returns:
+        - int: Number of processed tasks.
+        """
+        stop = stop or threading.Event()
+        processed = 0
+        while not stop.is_set() and (max_tasks is None or processed < max_tasks):
+            if self.run_once():
+                processed += 1
+            else:
+                stop.wait(self.poll_interval)
+        return processed
+
+    def _heartbeat(self, task: Task, done: threading.Event) -> None:
+        while not done.wait(self.visibility_timeout / 3):
+            if not self.queue.heartbeat(task, self.visibility_timeout):
+                return
+
+
+def article_pipeline(
+    text, publish: Callable[[Dict[str, Any]], Any], max_number_words: int = 150
+) -> List[Stage]:
+    """
+    Returns the fetch, parse, analyze and publish stages of an article pipeline.
+
+    Enqueue an article with `queue.put("fetch", url, {"url": url})`.
+
+    Parameters:
+    - text (Text): Text instance used to summarize the articles.
+    - publish (Callable[[Dict[str, Any]], Any]): Receives the url, title, text and
+                                                 summary of each analyzed article.
+    - max_number_words (int, optional): Maximum length of the summaries. Defaults to 150.
+
+    Returns:
+    - List[Stage]: The stages, to be consumed by one or more workers.
+    """
+
+    def fetch(payload):
+        return {"url": payload["url"], "html": download_html(payload["url"])}
+
+    def parse(payload):
+        article = Article(payload["url"])
+        article.download(input_html=payload["html"])
+        article.parse()
+        return {"url": payload["url"], "title": article.title, "text": article.text}
+
+    def analyze(payload):
+        summary = text.summarize_text(payload["text"], max_number_words=max_number_words)
+        return dict(payload, summary=summary)
+
+    return [
+        Stage("fetch", fetch, "parse"),
+        Stage("parse", parse, "analyze"),
+        Stage("analyze", analyze, "publish"),
+        Stage("publish", publish),
+    ]
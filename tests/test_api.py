@@ -0,0 +1,103 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from summedia.api import APIRequester
+from summedia.hedging import HedgingPolicy
+
+
+def warmed_up_policy(**kwargs):
+    policy = HedgingPolicy(min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.model_stats("gpt-3.5-turbo").record(0.01)
+    return policy
+
+
+class TestAPIRequester(unittest.TestCase):
+    @patch("summedia.api.OpenAI")
+    def test_request_api_returns_message_content(self, mock_openai):
+        response = MagicMock()
+        response.choices[0].message.content = "Mocked response"
+        mock_openai.return_value.chat.completions.create.return_value = response
+
+        requester = APIRequester(api_key="dummy_api_key")
+        self.assertEqual(requester.request_api("system", "user"), "Mocked response")
+
+        kwargs = mock_openai.return_value.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["model"], "gpt-3.5-turbo")
+        self.assertEqual(kwargs["messages"][1], {"role": "user", "content": "user"})
+
+
+@patch("summedia.api.OpenAI")
+class TestHedgedRequests(unittest.TestCase):
+    def test_no_hedge_without_latency_data(self, mock_openai):
+        policy = HedgingPolicy(min_samples=5)
+        requester = APIRequester(api_key="dummy_api_key", hedging=policy)
+
+        with patch.object(APIRequester, "_complete", return_value="ok") as mock_complete:
+            self.assertEqual(requester.request_api("system", "user"), "ok")
+
+        self.assertEqual(mock_complete.call_count, 1)
+        self.assertEqual(policy.hedges, 0)
+        self.assertEqual(policy.model_stats("gpt-3.5-turbo").samples, 1)
+
+    def test_slow_request_is_hedged_to_alternate_model(self, mock_openai):
+        policy = warmed_up_policy(alternate_model="gpt-4", max_extra_load=1.0)
+        requester = APIRequester(api_key="dummy_api_key", hedging=policy)
+        release = threading.Event()
+
+        def complete(client, content_system, content_user, model_type):
+            if model_type == "gpt-3.5-turbo":
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        with patch.object(APIRequester, "_complete", side_effect=complete):
+            self.assertEqual(requester.request_api("system", "user"), "fast")
+        release.set()
+
+        self.assertEqual(policy.hedges, 1)
+        mock_openai.return_value.close.assert_called_once()
+
+    def test_abandoned_attempt_latency_is_recorded(self, mock_openai):
+        policy = warmed_up_policy(max_extra_load=1.0)
+        requester = APIRequester(api_key="dummy_api_key", hedging=policy)
+        release = threading.Event()
+        calls = []
+
+        def complete(client, content_system, content_user, model_type):
+            calls.append(model_type)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            threading.Event().wait(0.05)
+            return "fast"
+
+        with patch.object(APIRequester, "_complete", side_effect=complete):
+            self.assertEqual(requester.request_api("system", "user"), "fast")
+        release.set()
+
+        stats = policy.model_stats("gpt-3.5-turbo")
+        self.assertEqual(stats.samples, 7)
+        self.assertGreaterEqual(stats.percentile(1.0), 0.06)
+
+    def test_extra_load_is_capped(self, mock_openai):
+        policy = warmed_up_policy(max_extra_load=0.0)
+        requester = APIRequester(api_key="dummy_api_key", hedging=policy)
+
+        def complete(client, content_system, content_user, model_type):
+            threading.Event().wait(0.1)
+            return "slow"
+
+        with patch.object(APIRequester, "_complete", side_effect=complete) as mock_complete:
+            self.assertEqual(requester.request_api("system", "user"), "slow")
+
+        self.assertEqual(mock_complete.call_count, 1)
+        self.assertEqual(policy.hedges, 0)
+
+    def test_error_is_raised_when_all_attempts_fail(self, mock_openai):
+        requester = APIRequester(api_key="dummy_api_key", hedging=warmed_up_policy())
+
+        with patch.object(APIRequester, "_complete", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                requester.request_api("system", "user")
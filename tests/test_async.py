@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from summedia.api import APIRequester, AsyncAPIRequester
+from summedia.level import SimplificationLevel
+from summedia.social_media import AsyncSocialMedia, SocialMedia
+from summedia.text import AsyncText, Text
+
+TEXT_CALLS = [
+    ("summarize_text", ("Long text", 100)),
+    ("analyze_sentiment", ("Sample text",)),
+    ("to_bullet_list", ("Sample text", "gpt-4")),
+    ("translate_text", ("Hola", None, "en")),
+    ("adjust_text_complexity", ("Sample text", SimplificationLevel.TEEN)),
+    ("tag_and_categorize_text", ("Sample text",)),
+    ("summary_article", (None, "Article text", 80)),
+]
+
+SOCIAL_MEDIA_CALLS = [
+    ("condense_text_to_tweet", ("Long text", None, 30)),
+    ("post_to_facebook", ("Long text",)),
+]
+
+
+class TestAsyncMatchesSync(unittest.TestCase):
+    def assert_same_requests(self, sync_instance, async_instance, calls):
+        for method, args in calls:
+            with patch.object(APIRequester, "request_api", return_value="ok") as sync_mock:
+                sync_result = getattr(sync_instance, method)(*args)
+            with patch.object(
+                AsyncAPIRequester, "request_api", new=AsyncMock(return_value="ok")
+            ) as async_mock:
+                async_result = asyncio.run(getattr(async_instance, method)(*args))
+
+            self.assertEqual(sync_result, async_result, method)
+            self.assertEqual(sync_mock.call_args.args, async_mock.call_args.args, method)
+
+    def test_text(self):
+        self.assert_same_requests(
+            Text(api_key="dummy_api_key"), AsyncText(api_key="dummy_api_key"), TEXT_CALLS
+        )
+
+    def test_social_media(self):
+        self.assert_same_requests(
+            SocialMedia(api_key="dummy_api_key"),
+            AsyncSocialMedia(api_key="dummy_api_key"),
+            SOCIAL_MEDIA_CALLS,
+        )
+
+    def test_packed_methods(self):
+        calls = [
+            ("translate_texts", (["Hola", "Buenos días"],)),
+            ("analyze_sentiments", (["Great!", "Awful."],)),
+            ("tag_and_categorize_texts", (["Sample text", "Other text"],)),
+        ]
+        for method, args in calls:
+            response = '{"1": "A", "2": "B"}'
+            with patch.object(APIRequester, "request_api", return_value=response) as sync_mock:
+                sync_result = getattr(Text(api_key="dummy_api_key"), method)(*args)
+            with patch.object(
+                AsyncAPIRequester, "request_api", new=AsyncMock(return_value=response)
+            ) as async_mock:
+                async_text = AsyncText(api_key="dummy_api_key")
+                async_result = asyncio.run(getattr(async_text, method)(*args))
+
+            self.assertEqual(async_result, ["A", "B"], method)
+            self.assertEqual(sync_result, async_result, method)
+            self.assertEqual(sync_mock.call_args.args, async_mock.call_args.args, method)
+            self.assertEqual(async_mock.call_count, 1, method)
+
+    def test_errors_are_reported_like_sync(self):
+        async_text = AsyncText(api_key="dummy_api_key")
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        with patch.object(AsyncAPIRequester, "request_api", new=failing):
+            result = asyncio.run(async_text.to_bullet_list("Sample text"))
+        self.assertEqual(result, "Error in processing the request.")
+
+
+class TestAsyncAPIRequester(unittest.TestCase):
+    def test_concurrency_is_limited_and_client_is_shared(self):
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.choices[0].message.content = kwargs["messages"][1]["content"]
+            return response
+
+        client = MagicMock()
+        client.chat.completions.create = create
+        requester = AsyncAPIRequester(api_key="dummy_api_key", max_concurrency=3, client=client)
+
+        async def run():
+            return await asyncio.gather(
+                *(requester.request_api("system", str(i)) for i in range(10))
+            )
+
+        self.assertEqual(asyncio.run(run()), [str(i) for i in range(10)])
+        self.assertEqual(peak, 3)
+
+    def test_request_can_be_cancelled(self):
+        client = MagicMock()
+
+        async def create(**kwargs):
+            await asyncio.sleep(10)
+
+        client.chat.completions.create = create
+        requester = AsyncAPIRequester(api_key="dummy_api_key", client=client)
+
+        async def run():
+            await asyncio.wait_for(requester.request_api("system", "user"), timeout=0.01)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(run())
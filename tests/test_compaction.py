@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import patch
+
+from summedia.compaction import TextCompactor, normalize
+from summedia.elastic import ElasticAPIRequester
+from summedia.social_media import SocialMedia
+from summedia.text import Text
+
+ARTICLE = """Share this article on Facebook
+
+The  city council approved the new budget on Tuesday.\u00a0It includes money for parks.
+
+“The parks are the heart of our city,” the mayor said.
+
+Photo: Jane Doe / Reuters
+
+Sign up for our newsletter
+The parks are the heart of our city, the mayor said. The vote was 7 to 2.
+Advertisement
+“Parks matter more than ever.”
+“The parks are the heart of our city,” the mayor said.
+
+
+
+The budget takes effect in July.\u200b"""
+
+
+class TestTextCompactor(unittest.TestCase):
+    def test_normalize_collapses_whitespace(self):
+        self.assertEqual(normalize("a \t b\u00a0c\r\n\n\n\nd\u200b "), "a b c\n\nd")
+
+    def test_normalize_keeps_meaningful_symbols(self):
+        self.assertEqual(normalize("ﬁve m² of H₂O, ½ off™"), "five m² of H₂O, ½ off™")
+        self.assertEqual(normalize("cafe\u0301"), "café")
+
+    def test_removes_boilerplate_and_repeats(self):
+        result = TextCompactor().compact(ARTICLE)
+
+        self.assertNotIn("Share this article", result.text)
+        self.assertNotIn("newsletter", result.text)
+        self.assertNotIn("Advertisement", result.text)
+        self.assertEqual(result.text.count("“The parks are the heart"), 1)
+        self.assertEqual(result.text.count("The parks are the heart of our city, the mayor"), 1)
+        self.assertIn("Photo: Jane Doe / Reuters", result.text)
+        self.assertIn("“Parks matter more than ever.”", result.text)
+        self.assertIn("The budget takes effect in July.", result.text)
+        self.assertGreater(result.tokens_saved, 0)
+
+    def test_optionally_strips_captions_and_quotes(self):
+        result = TextCompactor(strip_captions=True, strip_quotes=True).compact(ARTICLE)
+
+        self.assertNotIn("Reuters", result.text)
+        self.assertNotIn("Parks matter more than ever.", result.text)
+        self.assertIn("“The parks are the heart of our city,” the mayor said.", result.text)
+        self.assertIn("The vote was 7 to 2.", result.text)
+
+    def test_is_deterministic_and_counts_savings(self):
+        compactor = TextCompactor()
+        first, second = compactor.compact(ARTICLE), compactor.compact(ARTICLE)
+
+        self.assertEqual(first, second)
+        self.assertEqual(compactor.calls, 2)
+        self.assertEqual(compactor.tokens_saved, 2 * first.tokens_saved)
+
+    def test_keeps_long_lines_that_mention_boilerplate(self):
+        line = "Readers who sign up for the program can share this article with up to ten friends."
+
+        self.assertEqual(TextCompactor().compact(line).text, line)
+
+    def test_keeps_sentences_that_start_like_boilerplate(self):
+        text = (
+            "Register for the vote by Friday at city hall.\n"
+            "Copyright law reform passed the Senate on Monday.\n"
+            "Related coverage continues below the fold tonight."
+        )
+
+        self.assertEqual(TextCompactor().compact(text).text, text)
+
+    def test_removes_ui_phrases(self):
+        text = (
+            "Read more: Is the city ready for the storm?\n"
+            "Related articles\n"
+            "© 2024 Example News. All rights reserved.\n"
+            "The budget takes effect in July."
+        )
+
+        self.assertEqual(TextCompactor().compact(text).text, "The budget takes effect in July.")
+
+
+class TestCompactedRequests(unittest.TestCase):
+    @patch("summedia.api.APIRequester.request_api", return_value="Summary.")
+    def test_text_methods_send_compacted_text(self, mock_request_api):
+        text = Text(api_key="dummy_api_key", compactor=TextCompactor())
+
+        text.summarize_text(ARTICLE)
+
+        self.assertNotIn("Share this article", mock_request_api.call_args.args[1])
+        self.assertGreater(text.compactor.tokens_saved, 0)
+        self.assertEqual(text.last_compaction, text.compactor.compact(ARTICLE))
+
+    @patch("summedia.api.APIRequester.request_api", return_value="Summary.")
+    def test_last_compaction_is_none_without_compactor(self, mock_request_api):
+        text = Text(api_key="dummy_api_key")
+
+        text.summarize_text(ARTICLE)
+
+        self.assertIsNone(text.last_compaction)
+
+    @patch("summedia.api.APIRequester.request_api", return_value="Answer.")
+    def test_elastic_prompt_sends_compacted_text(self, mock_request_api):
+        requester = ElasticAPIRequester(api_key="dummy_api_key", compactor=TextCompactor())
+
+        requester.elastic_prompt("system", ARTICLE)
+
+        self.assertNotIn("Sign up for our newsletter", mock_request_api.call_args.args[1])
+        self.assertGreater(requester.last_compaction.tokens_saved, 0)
+
+    @patch("summedia.api.APIRequester.request_api", return_value="Post.")
+    def test_social_media_methods_send_compacted_text(self, mock_request_api):
+        social_media = SocialMedia(api_key="dummy_api_key", compactor=TextCompactor())
+
+        social_media.post_to_facebook(ARTICLE)
+
+        self.assertNotIn("Advertisement", mock_request_api.call_args.args[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
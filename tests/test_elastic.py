@@ -0,0 +1,132 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import openai
+
+from summedia.elastic import (
+    ElasticAPIRequester,
+    LatencySLOPolicy,
+    ModelConfig,
+    OperationPolicy,
+    TokenCountPolicy,
+)
+
+SMALL = ModelConfig("small", context_window=100, input_cost=0.001, output_cost=0.002)
+LARGE = ModelConfig("large", context_window=10000, input_cost=0.01, output_cost=0.03)
+
+
+def api_error(code=None):
+    error = openai.APIError("failed", request=MagicMock(), body=None)
+    error.code = code
+    return error
+
+
+class TestElasticAPIRequester(unittest.TestCase):
+    @patch("summedia.api.APIRequester.request_api")
+    def test_default_model(self, mock_request_api):
+        mock_request_api.return_value = "Mocked response"
+        requester = ElasticAPIRequester(api_key="dummy_api_key")
+
+        self.assertEqual(requester.elastic_prompt("system", "user"), "Mocked response")
+        mock_request_api.assert_called_once_with("system", "user", "gpt-3.5-turbo")
+        self.assertEqual(requester.stats["gpt-3.5-turbo"].calls, 1)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_explicit_model_type(self, mock_request_api):
+        mock_request_api.return_value = "Mocked response"
+        requester = ElasticAPIRequester(api_key="dummy_api_key", models=[SMALL, LARGE])
+
+        requester.elastic_prompt("system", "user", model_type="gpt-4")
+        mock_request_api.assert_called_once_with("system", "user", "gpt-4")
+        self.assertEqual(requester.stats["gpt-4"].calls, 1)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_token_count_policy(self, mock_request_api):
+        mock_request_api.return_value = "ok"
+        requester = ElasticAPIRequester(
+            api_key="dummy_api_key",
+            models=[SMALL, LARGE],
+            policies=[TokenCountPolicy([(10, "small"), (5000, "large")])],
+        )
+
+        requester.elastic_prompt("system", "short")
+        requester.elastic_prompt("system", "long text " * 20)
+        models = [call.args[2] for call in mock_request_api.call_args_list]
+        self.assertEqual(models, ["small", "large"])
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_operation_policy(self, mock_request_api):
+        mock_request_api.return_value = "ok"
+        requester = ElasticAPIRequester(
+            api_key="dummy_api_key",
+            models=[SMALL, LARGE],
+            policies=[OperationPolicy({"categorize": "large"})],
+        )
+
+        requester.elastic_prompt("system", "user", operation="categorize")
+        requester.elastic_prompt("system", "user", operation="summarize")
+        models = [call.args[2] for call in mock_request_api.call_args_list]
+        self.assertEqual(models, ["large", "small"])
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_fallback_on_error(self, mock_request_api):
+        mock_request_api.side_effect = [api_error(), "fallback response"]
+        requester = ElasticAPIRequester(api_key="dummy_api_key", models=[SMALL, LARGE])
+
+        self.assertEqual(requester.elastic_prompt("system", "user"), "fallback response")
+        self.assertEqual(requester.stats["small"].errors, 1)
+        self.assertEqual(requester.stats["large"].calls, 1)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_context_overflow_skips_smaller_models(self, mock_request_api):
+        mock_request_api.side_effect = api_error("context_length_exceeded")
+        medium = ModelConfig("medium", context_window=50)
+        requester = ElasticAPIRequester(api_key="dummy_api_key", models=[SMALL, medium])
+
+        with self.assertRaises(openai.APIError):
+            requester.elastic_prompt("system", "user")
+        self.assertEqual(mock_request_api.call_count, 1)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_latency_slo_policy_adapts(self, mock_request_api):
+        mock_request_api.return_value = "ok"
+        requester = ElasticAPIRequester(
+            api_key="dummy_api_key",
+            models=[LARGE, SMALL],
+            policies=[LatencySLOPolicy(slo_seconds=1.0, min_samples=2)],
+        )
+        self.assertEqual(requester.elastic_prompt("system", "user"), "ok")
+        self.assertEqual(mock_request_api.call_args.args[2], "small")
+
+        for _ in range(2):
+            requester.stats["small"].record(latency=5.0)
+        requester.elastic_prompt("system", "user")
+        self.assertEqual(mock_request_api.call_args.args[2], "large")
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_latency_slo_policy_excludes_failing_model(self, mock_request_api):
+        mock_request_api.side_effect = api_error()
+        requester = ElasticAPIRequester(
+            api_key="dummy_api_key",
+            models=[LARGE, SMALL],
+            policies=[LatencySLOPolicy(slo_seconds=1.0, min_samples=2)],
+        )
+
+        for _ in range(2):
+            with self.assertRaises(openai.APIError):
+                requester.elastic_prompt("system", "user", model_type="small")
+        self.assertEqual(requester.stats["small"].samples, 2)
+
+        mock_request_api.side_effect = None
+        mock_request_api.return_value = "ok"
+        requester.elastic_prompt("system", "user")
+        self.assertEqual(mock_request_api.call_args.args[2], "large")
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_records_cost(self, mock_request_api):
+        mock_request_api.return_value = "x" * 400
+        requester = ElasticAPIRequester(api_key="dummy_api_key", models=[LARGE])
+
+        requester.elastic_prompt("", "y" * 4000)
+        self.assertAlmostEqual(requester.stats["large"].total_cost, 0.01 + 0.003)
+        self.assertEqual(requester.stats["large"].total_tokens, 1100)
@@ -1,9 +1,23 @@
+import http.server
+import io
+import logging
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
+import requests
 import responses
 
-from summedia.fetching_data import get_images, get_text, get_time_read
+from summedia.fetching_data import (
+    DownloadError,
+    _abort,
+    download_html,
+    get_article,
+    get_images,
+    get_text,
+    get_time_read,
+)
 
 ARTICLE_BODY = (
     "Lorem Ipsum is simply dummy text of the printing and"
@@ -21,8 +35,9 @@ ARTICLE_BODY = (
         ("https://example.com/article2", "This is the text of article 2."),
     ],
 )
+@patch("summedia.fetching_data.download_html")
 @patch("summedia.fetching_data.Article")
-def test_get_text(mock_article, article_url, expected_text):
+def test_get_text(mock_article, mock_download_html, article_url, expected_text):
     # Mock the behavior of the Article class.
     mock_instance = mock_article.return_value
     mock_instance.download.return_value = None
@@ -142,3 +157,99 @@ def test_get_images_error():
 
     # Assertions
     assert img_urls == []
+
+
+@responses.activate
+def test_download_html_decodes_declared_charset():
+    mock_url = "https://example.com/article"
+    body = '<html><head><meta charset="iso-8859-2"></head><body>Za\xbf\xf3\xb3\xe6</body></html>'
+    responses.add(
+        responses.GET,
+        mock_url,
+        body=body.encode("latin-1"),
+        content_type="text/html",
+        status=200,
+    )
+
+    assert "Zażółć" in download_html(mock_url)
+
+
+@responses.activate
+def test_download_html_rejects_non_html():
+    mock_url = "https://example.com/report.pdf"
+    responses.add(responses.GET, mock_url, body=b"%PDF-1.4", content_type="application/pdf")
+
+    with pytest.raises(DownloadError):
+        download_html(mock_url)
+
+
+@responses.activate
+def test_download_html_aborts_oversized_response():
+    mock_url = "https://example.com/endless"
+    responses.add(responses.GET, mock_url, body=b"<p>" * 10000, content_type="text/html")
+
+    with pytest.raises(DownloadError):
+        download_html(mock_url, max_bytes=1000)
+
+
+class TrickleHandler(http.server.BaseHTTPRequestHandler):
+    """Sends one byte every 0.2 s, never slow enough to hit a read timeout."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        try:
+            for _ in range(50):
+                self.wfile.write(b"a")
+                self.wfile.flush()
+                time.sleep(0.2)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+def test_download_html_deadline_cuts_off_trickling_server(caplog):
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TrickleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        started = time.monotonic()
+        with caplog.at_level(logging.WARNING, logger="summedia.fetching_data"):
+            with pytest.raises(DownloadError):
+                download_html(f"http://127.0.0.1:{server.server_port}/", deadline=1, timeout=1)
+        assert time.monotonic() - started < 3
+        # The connection was shut down, not merely closed.
+        assert not caplog.records
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_abort_warns_when_connection_cannot_be_reached(caplog):
+    response = requests.Response()
+    response.raw = io.BytesIO(b"<html>")
+    response.url = "https://example.com/"
+
+    with caplog.at_level(logging.WARNING, logger="summedia.fetching_data"):
+        _abort(response)
+
+    assert "Cannot shut down the connection of https://example.com/" in caplog.text
+
+
+@responses.activate
+def test_get_article_records_failed_download():
+    mock_url = "https://example.com/report.pdf"
+    responses.add(responses.GET, mock_url, body=b"%PDF-1.4", content_type="application/pdf")
+
+    article = get_article(mock_url)
+
+    assert article.html == ""
+    assert "application/pdf" in article.download_exception_msg
+
+
+@patch("summedia.fetching_data.get_text")
+def test_time_read_from_given_text(mock_get_text):
+    assert get_time_read("https://example.com/article", article_text=ARTICLE_BODY * 60) == 11
+    mock_get_text.assert_not_called()
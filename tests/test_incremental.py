@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from summedia.incremental import (
+    ArticleSnapshot,
+    SummaryStore,
+    diff_paragraphs,
+    split_paragraphs,
+)
+from summedia.text import Text
+
+ARTICLE = "First paragraph.\n\nSecond   paragraph.\n\n\nThird paragraph."
+
+
+class TestParagraphDiff(unittest.TestCase):
+    def test_split_paragraphs(self):
+        self.assertEqual(
+            split_paragraphs(ARTICLE),
+            ["First paragraph.", "Second paragraph.", "Third paragraph."],
+        )
+
+    def test_diff_detects_added_and_removed_paragraphs(self):
+        snapshot = ArticleSnapshot(split_paragraphs(ARTICLE), "summary")
+        diff = diff_paragraphs(
+            snapshot, ["First paragraph.", "Third paragraph.", "Breaking update."]
+        )
+
+        self.assertEqual(diff.changed, ["Breaking update."])
+        self.assertEqual(diff.removed, ["Second paragraph."])
+        self.assertGreater(diff.change_ratio, 0)
+
+    def test_store_persists_snapshots(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "summaries.db")
+            snapshot = ArticleSnapshot(["a paragraph"], "summary", 0.25)
+            store = SummaryStore(path)
+            store.put("https://example.com", snapshot)
+            store.put("https://example.org", ArticleSnapshot(["other"], "old summary"))
+            store.put("https://example.org", ArticleSnapshot(["other"], "new summary"))
+
+            reopened = SummaryStore(path)
+            self.assertEqual(reopened.get("https://example.com"), snapshot)
+            self.assertEqual(reopened.get("https://example.org").summary, "new summary")
+            self.assertIsNone(reopened.get("https://example.net"))
+
+
+class TestIncrementalSummary(unittest.TestCase):
+    def setUp(self):
+        self.text = Text(api_key="dummy_api_key")
+        self.paragraphs = [f"Paragraph number {i} of a live blog." for i in range(10)]
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_unchanged_article_reuses_summary(self, mock_request_api):
+        mock_request_api.return_value = "Summary"
+        article = "\n\n".join(self.paragraphs)
+
+        self.assertEqual(self.text.update_summary("url", article), "Summary")
+        self.assertEqual(self.text.update_summary("url", article), "Summary")
+        self.assertEqual(mock_request_api.call_count, 1)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_small_change_sends_only_delta(self, mock_request_api):
+        mock_request_api.side_effect = ["Summary", "Updated summary"]
+        self.text.update_summary("url", "\n\n".join(self.paragraphs))
+
+        updated = "\n\n".join(self.paragraphs + ["A new development."])
+        self.assertEqual(self.text.update_summary("url", updated), "Updated summary")
+
+        content_user = mock_request_api.call_args.args[1]
+        self.assertIn("A new development.", content_user)
+        self.assertIn("Previous summary: Summary", content_user)
+        self.assertNotIn(self.paragraphs[0], content_user)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_removed_paragraphs_are_sent(self, mock_request_api):
+        mock_request_api.side_effect = ["Summary", "Updated summary"]
+        self.text.update_summary("url", "\n\n".join(self.paragraphs))
+
+        self.text.update_summary("url", "\n\n".join(self.paragraphs[1:]))
+
+        self.assertIn(
+            f"Removed paragraphs: {self.paragraphs[0]}", mock_request_api.call_args.args[1]
+        )
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_small_changes_add_up_to_a_new_summary(self, mock_request_api):
+        mock_request_api.side_effect = ["Summary", "Updated", "Updated again", "New summary"]
+        self.text.update_summary("url", "\n\n".join(self.paragraphs))
+
+        for count in range(1, 4):
+            updates = [f"Update number {i} with a new development." for i in range(count)]
+            article = "\n\n".join(self.paragraphs + updates)
+            self.text.update_summary("url", article, change_threshold=0.25)
+
+        self.assertNotIn("Previous summary", mock_request_api.call_args.args[1])
+        self.assertEqual(self.text.summary_store.get("url").drift, 0.0)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_large_change_summarizes_from_scratch(self, mock_request_api):
+        mock_request_api.side_effect = ["Summary", "New summary"]
+        self.text.update_summary("url", "\n\n".join(self.paragraphs))
+
+        rewritten = "\n\n".join(p.upper() for p in self.paragraphs)
+        self.assertEqual(self.text.update_summary("url", rewritten), "New summary")
+        self.assertNotIn("Previous summary", mock_request_api.call_args.args[1])
+
+    @patch("summedia.text.get_text")
+    @patch("summedia.api.APIRequester.request_api")
+    def test_summary_article_incremental(self, mock_request_api, mock_get_text):
+        mock_request_api.return_value = "Summary"
+        mock_get_text.return_value = "\n\n".join(self.paragraphs)
+
+        self.text.summary_article("https://example.com", incremental=True)
+        self.text.summary_article("https://example.com", incremental=True)
+        self.assertEqual(mock_request_api.call_count, 1)
@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import patch
+
+from summedia.language_detection import detect_language, detect_languages
+from summedia.languages import LANGUAGE_NAMES, language_name
+from summedia.text import Text
+
+TEXTS = {
+    "en": "The company reported strong quarterly earnings and plans to hire more engineers.",
+    "es": "El presidente dijo que el país invertirá más en escuelas y hospitales el próximo año.",
+    "de": "Das Unternehmen meldete starke Quartalsgewinne und will mehr Ingenieure einstellen.",
+    "pl": "Firma odnotowała wysokie zyski kwartalne i zapowiedziała zatrudnienie inżynierów.",
+    "ru": "Компания сообщила о высокой квартальной прибыли и планирует нанять инженеров.",
+    "uk": "Компанія повідомила про високий квартальний прибуток і планує найняти інженерів.",
+    "el": "Η εταιρεία ανακοίνωσε ισχυρά τριμηνιαία κέρδη.",
+    "ja": "同社は好調な四半期決算を発表した。",
+    "zh": "该公司公布了强劲的季度收益。",
+    "ar": "أعلنت الشركة عن أرباح فصلية قوية.",
+    "fa": "شرکت سود فصلی قوی گزارش کرد.",
+    "ur": "کمپنی نے مضبوط سہ ماہی منافع کا اعلان کیا۔",
+}
+
+# Languages close to one of the profiled languages, which they must not be taken for.
+NEIGHBOURS = {
+    ("sk", "cs"): "Spoločnosť oznámila vysoké štvrťročné zisky a plánuje prijať viac inžinierov.",
+    ("hr", "cs"): "Tvrtka je objavila snažnu tromjesečnu dobit i planira zaposliti još inženjera.",
+    ("ca", "es"): (
+        "L'empresa va anunciar uns forts beneficis trimestrals i té previst contractar més "
+        "enginyers."
+    ),
+    ("gl", "pt"): (
+        "A policía detivo dous sospeitosos despois do roubo nunha xoiaría do centro da cidade."
+    ),
+    ("no", "da"): (
+        "Selskapet rapporterte sterke kvartalstall og planlegger å ansette flere ingeniører."
+    ),
+    ("sr", "bg"): "Полиција је ухапсила двојицу осумњичених након пљачке златаре у центру града.",
+    ("be", "uk"): "Паліцыя затрымала двух падазраваных пасля рабавання крамы ў цэнтры горада.",
+    ("sl", "hr"): "Slovenska vlada je sprejela nov zakon o davkih za podjetja",
+    # Japanese written in kanji only.
+    ("ja", "zh"): "東京都知事選挙結果発表",
+}
+
+# Languages without a profile, some written in the script of a profiled language.
+UNKNOWN = {
+    "lt": "Policija sulaikė du įtariamuosius po juvelyrinės parduotuvės apiplėšimo miesto centre.",
+    "lv": "Uzņēmums ziņoja par lielu ceturkšņa peļņu un plāno pieņemt darbā vairāk inženieru.",
+    "et": "Politsei pidas kesklinnas asuva ehtepoe röövimise järel kinni kaks kahtlustatavat.",
+    "is": "Lögreglan handtók tvo grunaða eftir rán í skartgripaverslun í miðbænum.",
+    "sq": "Policia arrestoi dy të dyshuar pas grabitjes së një dyqani bizhuterish në qendër.",
+    "kk": "Полиция қала орталығындағы зергерлік дүкенді тонаудан кейін екі күдіктіні ұстады.",
+    "mr": "पोलिसांनी शहराच्या मध्यभागी असलेल्या दुकानातील दरोड्यानंतर दोन संशयितांना अटक केली.",
+    "ne": "प्रहरीले सहरको केन्द्रमा रहेको पसलमा भएको डकैतीपछि दुई जना संदिग्धलाई पक्राउ गरेको छ।",
+    "ku": "پۆلیس دوو گومانلێکراوی دەستگیر کرد دوای دزینی دوکانێکی زێڕنگەری لە ناوەندی شار.",
+    "yi": "די פּאָליציי האָט אַרעסטירט צוויי חשודים נאָך דעם רויב אין שטאָט־צענטער.",
+    "ti": "ፖሊስ ድሕሪ ዝርፊያ ድኳን ወርቂ ኣብ ማእከል ከተማ ክልተ ተጠርጠርቲ ኣሲሩ።",
+    "as": "আৰক্ষীয়ে চহৰৰ মাজমজিয়াত থকা সোণৰ দোকানত ডকাইতিৰ পিছত দুজনক গ্ৰেপ্তাৰ কৰে।",
+}
+
+
+class TestLanguageTable(unittest.TestCase):
+    def test_names_match_iso_639(self):
+        self.assertEqual(language_name("EN"), "English")
+        self.assertEqual(language_name("pl"), "Polish")
+        self.assertIsNone(language_name("xx"))
+        with self.assertRaises(TypeError):
+            LANGUAGE_NAMES["xx"] = "Unknown"
+
+
+class TestLanguageDetection(unittest.TestCase):
+    def test_detect_languages_in_batch(self):
+        self.assertEqual(detect_languages(list(TEXTS.values())), list(TEXTS))
+
+    def test_short_text_is_not_classified(self):
+        self.assertIsNone(detect_language("Brexit"))
+        self.assertIsNone(detect_language("12345"))
+
+    def test_neighbouring_languages_are_told_apart(self):
+        for (language, neighbour), text in NEIGHBOURS.items():
+            self.assertIn(detect_language(text), (language, None), language)
+
+    def test_unknown_languages_are_rejected(self):
+        self.assertEqual(detect_languages(list(UNKNOWN.values())), [None] * len(UNKNOWN))
+
+    @patch("summedia.api.APIRequester.request_api", return_value="Translated")
+    def test_translate_text_translates_neighbouring_language(self, mock_request_api):
+        text = Text(api_key="dummy_api_key")
+
+        for (language, neighbour), source in NEIGHBOURS.items():
+            self.assertEqual(
+                text.translate_text(source, language_to_translate=neighbour), "Translated"
+            )
+        self.assertEqual(mock_request_api.call_count, len(NEIGHBOURS))
+
+        mock_request_api.reset_mock()
+        text.translate_text(UNKNOWN["mr"], language_to_translate="hi")
+        mock_request_api.assert_called_once()
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_translate_text_skips_text_in_target_language(self, mock_request_api):
+        text = Text(api_key="dummy_api_key")
+
+        self.assertEqual(text.translate_text(TEXTS["en"], language_to_translate="en"), TEXTS["en"])
+        mock_request_api.assert_not_called()
+
+    @patch("summedia.api.APIRequester.request_api", return_value='{"1": "Translated"}')
+    def test_translate_texts_sends_only_other_languages(self, mock_request_api):
+        text = Text(api_key="dummy_api_key")
+
+        translations = text.translate_texts([TEXTS["en"], TEXTS["de"]], language_to_translate="en")
+
+        self.assertEqual(translations, [TEXTS["en"], "Translated"])
+        self.assertNotIn(TEXTS["en"], mock_request_api.call_args.args[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import responses
+
+from summedia.fetching_data import (
+    get_authors,
+    get_meta_description,
+    get_meta_keywords,
+    get_metadata,
+    get_publishing_date,
+    get_title,
+)
+from summedia.metadata import HeadParser, extract_metadata
+
+MOCK_URL = "https://example.com/article"
+
+HEAD = """
+<html>
+    <head>
+        <title>Plain title &amp; more</title>
+        <meta name="description" content="Meta description">
+        <meta name="keywords" content="news, tech">
+        <meta property="og:title" content="OpenGraph title">
+        <meta property="article:published_time" content="2024-03-01T10:00:00+01:00">
+        <script type="application/ld+json">
+            {"@context": "https://schema.org", "@graph": [
+                {"@type": "WebPage", "name": "Page"},
+                {"@type": "NewsArticle", "headline": "JSON-LD headline",
+                 "author": [{"@type": "Person", "name": "Jane Doe"}, {"name": "John Roe"}],
+                 "keywords": ["politics", "europe"]}
+            ]}
+        </script>
+    </head>
+"""
+
+BODY = "<body>" + "<p>Body text that is never read.</p>" * 20000 + "</body></html>"
+
+
+@responses.activate
+def test_get_metadata_reads_only_the_head():
+    responses.add(responses.GET, MOCK_URL, body=HEAD + BODY, content_type="text/html")
+
+    with patch("summedia.fetching_data.get_article") as mock_get_article:
+        metadata = get_metadata(MOCK_URL)
+
+    mock_get_article.assert_not_called()
+    assert metadata == {
+        "title": "JSON-LD headline",
+        "authors": ["Jane Doe", "John Roe"],
+        "publish_date": datetime(2024, 3, 1, 10, tzinfo=timezone(timedelta(hours=1))),
+        "description": "Meta description",
+        "keywords": "politics, europe",
+    }
+
+
+@responses.activate
+def test_get_metadata_falls_back_to_full_parse():
+    html = "<html><head><title>Only a title</title></head>" + BODY
+    responses.add(responses.GET, MOCK_URL, body=html, content_type="text/html")
+
+    with patch("summedia.fetching_data.get_article") as mock_get_article:
+        article = mock_get_article.return_value
+        article.html = html
+        article.title = "Parsed title"
+        article.authors = ["Parsed Author"]
+        article.publish_date = datetime(2024, 1, 1)
+        metadata = get_metadata(MOCK_URL)
+
+    assert metadata["title"] == "Only a title"
+    assert metadata["authors"] == ["Parsed Author"]
+    assert metadata["publish_date"] == datetime(2024, 1, 1)
+    assert get_metadata(MOCK_URL, fallback=False)["authors"] == []
+
+
+@responses.activate
+def test_meta_getters_use_the_head():
+    responses.add(responses.GET, MOCK_URL, body=HEAD + BODY, content_type="text/html")
+
+    assert get_meta_description(MOCK_URL) == "Meta description"
+    assert get_meta_keywords(MOCK_URL) == "news, tech"
+
+
+@responses.activate
+def test_title_authors_and_date_getters_use_the_head():
+    responses.add(responses.GET, MOCK_URL, body=HEAD + BODY, content_type="text/html")
+
+    with patch("summedia.fetching_data.get_article") as mock_get_article:
+        assert get_title(MOCK_URL) == "JSON-LD headline"
+        assert get_authors(MOCK_URL) == ["Jane Doe", "John Roe"]
+        assert get_publishing_date(MOCK_URL).year == 2024
+
+    mock_get_article.assert_not_called()
+
+
+def test_extract_metadata_accepts_non_string_json_ld_values():
+    head = HeadParser()
+    head.feed(
+        '<script type="application/ld+json">{"@type": "NewsArticle",'
+        ' "headline": ["First headline", "Second"],'
+        ' "description": {"@value": "Described", "@language": "en"},'
+        ' "datePublished": {"@value": "2024-03-01", "@type": "Date"},'
+        ' "keywords": {"@list": ["a"]}}</script>'
+    )
+
+    metadata = extract_metadata(head)
+
+    assert metadata["title"] == "First headline"
+    assert metadata["description"] == "Described"
+    assert metadata["publish_date"] == datetime(2024, 3, 1)
+    assert metadata["keywords"] is None
+
+    head.json_ld = [{"@type": "NewsArticle", "datePublished": [20240301], "headline": 7}]
+    metadata = extract_metadata(head)
+    assert metadata["publish_date"] is None
+    assert metadata["title"] is None
@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from summedia.output import BULLET, Completion, OutputBudget, output_budget, token_cap
+from summedia.social_media import SocialMedia
+from summedia.text import Text
+
+LONG_SUMMARY = "One two three four five. Six seven eight nine ten. Eleven twelve thirteen."
+
+
+class TestOutputBudget(unittest.TestCase):
+    def test_token_cap_follows_word_length(self):
+        budget = output_budget("summarize", 50)
+
+        self.assertEqual(budget.max_tokens, token_cap(50))
+        self.assertGreater(token_cap(100), token_cap(50))
+        self.assertEqual(budget.parameters(), {"max_tokens": token_cap(50), "temperature": 0.3})
+        self.assertEqual(output_budget("tweet", 30).parameters()["stop"], ["\n\n"])
+
+    def test_trim_keeps_whole_sentences(self):
+        budget = OutputBudget("summarize", max_words=11)
+
+        self.assertFalse(budget.complies(LONG_SUMMARY))
+        self.assertEqual(
+            budget.trim(LONG_SUMMARY), "One two three four five. Six seven eight nine ten."
+        )
+
+    def test_trim_keeps_whole_bullets(self):
+        budget = OutputBudget("bullet_list", max_words=8, boundary=BULLET)
+        text = "- First point here\n- Second point here\n- Third point here"
+
+        self.assertEqual(budget.trim(text), "- First point here\n- Second point here")
+
+    def test_truncated_output_does_not_comply(self):
+        budget = output_budget("bullet_list")
+        text = "- First point here\n- Second point here\n- Third po"
+
+        self.assertTrue(budget.complies(text))
+        self.assertFalse(budget.complies(Completion(text, "length")))
+        self.assertEqual(
+            budget.trim(Completion(text, "length")), "- First point here\n- Second point here"
+        )
+
+    def test_trim_drops_unfinished_sentence_of_truncated_output(self):
+        budget = OutputBudget("summarize", max_words=10)
+        text = Completion("One two three four five six. Seven eight", "length")
+
+        self.assertTrue(budget.complies(str(text)))
+        self.assertFalse(budget.complies(text))
+        self.assertEqual(budget.trim(text), "One two three four five six.")
+
+    def test_trim_gives_up_when_too_little_is_left(self):
+        budget = OutputBudget("summarize", max_words=10)
+        text = "One very long sentence without any end that keeps going on and on"
+
+        self.assertIsNone(budget.trim(text))
+        self.assertEqual(budget.trim(text, force=True), " ".join(text.split()[:10]))
+
+    def test_empty_output_complies(self):
+        budget = OutputBudget("summarize", max_words=10)
+
+        self.assertTrue(budget.complies(None))
+        self.assertTrue(budget.complies(""))
+        self.assertIsNone(budget.trim(None, force=True))
+
+
+class TestBoundedRequests(unittest.TestCase):
+    @patch("summedia.api.OpenAI")
+    def test_parameters_reach_the_api(self, mock_openai):
+        response = MagicMock()
+        response.choices[0].message.content = "Short summary."
+        mock_openai.return_value.chat.completions.create.return_value = response
+
+        Text(api_key="dummy_api_key").summarize_text("Long text", max_number_words=50)
+
+        kwargs = mock_openai.return_value.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["max_tokens"], token_cap(50))
+        self.assertEqual(kwargs["temperature"], 0.3)
+
+    @patch("summedia.api.APIRequester.request_api", return_value=LONG_SUMMARY)
+    def test_long_output_is_trimmed_without_new_request(self, mock_request_api):
+        text = Text(api_key="dummy_api_key")
+
+        summary = text.summarize_text("Long text", max_number_words=11)
+
+        self.assertEqual(summary, "One two three four five. Six seven eight nine ten.")
+        mock_request_api.assert_called_once()
+        self.assertEqual(text.output_stats.compliance_rate("summarize"), 0.0)
+
+    @patch("summedia.api.OpenAI")
+    def test_truncated_tags_are_cut_to_whole_items(self, mock_openai):
+        response = MagicMock()
+        response.choices[0].message.content = "Tags:\n1. Politics\n2. Europe\n3. Elec"
+        response.choices[0].finish_reason = "length"
+        mock_openai.return_value.chat.completions.create.return_value = response
+        text = Text(api_key="dummy_api_key")
+
+        tags = text.tag_and_categorize_text("Long text")
+
+        self.assertEqual(tags, "Tags:\n1. Politics\n2. Europe")
+        self.assertEqual(text.output_stats.compliance_rate("tag_and_categorize"), 0.0)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_output_without_boundary_is_requested_again(self, mock_request_api):
+        mock_request_api.side_effect = [" ".join(["word"] * 40), "A short tweet."]
+        social_media = SocialMedia(api_key="dummy_api_key")
+
+        tweet = social_media.condense_text_to_tweet("Long text", word_length=10)
+
+        self.assertEqual(tweet, "A short tweet.")
+        self.assertEqual(mock_request_api.call_count, 2)
+        self.assertIn("at most 10 words", mock_request_api.call_args.args[1])
+
+    @patch("summedia.api.OpenAI")
+    def test_filtered_output_is_returned_as_none(self, mock_openai):
+        response = MagicMock()
+        response.choices[0].message.content = None
+        response.choices[0].finish_reason = "content_filter"
+        mock_openai.return_value.chat.completions.create.return_value = response
+
+        self.assertIsNone(Text(api_key="dummy_api_key").summarize_text("Long text", 50))
+        social_media = SocialMedia(api_key="dummy_api_key")
+        self.assertIsNone(social_media.condense_text_to_tweet("Long text", word_length=10))
+        self.assertIsNone(social_media.post_to_facebook("Long text"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from summedia.packing import pack_items, parse_packed_response, run_packed, run_packed_async
+from summedia.text import Text
+
+
+class TestPacking(unittest.TestCase):
+    def test_pack_items_respects_budget(self):
+        texts = ["x" * 40, "x" * 40, "x" * 40, "x" * 400]
+        self.assertEqual(pack_items(texts, range(4), token_budget=30), [[0, 1], [2], [3]])
+
+    def test_parse_packed_response(self):
+        response = (
+            'Here you go:\n```json\n{"1": "Hello", "2": "", "3": {"tags": ["a"]}, "9": "x"}\n```'
+        )
+        self.assertEqual(parse_packed_response(response, 3), {0: "Hello", 2: '{"tags": ["a"]}'})
+        self.assertEqual(parse_packed_response("not json", 3), {})
+        self.assertEqual(parse_packed_response('{"1": "unterminated', 3), {})
+
+    def test_missing_items_are_retried(self):
+        sent = []
+
+        def send(batch):
+            sent.append(list(batch))
+            # The first response drops the second item.
+            if len(sent) == 1:
+                return json.dumps({"1": batch[0].upper(), "3": batch[2].upper()})
+            return json.dumps({str(i): text.upper() for i, text in enumerate(batch, 1)})
+
+        self.assertEqual(run_packed(["a", "b", "c"], send), ["A", "B", "C"])
+        self.assertEqual(sent, [["a", "b", "c"], ["b"]])
+
+    def test_fallback_after_retries(self):
+        results = run_packed(["a", "b"], lambda batch: "garbage", max_retries=1, fallback=str.upper)
+        self.assertEqual(results, ["A", "B"])
+
+    def test_async_batches_are_sent_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def send(batch):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps({"1": batch[0].upper()})
+
+        async def fallback(text):
+            return text
+
+        texts = ["x" * 40, "y" * 40, "z" * 40]
+        results = asyncio.run(run_packed_async(texts, send, token_budget=20, fallback=fallback))
+
+        self.assertEqual(results, [text.upper() for text in texts])
+        self.assertEqual(peak, 3)
+
+
+class TestTextPacking(unittest.TestCase):
+    def setUp(self):
+        self.text = Text(api_key="dummy_api_key")
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_translate_texts_uses_one_request(self, mock_request_api):
+        mock_request_api.return_value = '{"1": "Hello", "2": "Good morning", "3": "Thanks"}'
+
+        result = self.text.translate_texts(["Hola", "Buenos días", "Gracias"])
+
+        self.assertEqual(result, ["Hello", "Good morning", "Thanks"])
+        self.assertEqual(mock_request_api.call_count, 1)
+        content_user = mock_request_api.call_args.args[1]
+        self.assertIn("[2] Buenos días", content_user)
+        self.assertIn("English", content_user)
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_analyze_sentiments_falls_back_to_single_requests(self, mock_request_api):
+        mock_request_api.side_effect = ['{"1": "Positive"}', "{}", "Negative"]
+
+        result = self.text.analyze_sentiments(["Great!", "Awful."])
+
+        self.assertEqual(result, ["Positive", "Negative"])
+        self.assertEqual(mock_request_api.call_count, 3)
+
+    def test_translate_texts_invalid_language(self):
+        result = self.text.translate_texts(["Hola"], language_to_translate="xx")
+        self.assertEqual(result, ["Error in processing the request."])
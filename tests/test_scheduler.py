@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from summedia.api import APIRequester
+from summedia.compaction import TextCompactor
+from summedia.hedging import HedgingPolicy
+from summedia.scheduler import DeadlineExceeded, Priority, RequestScheduler, scheduling
+from summedia.social_media import SocialMedia
+from summedia.text import Text
+
+
+class TestRequestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.order = []
+        self.threads = []
+
+    def tearDown(self):
+        self.release.set()
+        for thread in self.threads:
+            thread.join(5)
+
+    def occupy(self, scheduler):
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            self.release.wait(5)
+
+        self.start(scheduler, blocking, queued=False)
+        started.wait(5)
+
+    def start(
+        self, scheduler, function, priority=Priority.INTERACTIVE, tenant="default", queued=True
+    ):
+        depth = self.queue_depth(scheduler)
+
+        def target():
+            with scheduling(priority=priority, tenant=tenant):
+                scheduler.run(function)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        self.threads.append(thread)
+        # Wait until the request is queued so that the arrival order is deterministic.
+        deadline = time.monotonic() + 5
+        while queued and self.queue_depth(scheduler) == depth and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    @staticmethod
+    def queue_depth(scheduler):
+        depths = scheduler.metrics()["queue_depth"].values()
+        return sum(sum(tenants.values()) for tenants in depths)
+
+    def test_interactive_requests_go_first(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        self.occupy(scheduler)
+        self.start(scheduler, lambda: self.order.append("batch"), Priority.BATCH)
+        self.start(scheduler, lambda: self.order.append("interactive"))
+
+        self.assertEqual(scheduler.metrics()["queue_depth"]["batch"], {"default": 1})
+        self.release.set()
+        for thread in self.threads:
+            thread.join(5)
+        self.assertEqual(self.order, ["interactive", "batch"])
+
+    def test_tenants_share_by_weight(self):
+        scheduler = RequestScheduler(max_concurrency=1, tenant_weights={"a": 2, "b": 1})
+        self.occupy(scheduler)
+        for tenant in ["a"] * 6 + ["b"] * 6:
+            self.start(scheduler, lambda tenant=tenant: self.order.append(tenant), tenant=tenant)
+
+        self.release.set()
+        for thread in self.threads:
+            thread.join(5)
+        self.assertEqual(self.order[:6].count("a"), 4)
+
+    def test_request_past_deadline_is_dropped(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        self.occupy(scheduler)
+
+        with scheduling(timeout=0.01):
+            with self.assertRaises(DeadlineExceeded):
+                scheduler.run(lambda: "too late")
+        with scheduling(timeout=0.01, degrade=lambda: "degraded"):
+            self.assertEqual(scheduler.run(lambda: "too late"), "degraded")
+
+        metrics = scheduler.metrics()
+        self.assertEqual((metrics["dropped"], metrics["degraded"]), (2, 1))
+
+    @patch("summedia.api.APIRequester._send", return_value="Mocked response")
+    def test_request_api_goes_through_scheduler(self, mock_send):
+        scheduler = RequestScheduler()
+        requester = APIRequester(api_key="dummy_api_key", scheduler=scheduler)
+
+        with scheduling(priority=Priority.BATCH, tenant="backfill"):
+            self.assertEqual(requester.request_api("system", "user"), "Mocked response")
+        self.assertEqual(scheduler.metrics()["completed"], 1)
+        self.assertEqual(scheduler.wait_times[Priority.BATCH].samples, 1)
+
+    def test_positional_parameters_match_api_requester(self):
+        hedging, scheduler, compactor = HedgingPolicy(), RequestScheduler(), TextCompactor()
+
+        for cls in (APIRequester, Text, SocialMedia):
+            requester = cls("dummy_api_key", hedging, scheduler, compactor)
+            self.assertIs(requester.hedging, hedging, cls)
+            self.assertIs(requester.scheduler, scheduler, cls)
+            self.assertIs(requester.compactor, compactor, cls)
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from summedia.sentiment import SentimentResult, parse_sentiment_result, score_sentiments
+from summedia.text import AsyncText, Text
+
+
+class TestScoreSentiments(unittest.TestCase):
+    def test_polarity(self):
+        positive, negative, neutral = score_sentiments(
+            ["I love this!", "What an awful, terrible day.", "The council meets on Tuesday."]
+        )
+
+        self.assertEqual((positive.label, positive.source), ("positive", "local"))
+        self.assertEqual(negative.label, "negative")
+        self.assertEqual((neutral.label, neutral.score, neutral.confidence), ("neutral", 0, 0))
+
+    def test_negation_and_intensifiers(self):
+        good, not_good, very_good = score_sentiments(["good", "not good", "very good"])
+
+        self.assertEqual(not_good.label, "negative")
+        self.assertLess(abs(not_good.score), good.score)
+        self.assertGreater(very_good.score, good.score)
+
+    def test_typographic_apostrophes(self):
+        results = score_sentiments(["I don’t love it", "It isn’t great", "I don't love it"])
+
+        self.assertEqual([result.label for result in results], ["negative"] * 3)
+        self.assertEqual(results[0], results[2])
+
+    def test_dampener_is_not_a_negation(self):
+        good, barely_good = score_sentiments(["good", "barely good"])
+
+        self.assertEqual(barely_good.label, "positive")
+        self.assertLess(barely_good.score, good.score)
+
+    def test_negation_does_not_cross_texts(self):
+        self.assertEqual(score_sentiments(["not", "good"])[1], score_sentiments(["good"])[0])
+
+    def test_contrast_lowers_confidence(self):
+        mixed, plain = score_sentiments(["The food was good but the service was awful", "awful"])
+
+        self.assertEqual(mixed.label, "negative")
+        self.assertLess(mixed.confidence, abs(mixed.score))
+        self.assertEqual(plain.confidence, abs(plain.score))
+
+    def test_parse_sentiment_result(self):
+        self.assertEqual(
+            parse_sentiment_result('{"label": "Negative", "score": -2, "confidence": 0.9}'),
+            SentimentResult("negative", -1.0, 0.9, "api"),
+        )
+        self.assertIsNone(parse_sentiment_result('{"label": "angry", "score": -1}'))
+        self.assertIsNone(parse_sentiment_result("negative"))
+        self.assertIsNone(parse_sentiment_result(None))
+
+
+class TestSentimentCascade(unittest.TestCase):
+    def setUp(self):
+        self.text = Text(api_key="dummy_api_key")
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_only_uncertain_texts_go_to_api(self, mock_request_api):
+        mock_request_api.return_value = (
+            '{"1": {"label": "negative", "score": -0.4, "confidence": 0.8}}'
+        )
+
+        results = self.text.analyze_sentiment_cascade(
+            ["Absolutely wonderful, I love it!", "Well, that went as expected."]
+        )
+
+        self.assertEqual(results[0].source, "local")
+        self.assertEqual(results[1], SentimentResult("negative", -0.4, 0.8, "api"))
+        self.assertEqual(mock_request_api.call_count, 1)
+        self.assertNotIn("wonderful", mock_request_api.call_args.args[1])
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_local_result_kept_when_api_fails(self, mock_request_api):
+        mock_request_api.side_effect = RuntimeError("boom")
+
+        results = self.text.analyze_sentiment_cascade(["Well, that went as expected."])
+
+        self.assertEqual(results[0].source, "local")
+
+    def test_async_cascade_matches_sync(self):
+        response = '{"1": {"label": "negative", "score": -0.4, "confidence": 0.8}}'
+        texts = ["Absolutely wonderful, I love it!", "Well, that went as expected."]
+
+        with patch("summedia.api.APIRequester.request_api", return_value=response):
+            sync_results = self.text.analyze_sentiment_cascade(texts)
+        with patch(
+            "summedia.api.AsyncAPIRequester.request_api", new=AsyncMock(return_value=response)
+        ):
+            async_text = AsyncText(api_key="dummy_api_key")
+            async_results = asyncio.run(async_text.analyze_sentiment_cascade(texts))
+
+        self.assertEqual(async_results, sync_results)
+        self.assertEqual(async_results[1].source, "api")
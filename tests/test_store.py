@@ -0,0 +1,128 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+ds = pytest.importorskip("pyarrow.dataset")
+
+from summedia.store import ArticleStore, record_from_article  # noqa: E402
+
+
+def record(number, domain="example.com", day=1):
+    return {
+        "url": f"https://{domain}/article{number}",
+        "title": f"Title {number}",
+        "authors": ["Jane Doe"],
+        "publish_date": datetime(2024, 1, day, tzinfo=timezone.utc),
+        "text": f"Text of article {number}",
+        "analysis": {"summary": f"Summary {number}"},
+    }
+
+
+class TestArticleStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_point_lookup(self):
+        with ArticleStore(self.root) as store:
+            for number in range(5):
+                store.append(record(number))
+            self.assertEqual(store.get("https://example.com/article3")["title"], "Title 3")
+
+        stored = ArticleStore(self.root).get("https://example.com/article3")
+        self.assertEqual(stored["title"], "Title 3")
+        self.assertEqual(stored["authors"], ["Jane Doe"])
+        self.assertEqual(stored["analysis"], {"summary": "Summary 3"})
+        self.assertIsNone(ArticleStore(self.root).get("https://example.com/missing"))
+
+    def test_point_lookup_across_row_groups(self):
+        with ArticleStore(self.root) as store:
+            for number in range(2500):
+                store.append(record(number))
+
+        stored = ArticleStore(self.root).get("https://example.com/article2100")
+        self.assertEqual(stored["title"], "Title 2100")
+
+    def test_buffered_record_matches_written_record(self):
+        store = ArticleStore(self.root)
+        store.append(dict(record(1), publish_date="2024-01-01T00:00:00"))
+        buffered = store.get("https://example.com/article1")
+        store.flush()
+
+        self.assertIn("url_hash", buffered)
+        self.assertIsNotNone(buffered["fetched_at"])
+        self.assertEqual(buffered, ArticleStore(self.root).get("https://example.com/article1"))
+
+    def test_newer_record_wins(self):
+        store = ArticleStore(self.root)
+        store.append(record(1))
+        store.flush()
+        updated = dict(record(1), title="Updated title")
+        store.append(updated)
+        store.flush()
+
+        self.assertEqual(ArticleStore(self.root).get(updated["url"])["title"], "Updated title")
+
+    def test_last_record_of_a_flush_wins_across_partitions(self):
+        store = ArticleStore(self.root)
+        store.append(record(1, day=2))
+        store.append(dict(record(1, day=1), title="Updated title"))
+        store.flush()
+
+        self.assertEqual(store.get("https://example.com/article1")["title"], "Updated title")
+
+    def test_reader_sees_records_of_other_writers(self):
+        reader = ArticleStore(self.root)
+        self.assertIsNone(reader.get("https://example.com/article1"))
+
+        with ArticleStore(self.root) as writer:
+            writer.append(record(1))
+
+        self.assertEqual(reader.get("https://example.com/article1")["title"], "Title 1")
+
+    def test_partitions_and_column_projection(self):
+        store = ArticleStore(self.root, batch_size=2)
+        store.append(record(1, "example.com", day=1))
+        store.append(record(2, "example.org", day=1))
+        store.append(record(3, "example.com", day=2))
+        store.flush()
+
+        table = store.read(columns=["title", "domain"])
+        self.assertEqual(table.column_names, ["title", "domain"])
+        self.assertEqual(table.num_rows, 3)
+
+        filtered = store.read(columns=["url"], filter=ds.field("domain") == "example.com")
+        self.assertEqual(
+            sorted(filtered["url"].to_pylist()),
+            ["https://example.com/article1", "https://example.com/article3"],
+        )
+        batches = list(store.scan(columns=["title"], filter=ds.field("date") == "2024-01-02"))
+        self.assertEqual(sum(batch.num_rows for batch in batches), 1)
+
+    def test_record_from_article(self):
+        article = MagicMock(
+            url="https://example.com/a",
+            html='<img src="https://example.com/1.jpg"><img src="/2.jpg">',
+            title="Title",
+            authors=["Jane Doe"],
+            publish_date=None,
+            text="Text",
+            meta_description="",
+            meta_keywords=["news", "tech"],
+        )
+
+        result = record_from_article(article, {"sentiment": "positive"})
+        self.assertEqual(result["images"], ["https://example.com/1.jpg"])
+        self.assertEqual(result["meta_keywords"], "news, tech")
+        self.assertIsNone(result["meta_description"])
+
+        store = ArticleStore(self.root)
+        store.append(result)
+        store.flush()
+        self.assertEqual(store.get("https://example.com/a")["analysis"], {"sentiment": "positive"})
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from summedia.level import SimplificationLevel
+from summedia.text import Text
+from summedia.text_stats import reading_time, simplification_levels, text_statistics
+
+SIMPLE = "The cat sat on the mat. It was happy!"
+COMPLEX = (
+    "Photosynthesis is the biochemical mechanism whereby chlorophyll-containing "
+    "organisms synthesize carbohydrates utilizing electromagnetic radiation."
+)
+
+
+class TestTextStatistics(unittest.TestCase):
+    def test_counts(self):
+        stats = text_statistics([SIMPLE, "", "Time. Table, little apple?  3.5 items"])
+
+        self.assertEqual(stats.words.tolist(), [9, 0, 6])
+        self.assertEqual(stats.sentences.tolist(), [2, 0, 3])
+        self.assertEqual(stats.syllables.tolist(), [10, 0, 10])
+
+    def test_word_count_matches_split(self):
+        texts = ["  spaced\tout\nwords  ", "one", "Don't stop, it's 1500s."]
+        stats = text_statistics(texts)
+        self.assertEqual(stats.words.tolist(), [len(text.split()) for text in texts])
+
+    def test_empty_batch(self):
+        self.assertEqual(len(text_statistics([]).words), 0)
+
+    def test_readability_orders_texts(self):
+        stats = text_statistics([SIMPLE, COMPLEX])
+        self.assertGreater(stats.flesch_reading_ease[0], stats.flesch_reading_ease[1])
+        self.assertLess(stats.flesch_kincaid_grade[0], stats.flesch_kincaid_grade[1])
+
+    def test_simplification_levels(self):
+        self.assertEqual(
+            simplification_levels([SIMPLE, COMPLEX]),
+            [SimplificationLevel.CHILD, SimplificationLevel.EXPERT],
+        )
+
+    def test_reading_time(self):
+        self.assertEqual(reading_time("word " * 600, words_per_minute=200), 3)
+
+
+class TestAdjustTextComplexitySkip(unittest.TestCase):
+    def setUp(self):
+        self.text = Text(api_key="dummy_api_key")
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_skips_api_when_text_is_at_level(self, mock_request_api):
+        result = self.text.adjust_text_complexity(
+            SIMPLE, level=SimplificationLevel.CHILD, skip_at_level=True
+        )
+
+        self.assertEqual(result, SIMPLE)
+        mock_request_api.assert_not_called()
+
+    @patch("summedia.api.APIRequester.request_api")
+    def test_calls_api_when_text_is_above_level(self, mock_request_api):
+        mock_request_api.return_value = "Simplified text"
+        result = self.text.adjust_text_complexity(
+            COMPLEX, level=SimplificationLevel.CHILD, skip_at_level=True
+        )
+
+        self.assertEqual(result, "Simplified text")
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from summedia.text import Text
+from summedia.work_queue import (
+    DEAD,
+    DONE,
+    PENDING,
+    SQLiteWorkQueue,
+    Stage,
+    Worker,
+    article_pipeline,
+)
+
+
+class TestSQLiteWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = SQLiteWorkQueue(
+            os.path.join(self.directory.name, "queue.db"), max_attempts=2, retry_delay=0
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_put_is_idempotent_per_task(self):
+        self.assertTrue(self.queue.put("fetch", "https://example.com", {"n": 1}))
+        self.assertFalse(self.queue.put("fetch", "https://example.com", {"n": 2}))
+
+        task = self.queue.lease(["fetch"], "worker", 60)
+        self.assertEqual(task.task_id, "fetch:https://example.com")
+        self.assertEqual(task.payload, {"n": 1})
+        self.assertIsNone(self.queue.lease(["fetch"], "worker", 60))
+
+    def test_expired_lease_is_taken_over_and_stale_ack_rejected(self):
+        self.queue.put("analyze", "a", {})
+        first = self.queue.lease(["analyze"], "worker-1", 0.01)
+        time.sleep(0.02)
+        second = self.queue.lease(["analyze"], "worker-2", 60)
+
+        self.assertEqual(second.attempts, 2)
+        self.assertFalse(self.queue.heartbeat(first, 60))
+        self.assertFalse(self.queue.ack(first, "stale"))
+        self.assertTrue(self.queue.ack(second, "fresh", [("publish", "a", {"x": 1})]))
+        self.assertEqual(self.queue.result("analyze:a"), "fresh")
+        self.assertEqual(self.queue.lease(["publish"], "worker-1", 60).payload, {"x": 1})
+
+    def test_failed_task_is_retried_then_dead_lettered(self):
+        self.queue.put("fetch", "a", {})
+        self.assertTrue(self.queue.nack(self.queue.lease(["fetch"], "w", 60), "timeout"))
+        self.assertTrue(self.queue.nack(self.queue.lease(["fetch"], "w", 60), "timeout"))
+
+        self.assertIsNone(self.queue.lease(["fetch"], "w", 60))
+        [(task, error)] = self.queue.dead_letters("fetch")
+        self.assertEqual((task.key, task.attempts, error), ("a", 2, "timeout"))
+        self.assertEqual(self.queue.counts()[DEAD], 1)
+
+
+class TestWorker(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue = SQLiteWorkQueue(os.path.join(self.directory.name, "queue.db"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @patch("summedia.api.APIRequester.request_api", return_value="Short summary")
+    @patch("summedia.work_queue.download_html")
+    def test_article_pipeline(self, mock_download, mock_request_api):
+        mock_download.return_value = (
+            "<html><head><title>Title</title></head><body><article>"
+            + "<p>A long enough paragraph of the article body text.</p>" * 5
+            + "</article></body></html>"
+        )
+        published = []
+        stages = article_pipeline(Text(api_key="fake_api_key"), published.append)
+        self.queue.put("fetch", "https://example.com/a", {"url": "https://example.com/a"})
+
+        workers = [Worker(self.queue, stages[:2]), Worker(self.queue, stages[2:])]
+        while any([worker.run_once() for worker in workers]):
+            pass
+
+        self.assertEqual(len(published), 1)
+        self.assertEqual(published[0]["summary"], "Short summary")
+        self.assertEqual(self.queue.counts()[DONE], 4)
+        mock_request_api.assert_called_once()
+
+    def test_result_that_cannot_be_stored_is_nacked(self):
+        self.queue.put("analyze", "a", {})
+        worker = Worker(self.queue, [Stage("analyze", lambda payload: object(), "publish")])
+
+        self.assertTrue(worker.run_once())
+
+        self.assertEqual(self.queue.counts()[PENDING], 1)
+        self.assertIsNone(self.queue.result("analyze:a"))
+        self.assertIsNone(self.queue.lease(["publish"], "worker", 60))
+
+        self.queue.max_attempts = 1
+        self.queue.put("analyze", "b", {})
+        self.assertTrue(worker.run_once())
+        [(task, error)] = self.queue.dead_letters("analyze")
+        self.assertEqual(task.key, "b")
+        self.assertTrue(error.startswith("TypeError"))
+
+    def test_heartbeat_keeps_long_task_leased(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow(payload):
+            started.set()
+            release.wait(5)
+            return "done"
+
+        self.queue.put("analyze", "a", {})
+        worker = Worker(self.queue, [Stage("analyze", slow)], visibility_timeout=0.06)
+        thread = threading.Thread(target=worker.run_once)
+        thread.start()
+        started.wait(5)
+        time.sleep(0.15)
+
+        self.assertIsNone(self.queue.lease(["analyze"], "other", 60))
+        release.set()
+        thread.join()
+        self.assertEqual(self.queue.result("analyze:a"), "done")
+
+
+if __name__ == "__main__":
+    unittest.main()